@@ -0,0 +1,232 @@
+"""
+Benchmarks for the transliteration functions
+
+Measures throughput (strings/s and MB/s of UTF-8 input), per call latency
+percentiles, first call time and peak memory of translit_dict,
+translit_hybrid, el_transliterate, translit_icu, translit_rules and prep_string, in both
+directions of the Lao ALALOC 2012 table.
+
+Corpora are generated with a fixed seed:
+
+    synthetic  random strings over the characters used in the table
+    words      phrases built from table entries, with some unknown words
+
+Other corpora can be given with --corpus, one record per line. Records in
+Lao script are used for the forward direction, others for reverse.
+
+ICU has no Lao transforms, so translit_icu is measured with transforms
+registered from the rules of the table, under the ID given in
+SUPPORTED_TRANSLITERATORS and its inverse. A case that fails, or cannot be
+set up, is recorded with an "error" instead of measurements.
+
+Usage:
+
+    python benchmarks/bench_transliteration.py --output results.json
+    python benchmarks/bench_transliteration.py --compare results.json
+"""
+
+import argparse, json, platform, random, statistics, sys, time, tracemalloc
+
+import el_utilities
+from el_utilities import (TRANSLIT_DATA, SUPPORTED_TRANSLITERATORS, translit_dict,
+    translit_hybrid, el_transliterate, translit_icu, translit_rules, prep_string,
+    is_available_transform, register_rules)
+import icu
+
+LANG = "lo"
+TABLE_ID = SUPPORTED_TRANSLITERATORS[LANG][0]
+ICU_TRANSFORMS = {"forward": "Lao-Latin/ALALOC", "reverse": "Latin-Lao/ALALOC"}
+DIRECTIONS = ("forward", "reverse")
+DEFAULT_SIZES = (100, 1000, 10000)
+
+def _is_lao(text):
+    return any("\u0e80" <= c <= "\u0eff" for c in text)
+
+def make_corpora(sizes, seed, corpus_files = ()):
+    """Build corpora for each direction.
+
+    Returns:
+        dict: {(direction, corpus name): list of strings}
+    """
+    rng = random.Random(seed)
+    corpora = {}
+    for dir in DIRECTIONS:
+        words = list(TRANSLIT_DATA[TABLE_ID]["translit_dict"][dir])
+        chars = sorted(set("".join(words)))
+        for size in sizes:
+            corpora[(dir, f"synthetic-{size}")] = [
+                "".join(rng.choice(chars) for _ in range(rng.randint(5, 60)))
+                for _ in range(size)]
+            corpora[(dir, f"words-{size}")] = [
+                " ".join(rng.choice(words) if rng.random() > 0.1 else "xyz" for _ in range(rng.randint(1, 8)))
+                for _ in range(size)]
+    for path in corpus_files:
+        with open(path, encoding="utf-8") as f:
+            lines = [line.rstrip("\n") for line in f if line.strip()]
+        name = f"file:{path}"
+        corpora[("forward", name)] = [line for line in lines if _is_lao(line)]
+        corpora[("reverse", name)] = [line for line in lines if not _is_lao(line)]
+    return {key: value for key, value in corpora.items() if value}
+
+def register_icu_transforms():
+    """Register the ICU transforms of ICU_TRANSFORMS from the table's rules, if not available.
+
+    Returns:
+        dict: {direction: error message} for transforms that could not be registered.
+    """
+    rules = TRANSLIT_DATA[TABLE_ID]["translit_rules"]
+    errors = {}
+    for dir, transform in ICU_TRANSFORMS.items():
+        if is_available_transform(transform):
+            continue
+        direction = icu.UTransDirection.REVERSE if dir == "reverse" else icu.UTransDirection.FORWARD
+        try:
+            register_rules(transform, rules, direction)
+        except icu.ICUError as e:
+            errors[dir] = f"cannot register {transform}: {e}"
+    return errors
+
+def make_cases(dir):
+    """Benchmarked functions for a direction.
+
+    Returns:
+        dict: {function name: Callable[[str], str]}
+    """
+    rules = TRANSLIT_DATA[TABLE_ID]["translit_rules"]
+    direction = icu.UTransDirection.REVERSE if dir == "reverse" else icu.UTransDirection.FORWARD
+    bicameral = SUPPORTED_TRANSLITERATORS[LANG][1]
+    transform = ICU_TRANSFORMS[dir]
+    return {
+        "translit_dict": lambda s: translit_dict(s, LANG, dir),
+        "translit_hybrid": lambda s: translit_hybrid(s, LANG, dir),
+        "el_transliterate": lambda s: el_transliterate(s, LANG, dir),
+        "translit_rules": lambda s: translit_rules(s, rules, direction),
+        "translit_icu": lambda s: translit_icu(s, transform),
+        "prep_string": lambda s: prep_string(s, dir, LANG, bicameral),
+    }
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    i = min(int(round(q / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[i]
+
+def run_case(call, corpus, repeat):
+    """Time a function over a corpus.
+
+    Returns:
+        dict: Measurements.
+    """
+    start = time.perf_counter()
+    call(corpus[0])
+    first_call = time.perf_counter() - start
+    nbytes = sum(len(s.encode("utf-8")) for s in corpus)
+    perf_counter = time.perf_counter
+    totals = []
+    latencies = []
+    for _ in range(repeat):
+        run_start = perf_counter()
+        for s in corpus:
+            t = perf_counter()
+            call(s)
+            latencies.append(perf_counter() - t)
+        totals.append(perf_counter() - run_start)
+    best = min(totals)
+    latencies.sort()
+    tracemalloc.start()
+    for s in corpus:
+        call(s)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "strings": len(corpus),
+        "bytes": nbytes,
+        "repeat": repeat,
+        "first_call_s": first_call,
+        "best_s": best,
+        "mean_s": statistics.mean(totals),
+        "strings_per_s": len(corpus) / best if best else 0.0,
+        "mb_per_s": nbytes / best / 1e6 if best else 0.0,
+        "latency_us": {f"p{q}": _percentile(latencies, q) * 1e6 for q in (50, 90, 99)},
+        "peak_memory_bytes": peak,
+    }
+
+def run(sizes = DEFAULT_SIZES, repeat = 3, seed = 0, corpus_files = (), functions = None):
+    """Run all benchmarks.
+
+    Returns:
+        dict: Machine readable results, with environment metadata.
+    """
+    corpora = make_corpora(sizes, seed, corpus_files)
+    icu_errors = register_icu_transforms()
+    results = []
+    for dir in DIRECTIONS:
+        for name, call in make_cases(dir).items():
+            if functions and name not in functions:
+                continue
+            for (corpus_dir, corpus_name), corpus in corpora.items():
+                if corpus_dir != dir:
+                    continue
+                result = {"function": name, "dir": dir, "corpus": corpus_name}
+                try:
+                    if name == "translit_icu" and dir in icu_errors:
+                        raise RuntimeError(icu_errors[dir])
+                    result.update(run_case(call, corpus, repeat))
+                except Exception as e:
+                    tracemalloc.stop()
+                    result["error"] = f"{type(e).__name__}: {e}"
+                    print(f"{name:17} {dir:8} {corpus_name:18} failed: {result['error']}", file=sys.stderr)
+                else:
+                    print(f"{name:17} {dir:8} {corpus_name:18} {result['strings_per_s']:12.0f} strings/s "
+                          f"{result['mb_per_s']:8.3f} MB/s p99 {result['latency_us']['p99']:9.1f} us", file=sys.stderr)
+                results.append(result)
+    return {
+        "meta": {
+            "el_utilities": el_utilities.__version__,
+            "python": platform.python_version(),
+            "icu": icu.ICU_VERSION,
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "sizes": list(sizes),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+def compare(baseline, current):
+    """Print throughput of current results relative to a baseline."""
+    key = lambda r: (r["function"], r["dir"], r["corpus"])
+    previous = {key(r): r for r in baseline["results"]}
+    print(f"{'function':17} {'dir':8} {'corpus':18} {'ratio':>7}")
+    for result in current["results"]:
+        old = previous.get(key(result))
+        if "error" in result:
+            print(f"{result['function']:17} {result['dir']:8} {result['corpus']:18} {'failed':>7}")
+        elif old and old.get("strings_per_s"):
+            ratio = result["strings_per_s"] / old["strings_per_s"]
+            print(f"{result['function']:17} {result['dir']:8} {result['corpus']:18} {ratio:7.2f}")
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description="Benchmark el_utilities transliteration functions.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="number of strings per generated corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per corpus, the best is reported")
+    parser.add_argument("--seed", type=int, default=0, help="seed for generated corpora")
+    parser.add_argument("--corpus", action="append", default=[], help="additional corpus file, one record per line")
+    parser.add_argument("--function", action="append", help="only run the given function(s)")
+    parser.add_argument("--output", help="write JSON results to file")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with")
+    args = parser.parse_args(argv)
+    results = run(args.sizes, args.repeat, args.seed, args.corpus, args.function)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    else:
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), results)
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,98 @@
 """
 el_utilities
 
-
+Submodules are imported on first access to one of their names (PEP 562), so
+importing the package does not load icu, regex or el_internationalisation
+until a transliteration function is used.
 """
 
 __version__ = "0.1.1"
 __author__ = 'Andrew Cunningham'
 __credits__ = 'Enabling Languages'
 
-from .transliteration_data import *
-from .transliteration import *
-from .snippets import *
+import importlib
+
+# Public names, by submodule. Submodules are listed in the order the package
+# used to star-import them; later modules take precedence.
+_EXPORTS = {
+    "transliteration_data": (
+        "SUPPORTED_TRANSLITERATORS", "TRANSLIT_DATA", "LazyTranslitData",
+    ),
+    "transliteration": (
+        "DEFAULT_NF", "SUPPORTED_NF", "select_nf", "toNFM21", "toNFM", "prep_string",
+        "LongestMatchReplacer", "TranslitTable", "get_translit_table",
+        "prebuild_translit_tables", "clear_translit_tables", "register_table", "el_transliterate",
+        "ICU_CACHE_SIZE", "available_transforms", "is_available_transform",
+        "get_icu_transformer", "set_transform_cache_size", "clear_transform_cache",
+        "add_transform_resolver", "remove_transform_resolver",
+        "translit_icu", "clean_ldml_rules", "read_ldml_rules", "register_rules", "register_ldml",
+        "RULES_CACHE_SIZE", "get_rules_transformer", "warm_rules_cache",
+        "set_rules_cache_size", "clear_rules_cache", "translit_rules",
+        "set_ldml_file_path", "LanguageTag", "get_lang_subtag", "get_lang_subtags",
+        "translit_dict", "translit_hybrid",
+        "translit_dict_batch", "TRANSLIT_ENGINES", "get_transliterator",
+        "RESULT_CACHE_SIZE", "enable_result_cache", "disable_result_cache",
+        "get_result_cache",
+    ),
+    "caching": (
+        "LRUCache", "PerThreadCache", "ResultCache",
+    ),
+    "streaming": (
+        "iter_chunks", "translit_stream", "translit_file",
+    ),
+    "parallel": (
+        "iter_translit_parallel", "translit_parallel",
+    ),
+    "instrumentation": (
+        "collect_stats", "get_stats", "reset_stats",
+    ),
+    "ldml": (
+        "LDMLTransform", "iter_ldml_transforms", "register_ldml_transforms",
+        "LDMLFileReport", "transform_references", "register_ldml_files", "LDMLRegistry",
+    ),
+    "aio": (
+        "set_executor", "translit_dict_async", "translit_icu_async",
+        "translit_rules_async", "translit_aiter",
+    ),
+    "snippets": (
+        "list_to_string", "string_to_list", "iter_list_to_string", "list_to_stream",
+        "iter_string_to_list", "print_list", "pl",
+        "search_dict_values", "SubstringIndex", "search_dict_keys",
+    ),
+}
+
+_ATTR_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+# Modules the package used to expose incidentally, through the star import of
+# transliteration, and the modules they name.
+_LEGACY_MODULES = {
+    "regex": "regex",
+    "icu": "icu",
+    "eli": "el_internationalisation",
+    "collections": "collections",
+    "copy": "copy",
+    "pathlib": "pathlib",
+    "sys": "sys",
+}
+
+# Submodules available as attributes without importing them first. sharedcache
+# needs fcntl, so its names are not exported and star imports work on Windows.
+_SUBMODULES = tuple(_EXPORTS) + ("sharedcache", "tablefile")
+
+__all__ = list(_ATTR_MODULES)
+
+def __getattr__(name):
+    module = _ATTR_MODULES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+    elif name in _LEGACY_MODULES:
+        value = importlib.import_module(_LEGACY_MODULES[name])
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-del(transliteration_data)
-del(transliteration)
-del(snippets)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
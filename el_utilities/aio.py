@@ -0,0 +1,107 @@
+"""
+Asyncio counterparts of the transliteration functions
+
+CPU bound work runs on an executor, so long transliterations do not block the
+event loop. The executor defaults to the event loop's default executor and can
+be set with set_executor(). ICU transliterators are cached per thread, and
+functions from get_transliterator() create one per thread calling them, so
+thread pool executors never share a transliterator between threads.
+"""
+
+import asyncio, collections, functools
+from .transliteration import DEFAULT_NF, translit_dict, translit_icu, translit_rules
+import icu
+
+DEFAULT_CONCURRENCY = 8
+
+_executor = None
+
+def set_executor(executor):
+    """Set executor used by the async transliteration functions.
+
+    Args:
+        executor (concurrent.futures.Executor | None): Executor, or None for the event loop's default executor.
+    """
+    global _executor
+    _executor = executor
+
+def _run(executor, func, *args):
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(executor or _executor, functools.partial(func, *args))
+
+async def translit_dict_async(source, lang, dir = "forward", nf = DEFAULT_NF, executor = None):
+    """Async translit_dict(), run on an executor.
+
+    Args:
+        source (str): String to transliterate.
+        lang (str): BCP-47 language tag or locale label.
+        dir (str, optional): Direction, "forward" or "reverse". Defaults to "forward".
+        nf (str, optional): Normalisation form. Defaults to DEFAULT_NF.
+        executor (concurrent.futures.Executor, optional): Executor to use. Defaults to the executor set by set_executor().
+
+    Returns:
+        str: Transliterated string.
+    """
+    return await _run(executor, translit_dict, source, lang, dir, nf)
+
+async def translit_icu_async(source, transform, executor = None):
+    """Async translit_icu(), run on an executor.
+
+    Args:
+        source (str | list[str]): String or list of strings to transliterate.
+        transform (str): ICU transform ID.
+        executor (concurrent.futures.Executor, optional): Executor to use. Defaults to the executor set by set_executor().
+
+    Returns:
+        str | list[str]: Transliterated string or list.
+    """
+    return await _run(executor, translit_icu, source, transform)
+
+async def translit_rules_async(source, rules, direction = icu.UTransDirection.FORWARD, name = "Custom", executor = None):
+    """Async translit_rules(), run on an executor.
+
+    Args:
+        source (str | list[str]): String or list of strings to transform.
+        rules (str): Rules to use for transformation.
+        direction (int, optional): Direction of transformation (forward or reverse). Defaults to icu.UTransDirection.FORWARD.
+        name (str, optional): Label for transformation. Defaults to "Custom".
+        executor (concurrent.futures.Executor, optional): Executor to use. Defaults to the executor set by set_executor().
+
+    Returns:
+        str | list[str]: Transformed string or list.
+    """
+    return await _run(executor, translit_rules, source, rules, direction, name)
+
+async def translit_aiter(sources, translit, concurrency = DEFAULT_CONCURRENCY, executor = None):
+    """Transliterate a stream of strings, yielding results in input order.
+
+    At most `concurrency` strings are transliterated at once. The next string
+    is only read from sources when a slot is free, so a slow consumer applies
+    backpressure to the producer.
+
+    Args:
+        sources (AsyncIterable[str] | Iterable[str]): Strings to transliterate.
+        translit (Callable[[str], str]): Transliteration function, e.g. from get_transliterator().
+        concurrency (int, optional): Maximum number of strings in flight. Defaults to DEFAULT_CONCURRENCY.
+        executor (concurrent.futures.Executor, optional): Executor to use. Defaults to the executor set by set_executor().
+
+    Yields:
+        str: Transliterated strings.
+    """
+    pending = collections.deque()
+    try:
+        if hasattr(sources, "__aiter__"):
+            async for source in sources:
+                pending.append(_run(executor, translit, source))
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+        else:
+            for source in sources:
+                pending.append(_run(executor, translit, source))
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
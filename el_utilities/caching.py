@@ -0,0 +1,255 @@
+import collections, threading, weakref
+
+class LRUCache:
+    """Bounded cache with least recently used eviction.
+
+    Args:
+        maxsize (int, optional): Maximum number of entries. Defaults to 128.
+    """
+    def __init__(self, maxsize = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default = None):
+        """Retrieve value for key, marking it as most recently used.
+
+        Args:
+            key (Hashable): Cache key.
+            default (Any, optional): Value returned if key is not cached. Defaults to None.
+
+        Returns:
+            Any: Cached value or default.
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return self._data[key]
+
+    def put(self, key, value):
+        """Add value to cache, evicting least recently used entries if full.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to cache.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize):
+        """Change maximum number of entries, evicting entries if required.
+
+        Args:
+            maxsize (int): Maximum number of entries.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def discard(self, key):
+        """Remove key from cache, if present.
+
+        Args:
+            key (Hashable): Cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self):
+        while len(self._data) > max(self.maxsize, 0):
+            self._data.popitem(last=False)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"LRUCache(maxsize={self.maxsize}, currsize={len(self._data)}, hits={self.hits}, misses={self.misses})"
+
+_MISSING = object()
+
+class ResultCache(LRUCache):
+    """LRU cache of function results, shared between threads.
+
+    Used to memoise transliteration results by (engine, table or transform,
+    direction, normalisation form, input). Long inputs are unlikely to repeat,
+    so they are not cached, which also bounds the memory used per entry.
+
+    A SharedResultCache can be added as a second tier: it is consulted on a
+    miss, and computed string results are added to it, so other processes
+    benefit from them.
+
+    Args:
+        maxsize (int, optional): Maximum number of entries. Defaults to 65536.
+        max_length (int, optional): Inputs longer than this are not cached. Defaults to 256.
+        shared (SharedResultCache, optional): Cache shared with other processes. Defaults to None.
+    """
+    def __init__(self, maxsize = 65536, max_length = 256, shared = None):
+        super().__init__(maxsize)
+        self.max_length = max_length
+        self.shared = shared
+
+    def lookup(self, key, source, func, *args):
+        """Cached result of func(*args), computing and caching it on a miss.
+
+        Args:
+            key (Hashable): Cache key, including source.
+            source (str): Input string, compared with max_length.
+            func (Callable): Function computing the result.
+
+        Returns:
+            Any: Result.
+        """
+        if len(source) > self.max_length:
+            return func(*args)
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        shared = self.shared
+        if shared is not None:
+            value = shared.get(key, _MISSING)
+            if value is not _MISSING:
+                self.put(key, value)
+                return value
+        value = func(*args)
+        self.put(key, value)
+        if shared is not None and isinstance(value, str):
+            shared.put(key, value)
+        return value
+
+    def stats(self):
+        """Cache statistics.
+
+        Returns:
+            dict: Number of hits and misses, hit rate, current and maximum size, and hits and misses of the shared cache, if any.
+        """
+        lookups = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "currsize": len(self),
+            "maxsize": self.maxsize,
+        }
+        if self.shared is not None:
+            stats["shared_hits"] = self.shared.hits
+            stats["shared_misses"] = self.shared.misses
+        return stats
+
+    def __repr__(self):
+        return f"ResultCache(maxsize={self.maxsize}, max_length={self.max_length}, currsize={len(self)}, hits={self.hits}, misses={self.misses})"
+
+class PerThreadCache:
+    """Set of LRU caches, one per thread.
+
+    Used for objects that must not be shared between threads while in use,
+    such as ICU transliterators. Each thread reuses its own instances, so no
+    lock is shared between threads.
+
+    Instances built in advance, e.g. at application startup, can be added as
+    spares with add_spare(). Each spare is handed to a single thread, by
+    take_spare(), when that thread does not have the key cached yet.
+
+    Args:
+        maxsize (int, optional): Maximum number of entries per thread. Defaults to 128.
+    """
+    def __init__(self, maxsize = 128):
+        self.maxsize = maxsize
+        self._local = threading.local()
+        self._caches = weakref.WeakSet()
+        self._spares = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    def local(self):
+        """Cache of the calling thread.
+
+        Returns:
+            LRUCache: Cache of the calling thread, created on first use.
+        """
+        cache = getattr(self._local, "cache", None)
+        if cache is None:
+            cache = LRUCache(self.maxsize)
+            self._local.cache = cache
+            with self._lock:
+                self._caches.add(cache)
+        return cache
+
+    def add_spare(self, key, value):
+        """Add an instance for a thread that does not have key cached yet.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Instance, not used by any thread.
+        """
+        with self._lock:
+            self._spares[key].append(value)
+
+    def take_spare(self, key):
+        """Remove and return a spare instance for key, see add_spare().
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            Any: Spare instance, or None if there is none.
+        """
+        with self._lock:
+            spares = self._spares.get(key)
+            if not spares:
+                return None
+            value = spares.pop()
+            if not spares:
+                del self._spares[key]
+            return value
+
+    def spares(self, key):
+        """Number of spare instances for key.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            int: Number of spares.
+        """
+        with self._lock:
+            return len(self._spares.get(key, ()))
+
+    def resize(self, maxsize):
+        """Change maximum number of entries per thread, for all threads.
+
+        Args:
+            maxsize (int): Maximum number of entries per thread.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            caches = list(self._caches)
+        for cache in caches:
+            cache.resize(maxsize)
+
+    def clear(self):
+        """Remove all entries and spares, for all threads."""
+        with self._lock:
+            caches = list(self._caches)
+            self._spares.clear()
+        for cache in caches:
+            cache.clear()
+
+    def __repr__(self):
+        return f"PerThreadCache(maxsize={self.maxsize}, threads={len(self._caches)})"
@@ -0,0 +1,144 @@
+"""
+Opt-in instrumentation of the transliteration functions
+
+Counters (table builds, cache hits and misses, characters processed) and
+per-phase timers (collator sorting, normalisation, tokenising, replacement,
+ICU compilation) are recorded only while instrumentation is enabled, either
+with collect_stats(), enable(), or by setting the EL_UTILITIES_STATS
+environment variable to a non-zero value. When disabled, instrumented code
+only checks the `enabled` flag.
+
+    with collect_stats() as stats:
+        translit_dict(text, "lo")
+    print(stats)
+"""
+
+import collections, contextlib, os, threading, time
+
+ENV_VAR = "EL_UTILITIES_STATS"
+
+enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+
+perf_counter = time.perf_counter
+
+_lock = threading.Lock()
+_counters = collections.Counter()
+_timers = collections.defaultdict(lambda: [0.0, 0])
+_callbacks = []
+
+def enable():
+    """Enable instrumentation."""
+    global enabled
+    enabled = True
+
+def disable():
+    """Disable instrumentation. Recorded stats are kept."""
+    global enabled
+    enabled = False
+
+def count(name, n = 1):
+    """Increment a counter, if instrumentation is enabled.
+
+    Args:
+        name (str): Counter name.
+        n (int, optional): Increment. Defaults to 1.
+    """
+    if not enabled:
+        return
+    with _lock:
+        _counters[name] += n
+    for callback in _callbacks:
+        callback("count", name, n)
+
+def add_time(name, seconds):
+    """Add to a timer, if instrumentation is enabled.
+
+    Args:
+        name (str): Timer name.
+        seconds (float): Elapsed time.
+    """
+    if not enabled:
+        return
+    with _lock:
+        timer = _timers[name]
+        timer[0] += seconds
+        timer[1] += 1
+    for callback in _callbacks:
+        callback("time", name, seconds)
+
+@contextlib.contextmanager
+def _timed(name):
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        add_time(name, perf_counter() - start)
+
+_NULL_TIMER = contextlib.nullcontext()
+
+def timer(name):
+    """Context manager timing a block, if instrumentation is enabled.
+
+    Args:
+        name (str): Timer name.
+
+    Returns:
+        contextlib.AbstractContextManager: Timer.
+    """
+    return _timed(name) if enabled else _NULL_TIMER
+
+def get_stats():
+    """Recorded counters and timers.
+
+    Returns:
+        dict: {"counters": {name: count}, "timers": {name: {"total_s": float, "calls": int}}}
+    """
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "timers": {name: {"total_s": total, "calls": calls} for name, (total, calls) in _timers.items()},
+        }
+
+def reset_stats():
+    """Discard recorded counters and timers."""
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+def add_callback(callback):
+    """Register a function called for each recorded event, while enabled.
+
+    Args:
+        callback (Callable[[str, str, float], None]): Called with the kind of event ("count" or "time"), its name and value.
+    """
+    _callbacks.append(callback)
+
+def remove_callback(callback):
+    """Unregister a function registered with add_callback().
+
+    Args:
+        callback (Callable[[str, str, float], None]): Registered function.
+    """
+    _callbacks.remove(callback)
+
+@contextlib.contextmanager
+def collect_stats(reset = True):
+    """Enable instrumentation for a block, collecting stats.
+
+    Args:
+        reset (bool, optional): Discard previously recorded stats first. Defaults to True.
+
+    Yields:
+        dict: Filled with the result of get_stats() when the block exits.
+    """
+    global enabled
+    previous = enabled
+    if reset:
+        reset_stats()
+    stats = {}
+    enabled = True
+    try:
+        yield stats
+    finally:
+        enabled = previous
+        stats.update(get_stats())
@@ -0,0 +1,366 @@
+"""
+Reading and registering LDML transform files
+
+iter_ldml_transforms() reads every transform of a file or directory with
+incremental XML parsing, discarding each element once it has been read, so
+large CLDR bundles are processed with bounded memory. register_ldml_files()
+registers many files at once: files are read and transforms compiled on a
+thread pool, in dependency order, and failures are reported per file.
+
+Rules extracted from LDML files are kept in a persistent JSON cache, keyed by
+file path and validated by modification time and SHA-256 hash, so unchanged
+files are not parsed again in later processes. Transforms are compiled and
+registered with ICU only when their ID is first requested.
+
+    registry = LDMLRegistry("transforms/")
+    registry.install()
+    translit_icu(text, "und-Latn-t-lo-m0-alaloc")
+"""
+
+import collections, concurrent.futures, hashlib, json, os, pathlib, regex, threading, time
+import xml.etree.ElementTree as ET
+import icu
+from .transliteration import clean_ldml_rules, register_rules, add_transform_resolver, remove_transform_resolver, _register_transformer
+from . import instrumentation as _stats
+
+CACHE_VERSION = 2
+
+# A transform read from an LDML file. alias and backward_alias are the first
+# IDs of the alias and backwardAlias attributes; backward_alias is empty if the
+# transform has no reverse direction.
+LDMLTransform = collections.namedtuple("LDMLTransform", ["rules", "alias", "backward_alias", "direction", "path"])
+
+def _ldml_files(path, pattern):
+    path = pathlib.Path(path)
+    if path.is_dir():
+        return sorted(path.glob(pattern))
+    return [path]
+
+def _first_id(value):
+    return value.split()[0] if value and value.split() else ""
+
+def iter_ldml_transforms(path, pattern = "*.xml"):
+    """Read all transforms of an LDML file, or a directory of LDML files.
+
+    Args:
+        path (str | pathlib.Path): LDML file or directory.
+        pattern (str, optional): Glob pattern of LDML files in a directory, e.g. "**/*.xml" to include subdirectories. Defaults to "*.xml".
+
+    Yields:
+        LDMLTransform: Transforms, in document order.
+    """
+    for ldml_file in _ldml_files(path, pattern):
+        root = None
+        for event, elem in ET.iterparse(ldml_file, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event != "end" or elem.tag != "transform":
+                continue
+            attrib = elem.attrib
+            direction = attrib.get("direction", "both")
+            alias = _first_id(attrib.get("alias"))
+            if not alias and "source" in attrib and "target" in attrib:
+                alias = f"{attrib['source']}-{attrib['target']}"
+                if attrib.get("variant"):
+                    alias = f"{alias}/{attrib['variant']}"
+            backward_alias = _first_id(attrib.get("backwardAlias"))
+            rules = clean_ldml_rules("".join(r.text or "" for r in elem.iter("tRule")))
+            yield LDMLTransform(rules, alias, backward_alias, direction, str(ldml_file))
+            elem.clear()
+            root.clear()
+
+def register_ldml_transforms(path, pattern = "*.xml"):
+    """Compile and register all transforms of an LDML file or directory, in one pass.
+
+    Args:
+        path (str | pathlib.Path): LDML file or directory.
+        pattern (str, optional): Glob pattern of LDML files in a directory. Defaults to "*.xml".
+
+    Returns:
+        list[str]: Registered transform IDs.
+    """
+    ids = []
+    for name, rules, direction in _registrations(iter_ldml_transforms(path, pattern)):
+        register_rules(name, rules, direction)
+        ids.append(name)
+    return ids
+
+def _registrations(transforms):
+    # (transform ID, rules, ICU direction) for each direction of the transforms
+    for transform in transforms:
+        if transform.alias and transform.direction != "backward":
+            yield (transform.alias, transform.rules, icu.UTransDirection.FORWARD)
+        if transform.backward_alias and transform.direction != "forward":
+            yield (transform.backward_alias, transform.rules, icu.UTransDirection.REVERSE)
+
+# Result of register_ldml_files() for one file. errors is a list of
+# (transform ID, exception) pairs, the ID is None if the file could not be read.
+LDMLFileReport = collections.namedtuple("LDMLFileReport", ["path", "ids", "parse_s", "compile_s", "errors"])
+
+# ::ID; and ::ID (ReverseID); references to other transforms in rules, each ID
+# optionally preceded by a filter, e.g. ::[:Lao:] Lao-Latin;
+_TRANSFORM_REFERENCE = regex.compile(
+    r'(?(DEFINE)(?P<set>\[(?:[^\[\]\\]|\\.|(?&set))*\]))'
+    r'::\s*(?:(?&set)\s*)?(?P<forward>[^\s;()\[][^;()]*?)?\s*(?:\(\s*(?:(?&set)\s*)?(?P<reverse>[^;()\[]*?)\s*\))?\s*;')
+
+def _inverse_id(transform):
+    source, sep, target = transform.partition("-")
+    if not sep:
+        return transform
+    target, sep, variant = target.partition("/")
+    return f"{target}-{source}{sep}{variant}"
+
+def transform_references(rules):
+    """Transform IDs referenced by rules, e.g. by ::Any-NFD;
+
+    Args:
+        rules (str): Transformation rules.
+
+    Returns:
+        set[str]: Referenced transform IDs, with the inverse IDs used by the reverse direction.
+    """
+    references = set()
+    for forward, reverse in (m.group("forward", "reverse") for m in _TRANSFORM_REFERENCE.finditer(rules)):
+        if forward:
+            references.add(forward)
+            if not reverse:
+                references.add(_inverse_id(forward))
+        if reverse:
+            references.add(reverse)
+    return references
+
+def _read_ldml_file(path):
+    start = time.perf_counter()
+    transforms = list(_registrations(iter_ldml_transforms(path)))
+    return transforms, time.perf_counter() - start
+
+def _compile(name, rules, direction):
+    start = time.perf_counter()
+    transformer = icu.Transliterator.createFromRules(name, rules, direction)
+    return transformer, time.perf_counter() - start
+
+def register_ldml_files(paths, pattern = "*.xml", workers = None):
+    """Register transforms of many LDML files, reporting failures per file.
+
+    Files are read concurrently. Transforms are compiled on a thread pool in
+    rounds: a transform is compiled once the transforms it references that are
+    defined by the same files are registered. A transform that fails to compile
+    is reported, and transforms depending on it are skipped, but the others are
+    registered. A transform ID defined more than once is not registered, and is
+    reported for each file defining it.
+
+    Args:
+        paths (str | pathlib.Path | Iterable[str | pathlib.Path]): LDML files or directories.
+        pattern (str, optional): Glob pattern of LDML files in directories. Defaults to "*.xml".
+        workers (int, optional): Number of threads. Defaults to os.cpu_count().
+
+    Returns:
+        list[LDMLFileReport]: Report for each file, in input order.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    files = [f for path in paths for f in _ldml_files(path, pattern)]
+    workers = workers or os.cpu_count() or 1
+    reports = {}
+    definitions = collections.defaultdict(list)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for path, future in [(f, executor.submit(_read_ldml_file, f)) for f in files]:
+            try:
+                transforms, parse_s = future.result()
+            except Exception as error:
+                reports[path] = LDMLFileReport(str(path), [], 0.0, 0.0, [(None, error)])
+                continue
+            reports[path] = LDMLFileReport(str(path), [], parse_s, 0.0, [])
+            for name, rules, direction in transforms:
+                definitions[name].append((path, rules, direction))
+        pending = {}
+        failed = set()
+        for name, defined in definitions.items():
+            if len(defined) == 1:
+                pending[name] = defined[0]
+                continue
+            failed.add(name)
+            paths = list(dict.fromkeys(path for path, rules, direction in defined))
+            for path in paths:
+                reports[path].errors.append((name, ValueError(f"{name} is defined more than once, in {', '.join(map(str, paths))}")))
+        dependencies = {name: transform_references(rules) & definitions.keys() - {name} for name, (path, rules, direction) in pending.items()}
+        while pending:
+            ready = [name for name in pending if not dependencies[name] & pending.keys()]
+            if not ready:
+                for name in pending:
+                    reports[pending[name][0]].errors.append((name, ValueError(f"Circular reference between {name} and {sorted(dependencies[name] & pending.keys())}")))
+                break
+            futures = {}
+            for name in ready:
+                path, rules, direction = pending.pop(name)
+                missing = dependencies[name] & failed
+                if missing:
+                    failed.add(name)
+                    reports[path].errors.append((name, ValueError(f"{name} references transforms that failed: {sorted(missing)}")))
+                else:
+                    futures[name] = (path, rules, direction, executor.submit(_compile, name, rules, direction))
+            for name, (path, rules, direction, future) in futures.items():
+                report = reports[path]
+                try:
+                    transformer, compile_s = future.result()
+                except Exception as error:
+                    failed.add(name)
+                    report.errors.append((name, error))
+                    continue
+                _register_transformer(name, rules, direction, transformer)
+                report.ids.append(name)
+                reports[path] = report._replace(compile_s=report.compile_s + compile_s)
+                _stats.add_time("icu_compile", compile_s)
+    return [reports[f] for f in files]
+
+def default_cache_file():
+    """Default location of the rules cache.
+
+    Returns:
+        pathlib.Path: $XDG_CACHE_HOME/el_utilities/ldml_rules.json, or ~/.cache/el_utilities/ldml_rules.json.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(cache_home) / "el_utilities" / "ldml_rules.json"
+
+class LDMLRegistry:
+    """Lazily registered transforms from LDML files, with a persistent rules cache.
+
+    Args:
+        directory (str | pathlib.Path, optional): Directory of LDML files to add. Defaults to None.
+        cache_file (str | pathlib.Path, optional): JSON rules cache. Defaults to default_cache_file(). Use False to disable the cache.
+        pattern (str, optional): Glob pattern of LDML files in directory. Defaults to "*.xml".
+    """
+    def __init__(self, directory = None, cache_file = None, pattern = "*.xml"):
+        self.cache_file = None if cache_file is False else pathlib.Path(cache_file or default_cache_file())
+        self._cache = self._load_cache()
+        self._dirty = False
+        self._transforms = {}
+        self._registered = set()
+        self._resolving = set()
+        self._lock = threading.RLock()
+        if directory is not None:
+            self.add_directory(directory, pattern)
+
+    def _load_cache(self):
+        if self.cache_file is None or not self.cache_file.is_file():
+            return {}
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def save(self):
+        """Write the rules cache, if it changed."""
+        if self.cache_file is None or not self._dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "files": self._cache}, f, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+        self._dirty = False
+
+    def _parse(self, path):
+        # Extracted rules for path, from the cache when the file is unchanged.
+        key = str(path)
+        stat = path.stat()
+        entry = self._cache.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["transforms"]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if not entry or entry["sha256"] != digest:
+            transforms = [[name, rules, int(direction)] for name, rules, direction in _registrations(iter_ldml_transforms(path))]
+            entry = {"sha256": digest, "transforms": transforms}
+        entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self._cache[key] = entry
+        self._dirty = True
+        return entry["transforms"]
+
+    def add_file(self, ldml_file, save = True):
+        """Add transforms of an LDML file, without compiling them.
+
+        Args:
+            ldml_file (str | pathlib.Path): LDML file.
+            save (bool, optional): Write the rules cache if it changed. Defaults to True.
+
+        Returns:
+            list[str]: Transform IDs defined by the file.
+        """
+        path = pathlib.Path(ldml_file).resolve()
+        ids = []
+        for name, rules, direction in self._parse(path):
+            self._transforms[name] = (rules, direction)
+            ids.append(name)
+        if save:
+            self.save()
+        return ids
+
+    def add_directory(self, directory, pattern = "*.xml"):
+        """Add transforms of all LDML files in a directory.
+
+        Args:
+            directory (str | pathlib.Path): Directory of LDML files.
+            pattern (str, optional): Glob pattern of LDML files, e.g. "**/*.xml" to include subdirectories. Defaults to "*.xml".
+
+        Returns:
+            list[str]: Transform IDs added.
+        """
+        ids = []
+        for path in _ldml_files(directory, pattern):
+            ids.extend(self.add_file(path, save=False))
+        self.save()
+        return ids
+
+    def ids(self):
+        """Transform IDs known to the registry, registered or not.
+
+        Returns:
+            list[str]: Transform IDs.
+        """
+        return list(self._transforms)
+
+    def resolve(self, transform):
+        """Compile and register a transform with ICU, if the registry defines it.
+
+        Args:
+            transform (str): Transform ID.
+
+        Returns:
+            bool: True if the transform is registered.
+        """
+        entry = self._transforms.get(transform)
+        if entry is None:
+            return False
+        with self._lock:
+            if transform not in self._registered and transform not in self._resolving:
+                # Transforms referenced by ::ID; rules must be registered first
+                self._resolving.add(transform)
+                try:
+                    for reference in sorted(transform_references(entry[0]) & self._transforms.keys() - {transform}):
+                        self.resolve(reference)
+                    register_rules(transform, *entry)
+                finally:
+                    self._resolving.discard(transform)
+                self._registered.add(transform)
+        return True
+
+    def install(self):
+        """Let translit_icu() and is_available_transform() register transforms on first use."""
+        add_transform_resolver(self.resolve)
+
+    def uninstall(self):
+        """Undo install(). Transforms already registered stay registered."""
+        remove_transform_resolver(self.resolve)
+
+    def __contains__(self, transform):
+        return transform in self._transforms
+
+    def __len__(self):
+        return len(self._transforms)
+
+    def __repr__(self):
+        return f"LDMLRegistry({len(self._transforms)} transforms, {len(self._registered)} registered)"
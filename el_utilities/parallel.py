@@ -0,0 +1,79 @@
+"""
+Parallel transliteration using a process pool
+
+Each worker process creates its transliteration function once, in the pool
+initialiser, so compiled tables and ICU transliterators are built once per
+process rather than per string or per chunk.
+"""
+
+import collections, concurrent.futures, itertools, os
+from .transliteration import DEFAULT_NF, get_transliterator
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_worker_translit = None
+
+def _init_worker(engine, target, dir, nf):
+    global _worker_translit
+    _worker_translit = get_transliterator(engine, target, dir, nf)
+
+def _translit_chunk(items):
+    translit = _worker_translit
+    return [translit(item) if isinstance(item, str) else item for item in items]
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def iter_translit_parallel(sources, engine, target, dir = "forward", nf = DEFAULT_NF, processes = None, chunk_size = DEFAULT_CHUNK_SIZE, mp_context = None):
+    """Transliterate strings using a process pool, yielding results in input order.
+
+    Input is consumed lazily and at most two chunks per process are in flight,
+    so memory use does not grow with the size of the corpus. Items that are not
+    strings are returned unchanged.
+
+    Args:
+        sources (Iterable[str]): Strings to transliterate.
+        engine (str): Engine, see get_transliterator().
+        target (str): Language tag, transform ID, LDML file or rules, see get_transliterator().
+        dir (str, optional): Direction, "forward" or "reverse". Defaults to "forward".
+        nf (str, optional): Normalisation form. Defaults to DEFAULT_NF.
+        processes (int, optional): Number of worker processes. Defaults to os.cpu_count().
+        chunk_size (int, optional): Number of strings sent to a worker at a time. Defaults to DEFAULT_CHUNK_SIZE.
+        mp_context (multiprocessing.context.BaseContext, optional): Multiprocessing context, e.g. to select "spawn" or "forkserver". Defaults to None.
+
+    Yields:
+        str: Transliterated strings.
+    """
+    processes = processes or os.cpu_count() or 1
+    max_pending = 2 * processes
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes, mp_context=mp_context, initializer=_init_worker, initargs=(engine, target, dir, nf)) as executor:
+        pending = collections.deque()
+        for batch in _batched(sources, chunk_size):
+            pending.append(executor.submit(_translit_chunk, batch))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def translit_parallel(sources, engine, target, dir = "forward", nf = DEFAULT_NF, processes = None, chunk_size = DEFAULT_CHUNK_SIZE, mp_context = None):
+    """Transliterate strings using a process pool.
+
+    Args:
+        sources (Iterable[str]): Strings to transliterate.
+        engine (str): Engine, see get_transliterator().
+        target (str): Language tag, transform ID, LDML file or rules, see get_transliterator().
+        dir (str, optional): Direction, "forward" or "reverse". Defaults to "forward".
+        nf (str, optional): Normalisation form. Defaults to DEFAULT_NF.
+        processes (int, optional): Number of worker processes. Defaults to os.cpu_count().
+        chunk_size (int, optional): Number of strings sent to a worker at a time. Defaults to DEFAULT_CHUNK_SIZE.
+        mp_context (multiprocessing.context.BaseContext, optional): Multiprocessing context. Defaults to None.
+
+    Returns:
+        list[str]: Transliterated strings, in input order.
+    """
+    return list(iter_translit_parallel(sources, engine, target, dir, nf, processes, chunk_size, mp_context))
@@ -0,0 +1,219 @@
+"""
+Result cache shared between processes
+
+A SharedResultCache is a fixed size, memory-mapped file of slots, so every
+process on a host that opens the same file, e.g. the workers of a gunicorn
+server, sees results computed by the others. A key is hashed to a bucket of
+BUCKET_SIZE slots; when the bucket is full, one of its entries is replaced,
+so the file never grows. Access is serialised with fcntl.flock(), shared for
+reads and exclusive for writes. Put the file on a memory backed file system,
+such as /dev/shm, to avoid disk writes.
+
+The file header holds a generation number, which is part of every key.
+bump_generation(), called when registered rules change, makes all entries stale
+for all processes at once, without rewriting the slots.
+
+    enable_result_cache(shared_cache="/dev/shm/el_utilities.cache")
+
+Only available on POSIX systems.
+"""
+
+import fcntl, hashlib, mmap, os, pathlib, struct, threading
+
+MAGIC = b"ELRC"
+VERSION = 2
+BUCKET_SIZE = 4
+
+_HEADER = struct.Struct("<4sHHIII")
+_GENERATION = struct.Struct("<I")
+_GENERATION_OFFSET = _HEADER.size - _GENERATION.size
+_SLOT_HEADER = struct.Struct("<QHH")
+
+def _key_bytes(key, generation):
+    return _GENERATION.pack(generation) + "\x1f".join(str(part) for part in key).encode("utf-8")
+
+class SharedResultCache:
+    """Fixed size cache of string results in a memory-mapped file, shared between processes.
+
+    If the file exists, its number of slots and slot size are used.
+
+    Args:
+        path (str | pathlib.Path): Cache file, created if missing.
+        slots (int, optional): Number of slots. Defaults to 65536.
+        slot_size (int, optional): Bytes per slot. Entries whose UTF-8 encoded key and value do not fit are not cached. Defaults to 512.
+    """
+    def __init__(self, path, slots = 65536, slot_size = 512):
+        self.path = pathlib.Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._open(slots, slot_size)
+
+    def _open(self, slots, slot_size):
+        slots = max(slots // BUCKET_SIZE, 1) * BUCKET_SIZE
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                header = os.pread(fd, _HEADER.size, 0)
+                if len(header) == _HEADER.size:
+                    magic, version, _, slots, slot_size, _ = _HEADER.unpack(header)
+                    if magic != MAGIC or version != VERSION:
+                        raise ValueError(f"{self.path} is not a version {VERSION} result cache file")
+                else:
+                    os.ftruncate(fd, _HEADER.size + slots * slot_size)
+                    os.pwrite(fd, _HEADER.pack(MAGIC, VERSION, 0, slots, slot_size, 0), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            self._buf = mmap.mmap(fd, _HEADER.size + slots * slot_size)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        self._pid = os.getpid()
+        self.slots = slots
+        self.slot_size = slot_size
+
+    def _check_fork(self):
+        # flock() locks are shared by file descriptors inherited over fork(),
+        # so a child process opens the file again.
+        if self._pid != os.getpid():
+            self._buf.close()
+            os.close(self._fd)
+            self._open(self.slots, self.slot_size)
+
+    def _bucket(self, key):
+        # Called with the file locked, as the key includes the generation.
+        data = _key_bytes(key, self._generation())
+        digest = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little") | 1
+        first = digest % (self.slots // BUCKET_SIZE) * BUCKET_SIZE
+        return data, digest, first
+
+    def _generation(self):
+        return _GENERATION.unpack_from(self._buf, _GENERATION_OFFSET)[0]
+
+    def _slot_offset(self, slot):
+        return _HEADER.size + slot * self.slot_size
+
+    def get(self, key, default = None):
+        """Retrieve cached value for key.
+
+        Args:
+            key (tuple): Cache key, a tuple of strings and numbers.
+            default (Any, optional): Value returned if key is not cached. Defaults to None.
+
+        Returns:
+            str | Any: Cached value or default.
+        """
+        with self._lock:
+            self._check_fork()
+            buf = self._buf
+            fcntl.flock(self._fd, fcntl.LOCK_SH)
+            try:
+                data, digest, first = self._bucket(key)
+                for slot in range(first, first + BUCKET_SIZE):
+                    offset = self._slot_offset(slot)
+                    slot_digest, key_len, value_len = _SLOT_HEADER.unpack_from(buf, offset)
+                    if slot_digest != digest or key_len != len(data):
+                        continue
+                    start = offset + _SLOT_HEADER.size
+                    if buf[start:start + key_len] != data:
+                        continue
+                    value = buf[start + key_len:start + key_len + value_len].decode("utf-8")
+                    self.hits += 1
+                    return value
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """Add value to cache, replacing an entry of its bucket if full.
+
+        Args:
+            key (tuple): Cache key, a tuple of strings and numbers.
+            value (str): Value to cache.
+
+        Returns:
+            bool: True if cached, False if the entry does not fit in a slot.
+        """
+        encoded = value.encode("utf-8")
+        with self._lock:
+            self._check_fork()
+            buf = self._buf
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                data, digest, first = self._bucket(key)
+                if _SLOT_HEADER.size + len(data) + len(encoded) > self.slot_size:
+                    return False
+                target = None
+                for slot in range(first, first + BUCKET_SIZE):
+                    slot_digest, key_len, _ = _SLOT_HEADER.unpack_from(buf, self._slot_offset(slot))
+                    if slot_digest == digest and key_len == len(data):
+                        start = self._slot_offset(slot) + _SLOT_HEADER.size
+                        if buf[start:start + key_len] == data:
+                            target = slot
+                            break
+                    if slot_digest == 0 and target is None:
+                        target = slot
+                if target is None:
+                    target = first + (digest >> 32) % BUCKET_SIZE
+                offset = self._slot_offset(target)
+                start = offset + _SLOT_HEADER.size
+                # Write the entry before its header, so an interrupted write
+                # leaves the slot empty or with a mismatched key.
+                _SLOT_HEADER.pack_into(buf, offset, 0, 0, 0)
+                buf[start:start + len(data) + len(encoded)] = data + encoded
+                _SLOT_HEADER.pack_into(buf, offset, digest, len(data), len(encoded))
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return True
+
+    @property
+    def generation(self):
+        """int: Current generation, see bump_generation()."""
+        with self._lock:
+            self._check_fork()
+            fcntl.flock(self._fd, fcntl.LOCK_SH)
+            try:
+                return self._generation()
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def bump_generation(self):
+        """Make all entries stale, for all processes, e.g. after rules are registered.
+
+        Returns:
+            int: New generation.
+        """
+        with self._lock:
+            self._check_fork()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                generation = (self._generation() + 1) & 0xFFFFFFFF
+                _GENERATION.pack_into(self._buf, _GENERATION_OFFSET, generation)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return generation
+
+    def clear(self):
+        """Remove all entries, for all processes, and reset statistics."""
+        with self._lock:
+            self._check_fork()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                for slot in range(self.slots):
+                    _SLOT_HEADER.pack_into(self._buf, self._slot_offset(slot), 0, 0, 0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        """Unmap and close the cache file."""
+        with self._lock:
+            self._buf.close()
+            os.close(self._fd)
+
+    def __repr__(self):
+        return f"SharedResultCache({str(self.path)!r}, slots={self.slots}, slot_size={self.slot_size}, generation={self.generation}, hits={self.hits}, misses={self.misses})"
@@ -1,3 +1,5 @@
+import collections
+
 def list_to_string(items, sep = ', ', drop_bool = True):
     """Convert list to string
 
@@ -36,6 +38,95 @@ def string_to_list(items, sep = ', '):
     # return [item.strip() for item in items.split(sep) if item.strip()]
     return [item for item in items.split(sep)  if item == item.strip() ]
 
+def iter_list_to_string(items, sep = ', ', drop_bool = True):
+    """Lazily join items, yielding the pieces of the joined string
+
+    Streaming counterpart of list_to_string(). "".join() of the pieces equals
+    list_to_string(items, sep, drop_bool).
+
+    Args:
+        items (Iterable): Items to join.
+        sep (str, optional): Separator. Defaults to ', '.
+        drop_bool (bool, optional): Drop falsy items. Defaults to True.
+
+    Yields:
+        str: Items and separators.
+    """
+    first = True
+    for item in items:
+        if drop_bool and not item:
+            continue
+        if not first:
+            yield sep
+        first = False
+        yield f'{item}'
+
+def list_to_stream(items, stream, sep = ', ', drop_bool = True):
+    """Write items, joined by a separator, to a text stream
+
+    Args:
+        items (Iterable): Items to join.
+        stream (io.TextIOBase): Stream to write to.
+        sep (str, optional): Separator. Defaults to ', '.
+        drop_bool (bool, optional): Drop falsy items. Defaults to True.
+
+    Returns:
+        int: Number of characters written.
+    """
+    count = 0
+    for piece in iter_list_to_string(items, sep, drop_bool):
+        stream.write(piece)
+        count += len(piece)
+    return count
+
+def _iter_split(items, sep, chunk_size):
+    if not sep:
+        raise ValueError("empty separator")
+    if isinstance(items, str):
+        start = 0
+        while True:
+            i = items.find(sep, start)
+            if i == -1:
+                yield items[start:]
+                return
+            yield items[start:i]
+            start = i + len(sep)
+    buffer = ""
+    while True:
+        data = items.read(chunk_size)
+        if not data:
+            break
+        # Only rescan the end of the previous buffer, in case sep spans reads
+        search_from = max(len(buffer) - len(sep) + 1, 0)
+        buffer += data
+        start = 0
+        while True:
+            i = buffer.find(sep, max(start, search_from))
+            if i == -1:
+                break
+            yield buffer[start:i]
+            start = i + len(sep)
+        buffer = buffer[start:]
+    yield buffer
+
+def iter_string_to_list(items, sep = ', ', chunk_size = 65536):
+    """Lazily split string or text stream
+
+    Streaming counterpart of string_to_list(). Yields the same items, without
+    building a list or reading the whole stream.
+
+    Args:
+        items (str | io.TextIOBase): String or text stream to split.
+        sep (str, optional): Separator. Defaults to ', '.
+        chunk_size (int, optional): Characters read from a stream at a time. Defaults to 65536.
+
+    Yields:
+        str: Items.
+    """
+    for item in _iter_split(items, sep, chunk_size):
+        if item == item.strip():
+            yield item
+
 def print_list(l, sep = "\n", drop_bool = True):
     """Print list to STDOUT
 
@@ -65,6 +156,112 @@ def search_dict_values(dictionary, searchString):
     """
     return [key for key,val in dictionary.items() if any(searchString in s for s in val)]
 
+class SubstringIndex:
+    """N-gram index for substring search over dictionary values.
+
+    Indexed alternative to search_dict_values() for repeated queries. Every
+    substring of up to n characters of each value is indexed, so a query is
+    answered by intersecting posting sets and only the candidate keys are
+    checked with a substring test.
+
+    Args:
+        dictionary (dict, optional): Dictionary of string iterables to index. A str value is indexed as a single string. Defaults to None.
+        n (int, optional): Maximum n-gram length. Defaults to 3.
+    """
+    def __init__(self, dictionary = None, n = 3):
+        self.n = n
+        self._values = {}
+        self._order = {}
+        self._counter = 0
+        self._grams = collections.defaultdict(set)
+        if dictionary:
+            self.update(dictionary)
+
+    def _ngrams(self, values):
+        n = self.n
+        grams = set()
+        for value in values:
+            for size in range(1, n + 1):
+                for i in range(len(value) - size + 1):
+                    grams.add(value[i:i + size])
+        return grams
+
+    def add(self, key, values):
+        """Add or replace the values of a key.
+
+        Args:
+            key (Hashable): Dictionary key.
+            values (Iterable[str] | str): Values to index.
+        """
+        if key in self._values:
+            self.remove(key)
+        values = (values,) if isinstance(values, str) else tuple(values)
+        self._values[key] = values
+        self._order[key] = self._counter
+        self._counter += 1
+        for gram in self._ngrams(values):
+            self._grams[gram].add(key)
+
+    def update(self, dictionary):
+        """Add or replace several keys.
+
+        Args:
+            dictionary (dict): Dictionary of string iterables.
+        """
+        for key, values in dictionary.items():
+            self.add(key, values)
+
+    def remove(self, key):
+        """Remove a key from the index.
+
+        Args:
+            key (Hashable): Dictionary key.
+        """
+        values = self._values.pop(key)
+        del self._order[key]
+        for gram in self._ngrams(values):
+            postings = self._grams[gram]
+            postings.discard(key)
+            if not postings:
+                del self._grams[gram]
+
+    def search(self, searchString):
+        """Retrieve keys with a value containing searchString.
+
+        Args:
+            searchString (str): Substring to search for.
+
+        Returns:
+            list: Matching keys, in insertion order.
+        """
+        if not searchString:
+            candidates = [key for key, values in self._values.items() if values]
+        elif len(searchString) <= self.n:
+            candidates = self._grams.get(searchString, ())
+        else:
+            n = self.n
+            postings = sorted((self._grams.get(searchString[i:i + n], set()) for i in range(len(searchString) - n + 1)), key=len)
+            candidates = set.intersection(*postings)
+            candidates = [key for key in candidates if any(searchString in s for s in self._values[key])]
+        return sorted(candidates, key=self._order.__getitem__)
+
+    def search_many(self, searchStrings):
+        """Run several searches.
+
+        Args:
+            searchStrings (Iterable[str]): Substrings to search for.
+
+        Returns:
+            list[list]: Matching keys for each search string, in input order.
+        """
+        return [self.search(searchString) for searchString in searchStrings]
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __len__(self):
+        return len(self._values)
+
 def search_dict_keys(dictionary, searchString):
     """Retrieve dictionary values for matching keys
 
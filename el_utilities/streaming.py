@@ -0,0 +1,160 @@
+"""
+Streaming transliteration of files and standard input
+
+Text is read in chunks and each chunk is cut after its last line break, or
+failing that its last whitespace character, so words and grapheme clusters are
+not split across chunks. Dictionary entries containing spaces, e.g. "tāng
+tāng", are not split either: cuts are moved back before any that could match.
+Memory use is bounded by the chunk size, regardless of input size.
+
+Usage:
+
+    el-translit --lang lo records.txt -o records_latn.txt
+    el-translit --transform Any-Latin < input.txt > output.txt
+"""
+
+import argparse, io, sys
+import regex
+from .transliteration import DEFAULT_NF, get_transliterator
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_GRAPHEME = regex.compile(r'\X')
+
+def _split_point(buffer, force, spans = None):
+    # Position after the last line break, else after the last whitespace
+    # character, or 0 if there is none. A trailing CR is skipped, as it may be
+    # followed by LF. Positions where spans(before, after) is true are skipped.
+    # If force is set and there is no such position, the start of the last
+    # grapheme cluster, so combining sequences stay together.
+    newline = buffer.rfind("\n")
+    if newline != -1 and not (spans and spans(buffer[:newline + 1], buffer[newline + 1:])):
+        return newline + 1
+    last = len(buffer) - 1
+    for i in range(last, -1, -1):
+        if buffer[i].isspace() and not (i == last and buffer[i] == "\r"):
+            if spans and spans(buffer[:i + 1], buffer[i + 1:]):
+                continue
+            return i + 1
+    if force:
+        tail = max(len(buffer) - 64, 0)
+        starts = [m.start() + tail for m in _GRAPHEME.finditer(buffer, tail)]
+        return max((i for i in starts if i > 0), default=0)
+    return 0
+
+def iter_chunks(stream, chunk_size = DEFAULT_CHUNK_SIZE, max_buffer = None, spans = None):
+    """Read text stream in chunks ending at a line break or whitespace.
+
+    A chunk is only cut elsewhere when max_buffer characters are read without any
+    whitespace; it is then cut at a grapheme cluster boundary.
+
+    Args:
+        stream (io.TextIOBase): Text stream to read.
+        chunk_size (int, optional): Number of characters to read at a time. Defaults to DEFAULT_CHUNK_SIZE.
+        max_buffer (int, optional): Maximum characters held without whitespace. Defaults to 16 * chunk_size.
+        spans (Callable[[str, str], bool], optional): Whether a match may span a cut between two strings, e.g. TranslitTable.spans(). Such cuts are avoided. Defaults to None.
+
+    Yields:
+        str: Text chunks. Joined, they equal the input.
+    """
+    if max_buffer is None:
+        max_buffer = 16 * chunk_size
+    buffer = ""
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        buffer += data
+        cut = _split_point(buffer, len(buffer) >= max_buffer, spans)
+        if cut:
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+def translit_stream(instream, outstream, translit, chunk_size = DEFAULT_CHUNK_SIZE):
+    """Transliterate text stream, writing output as each chunk is processed.
+
+    Args:
+        instream (io.TextIOBase): Text stream to read.
+        outstream (io.TextIOBase): Text stream to write.
+        translit (Callable[[str], str]): Transliteration function, e.g. from get_transliterator(). If it has a `spans` attribute, it is passed to iter_chunks().
+        chunk_size (int, optional): Number of characters to read at a time. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Returns:
+        int: Number of characters read.
+    """
+    count = 0
+    for chunk in iter_chunks(instream, chunk_size, spans=getattr(translit, "spans", None)):
+        count += len(chunk)
+        outstream.write(translit(chunk))
+    return count
+
+def translit_file(infile, outfile, engine, target, dir = "forward", nf = DEFAULT_NF, chunk_size = DEFAULT_CHUNK_SIZE, encoding = "utf-8"):
+    """Transliterate file, or standard input, in chunks.
+
+    Args:
+        infile (str): Input file, "-" for standard input.
+        outfile (str): Output file, "-" for standard output.
+        engine (str): Engine, see get_transliterator().
+        target (str): Language tag, transform ID, LDML file or rules, see get_transliterator().
+        dir (str, optional): Direction, "forward" or "reverse". Defaults to "forward".
+        nf (str, optional): Normalisation form. Defaults to DEFAULT_NF.
+        chunk_size (int, optional): Number of characters to read at a time. Defaults to DEFAULT_CHUNK_SIZE.
+        encoding (str, optional): Encoding of input and output. Defaults to "utf-8".
+
+    Returns:
+        int: Number of characters read.
+    """
+    translit = get_transliterator(engine, target, dir, nf)
+    instream = io.TextIOWrapper(sys.stdin.buffer, encoding=encoding, newline="") if infile == "-" else open(infile, encoding=encoding, newline="")
+    outstream = io.TextIOWrapper(sys.stdout.buffer, encoding=encoding, newline="") if outfile == "-" else open(outfile, "w", encoding=encoding, newline="")
+    try:
+        return translit_stream(instream, outstream, translit, chunk_size)
+    finally:
+        if infile == "-":
+            instream.detach()
+        else:
+            instream.close()
+        if outfile == "-":
+            outstream.flush()
+            outstream.detach()
+        else:
+            outstream.close()
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog="el-translit", description="Transliterate a file or standard input in chunks.")
+    parser.add_argument("input", nargs="?", default="-", help="input file, defaults to standard input")
+    parser.add_argument("-o", "--output", default="-", help="output file, defaults to standard output")
+    engine = parser.add_mutually_exclusive_group(required=True)
+    engine.add_argument("--lang", help="dictionary transliteration for language tag")
+    engine.add_argument("--hybrid", help="dictionary transliteration for language tag, with rules for words not in the dictionary")
+    engine.add_argument("--transform", help="ICU transform ID")
+    engine.add_argument("--ldml", help="LDML file containing transform rules")
+    engine.add_argument("--rules", help="file containing custom transform rules")
+    parser.add_argument("--reverse", action="store_true", help="transliterate in reverse direction")
+    parser.add_argument("--nf", default=DEFAULT_NF, help=f"normalisation form, defaults to {DEFAULT_NF}")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="characters read at a time")
+    parser.add_argument("--encoding", default="utf-8", help="encoding of input and output")
+    args = parser.parse_args(argv)
+    dir = "reverse" if args.reverse else "forward"
+    try:
+        if args.lang:
+            engine, target = "dict", args.lang
+        elif args.hybrid:
+            engine, target = "hybrid", args.hybrid
+        elif args.transform:
+            engine, target = "icu", args.transform
+        elif args.ldml:
+            engine, target = "ldml", args.ldml
+        else:
+            with open(args.rules, encoding="utf-8") as f:
+                engine, target = "rules", f.read()
+        translit_file(args.input, args.output, engine, target, dir, args.nf, args.chunk_size, args.encoding)
+    except (ValueError, OSError) as e:
+        parser.exit(1, f"{parser.prog}: {e}\n")
+    except KeyError as e:
+        parser.exit(1, f"{parser.prog}: unsupported language {e}\n")
+
+if __name__ == "__main__":
+    main()
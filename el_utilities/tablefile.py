@@ -0,0 +1,202 @@
+"""
+Compact binary format for transliteration tables
+
+A table file holds the forward and reverse dictionaries and the rules of one
+entry of TRANSLIT_DATA. Dictionaries are stored as a sorted string table: an
+array of fixed size (key offset, key length, value offset, value length)
+records, sorted by the UTF-8 bytes of the key, followed by the UTF-8 encoded
+strings. Files are memory-mapped and keys are looked up with a binary search,
+so a table is available without importing and evaluating its module.
+
+The mapped pages are shared between processes. A compiled table (see
+TranslitTable) looks words up in the file when its entries are already in the
+table's normalisation form; the trie matching the forward direction is still
+built in each process. Table files are not built
+on installation, and are ignored by git. Build them with:
+
+    python -m el_utilities.tablefile [table_id ...] [-o DIRECTORY]
+"""
+
+import argparse, collections.abc, mmap, os, pathlib, struct
+
+MAGIC = b"ELTT"
+VERSION = 1
+SUFFIX = ".eltt"
+
+_HEADER = struct.Struct("<4sHH")
+_SECTION = struct.Struct("<16sIQ")
+_COUNT = struct.Struct("<I")
+_ENTRY = struct.Struct("<IIII")
+
+_DICT_SECTION = 0
+_STR_SECTION = 1
+
+class MappedDict(collections.abc.Mapping):
+    """Read-only dictionary backed by a sorted string table in a buffer.
+
+    Args:
+        buf (mmap.mmap | bytes): Buffer holding the table file.
+        offset (int): Offset of the dictionary section in buf.
+    """
+    def __init__(self, buf, offset):
+        self._buf = buf
+        (self._count,) = _COUNT.unpack_from(buf, offset)
+        self._index = offset + _COUNT.size
+
+    def _entry(self, i):
+        return _ENTRY.unpack_from(self._buf, self._index + i * _ENTRY.size)
+
+    def _find(self, key):
+        key = key.encode("utf-8")
+        buf = self._buf
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key_offset, key_len, value_offset, value_len = self._entry(mid)
+            candidate = buf[key_offset:key_offset + key_len]
+            if candidate < key:
+                lo = mid + 1
+            elif candidate > key:
+                hi = mid
+            else:
+                return buf[value_offset:value_offset + value_len].decode("utf-8")
+        return None
+
+    def __getitem__(self, key):
+        value = self._find(key) if isinstance(key, str) else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default = None):
+        value = self._find(key) if isinstance(key, str) else None
+        return default if value is None else value
+
+    def __contains__(self, key):
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __iter__(self):
+        buf = self._buf
+        for i in range(self._count):
+            key_offset, key_len, _, _ = self._entry(i)
+            yield buf[key_offset:key_offset + key_len].decode("utf-8")
+
+    def items(self):
+        buf = self._buf
+        for i in range(self._count):
+            key_offset, key_len, value_offset, value_len = self._entry(i)
+            yield (buf[key_offset:key_offset + key_len].decode("utf-8"),
+                   buf[value_offset:value_offset + value_len].decode("utf-8"))
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f"MappedDict(<{self._count} entries>)"
+
+def _pack_dict(dictionary, offset):
+    entries = sorted((k.encode("utf-8"), v.encode("utf-8")) for k, v in dictionary.items())
+    blob_offset = offset + _COUNT.size + len(entries) * _ENTRY.size
+    index = bytearray(_COUNT.pack(len(entries)))
+    blob = bytearray()
+    for key, value in entries:
+        key_offset = blob_offset + len(blob)
+        blob += key
+        value_offset = blob_offset + len(blob)
+        blob += value
+        index += _ENTRY.pack(key_offset, len(key), value_offset, len(value))
+    return bytes(index + blob)
+
+def pack_table(table):
+    """Serialise a transliteration table to the binary table format.
+
+    Args:
+        table (dict): Entry of TRANSLIT_DATA, with "translit_dict" and "translit_rules" keys.
+
+    Returns:
+        bytes: Table file contents.
+    """
+    sections = [(f"dict:{dir}", _DICT_SECTION, d) for dir, d in table.get("translit_dict", {}).items()]
+    if "translit_rules" in table:
+        sections.append(("translit_rules", _STR_SECTION, table["translit_rules"]))
+    offset = _HEADER.size + len(sections) * _SECTION.size
+    directory = bytearray(_HEADER.pack(MAGIC, VERSION, len(sections)))
+    body = bytearray()
+    for name, kind, data in sections:
+        directory += _SECTION.pack(name.encode("ascii"), kind, offset + len(body))
+        if kind == _DICT_SECTION:
+            body += _pack_dict(data, offset + len(body))
+        else:
+            encoded = data.encode("utf-8")
+            body += _COUNT.pack(len(encoded)) + encoded
+    return bytes(directory + body)
+
+def load_table_file(path):
+    """Memory-map a table file.
+
+    Args:
+        path (str | pathlib.Path): Table file.
+
+    Returns:
+        dict: Table with the same structure as an entry of TRANSLIT_DATA. Dictionaries are MappedDict instances.
+    """
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, count = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} transliteration table file")
+    table = {"translit_dict": {}}
+    for i in range(count):
+        name, kind, offset = _SECTION.unpack_from(buf, _HEADER.size + i * _SECTION.size)
+        name = name.rstrip(b"\0").decode("ascii")
+        if kind == _DICT_SECTION:
+            table["translit_dict"][name.split(":", 1)[1]] = MappedDict(buf, offset)
+        else:
+            (length,) = _COUNT.unpack_from(buf, offset)
+            start = offset + _COUNT.size
+            table[name] = buf[start:start + length].decode("utf-8")
+    return table
+
+def table_file_path(table_id, directory = None):
+    """Path of the table file for a table id.
+
+    Args:
+        table_id (str): Key of the table in TRANSLIT_DATA.
+        directory (str | pathlib.Path, optional): Directory of table files. Defaults to the EL_UTILITIES_TABLES environment variable, or the el_utilities.tables package.
+
+    Returns:
+        pathlib.Path: Table file path.
+    """
+    if directory is None:
+        directory = os.environ.get("EL_UTILITIES_TABLES") or pathlib.Path(__file__).parent / "tables"
+    return pathlib.Path(directory) / f"{table_id}{SUFFIX}"
+
+def build_table_file(table_id, directory = None):
+    """Compile a table of TRANSLIT_DATA to a table file.
+
+    Args:
+        table_id (str): Key of the table in TRANSLIT_DATA.
+        directory (str | pathlib.Path, optional): Output directory. Defaults to the location used by table_file_path().
+
+    Returns:
+        pathlib.Path: Path of the table file.
+    """
+    from .transliteration_data import TRANSLIT_DATA
+    path = table_file_path(table_id, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(pack_table(TRANSLIT_DATA.load_source(table_id)))
+    os.replace(tmp_path, path)
+    return path
+
+def main(argv = None):
+    from .transliteration_data import TRANSLIT_DATA
+    parser = argparse.ArgumentParser(prog="python -m el_utilities.tablefile", description="Compile transliteration tables to memory-mappable table files.")
+    parser.add_argument("table_ids", nargs="*", help="table ids to compile, defaults to all tables")
+    parser.add_argument("-o", "--output", help="output directory")
+    args = parser.parse_args(argv)
+    for table_id in args.table_ids or list(TRANSLIT_DATA):
+        print(build_table_file(table_id, args.output))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+Transliteration tables
+
+One module per table, named after the table id used in TRANSLIT_DATA. Each
+module defines TABLE, a dict with "translit_dict" and "translit_rules" entries.
+"""
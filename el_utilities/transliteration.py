@@ -1,7 +1,10 @@
-import regex, icu, collections, pathlib, sys
+import regex, icu, os, pathlib, sys
 import el_internationalisation as eli
 from .transliteration_data import SUPPORTED_TRANSLITERATORS, TRANSLIT_DATA
-import copy
+from .caching import PerThreadCache, ResultCache
+from .tablefile import MappedDict
+from . import instrumentation as _stats
+import collections, functools, hashlib, threading
 
 # TODO:
 #  * add type hinting
@@ -9,6 +12,21 @@ import copy
 
 DEFAULT_NF = "NFM21"
 
+# Normalisation forms supported by the dictionary based transliteration functions
+SUPPORTED_NF = ("NFC", "NFD", "NFKC", "NFKD", "NFKC_CF", "NFM21")
+
+def select_nf(nf):
+    """Resolve normalisation form, falling back to DEFAULT_NF for unsupported forms.
+
+    Args:
+        nf (str): Normalisation form.
+
+    Returns:
+        str: Normalisation form in SUPPORTED_NF.
+    """
+    nf = nf.upper()
+    return nf if nf in SUPPORTED_NF else DEFAULT_NF
+
 def toNFM21(text, engine="ud"):
     if engine.lower() == "icu":
         return eli.normalise("NFM21", text)
@@ -32,36 +50,453 @@ def prep_string(s, dir, lang, bicameral = "latin-only", nf = DEFAULT_NF):
         s = s.replace("\u0327", "\u0328").replace("\u031C", "\u0328")
     return s
 
+def _normalise(nf, s):
+    # eli.normalise(), timed when instrumentation is enabled
+    if _stats.enabled:
+        with _stats.timer("normalise"):
+            return eli.normalise(nf, s)
+    return eli.normalise(nf, s)
+
+###############################################
+#
+# Result cache
+#
+###############################################
+
+# Default maximum number of results kept by enable_result_cache()
+RESULT_CACHE_SIZE = 65536
+
+_result_cache = None
+
+def enable_result_cache(maxsize = RESULT_CACHE_SIZE, max_length = 256, shared_cache = None):
+    """Cache results of translit_dict(), translit_hybrid(), translit_icu() and translit_rules().
+
+    Results are cached by engine, table or transform, direction, normalisation
+    form and input, so repeated values, e.g. publisher names or subject headings
+    in catalogue data, are only transliterated once. The cache is shared by all
+    functions and threads. Functions returned by get_transliterator() use it if
+    they are created while it is enabled.
+
+    With shared_cache, results are also shared with other processes using the
+    same file, see el_utilities.sharedcache. Keys include the package version
+    and a hash of each table, and, for ICU transforms registered with
+    register_rules(), a hash of their rules, so results computed with other
+    data are not used. Registering rules that replace a transform with other
+    rules clears this process's results and makes the shared results stale for
+    all processes.
+
+    Args:
+        maxsize (int, optional): Maximum number of cached results, least recently used results are evicted. Defaults to RESULT_CACHE_SIZE.
+        max_length (int, optional): Inputs longer than this are not cached. Defaults to 256.
+        shared_cache (str | pathlib.Path | SharedResultCache, optional): Cache file, or cache, shared with other processes. Defaults to None.
+
+    Returns:
+        ResultCache: The cache. If already enabled, it is resized and kept.
+    """
+    global _result_cache
+    if isinstance(shared_cache, (str, pathlib.Path)):
+        from .sharedcache import SharedResultCache
+        shared_cache = SharedResultCache(shared_cache)
+    if _result_cache is None:
+        _result_cache = ResultCache(maxsize, max_length, shared_cache)
+    else:
+        _result_cache.resize(maxsize)
+        _result_cache.max_length = max_length
+        if shared_cache is not None:
+            _result_cache.shared = shared_cache
+    return _result_cache
+
+def disable_result_cache():
+    """Stop caching results and discard cached results."""
+    global _result_cache
+    _result_cache = None
+
+def get_result_cache():
+    """Result cache, see enable_result_cache().
+
+    Returns:
+        ResultCache | None: The cache, or None if disabled. Use its stats() method for hit rates.
+    """
+    return _result_cache
+
+# Versions of the tables used for language tags, see _table_key()
+_table_versions = {}
+
+# SHA-1 of the entries and rules of a table added with register_table()
+def _table_digest(table):
+    digest = hashlib.sha1()
+    for dir, dictionary in sorted(table.get("translit_dict", {}).items()):
+        digest.update(repr((dir, sorted(dictionary.items()))).encode("utf-8"))
+    digest.update(repr(table.get("translit_rules")).encode("utf-8"))
+    return digest.hexdigest()
+
+def _table_key(engine, lang, dir, nf):
+    # Result cache key prefix of translit_dict() and translit_hybrid(). The
+    # package version and a hash of the table module, or of an added table,
+    # identify the table, as results may be shared with processes using other
+    # versions.
+    version = _table_versions.get(lang)
+    if version is None:
+        from . import __version__
+        table_id = SUPPORTED_TRANSLITERATORS.get(get_lang_subtag(lang)[0], ("",))[0]
+        version = __version__
+        if table_id in TRANSLIT_DATA:
+            path = TRANSLIT_DATA.source_path(table_id)
+            if path is None:
+                version += ":" + _table_digest(TRANSLIT_DATA[table_id])
+            else:
+                with open(path, "rb") as f:
+                    version += ":" + hashlib.sha1(f.read()).hexdigest()
+        version = _table_versions.setdefault(lang, version)
+    return (engine, lang, dir, nf, version)
+
+# Hashes of rules registered by register_rules(), by transform ID
+_registered_rules = {}
+
+def _icu_key(transform):
+    # Result cache key prefix of translit_icu(): a hash of the rules if the
+    # transform was registered by register_rules(), else the ICU version.
+    return ("icu", transform, _registered_rules.get(transform, icu.ICU_VERSION), "")
+
+def _cached_translator(key, translate):
+    # Wrap a function from get_transliterator() to use the result cache, if enabled
+    cache = _result_cache
+    if cache is None:
+        return translate
+    return lambda s: cache.lookup(key + (s,), s, translate, s)
+
+###############################################
+#
+# Compiled transliteration tables
+#
+###############################################
+
+class LongestMatchReplacer:
+    """Single pass, leftmost-longest string replacement.
+
+    Keys of the mapping are stored in a character trie. The input is scanned once,
+    left to right, and at each position the longest matching key is replaced by
+    its value. Replacement text is never rescanned, so output does not depend on
+    the order of the mapping.
+
+    Args:
+        mapping (dict): Strings to replace, and their replacements.
+    """
+    _END = None
+
+    def __init__(self, mapping):
+        root = {}
+        for key, value in mapping.items():
+            if not key:
+                continue
+            node = root
+            for char in key:
+                node = node.setdefault(char, {})
+            node[self._END] = value
+        self._root = root
+
+    def sub(self, text, fallback = None):
+        """Replace all matches in text.
+
+        Args:
+            text (str): String to process.
+            fallback (Callable[[str], str], optional): Applied to each run of unmatched text, in the same pass. Defaults to None, leaving unmatched text unchanged.
+
+        Returns:
+            str: Processed string.
+        """
+        root = self._root
+        end_marker = self._END
+        n = len(text)
+        parts = []
+        start = 0
+        i = 0
+        while i < n:
+            node = root.get(text[i])
+            if node is None:
+                i += 1
+                continue
+            match_end = -1
+            match_value = None
+            j = i + 1
+            while True:
+                if end_marker in node:
+                    match_end = j
+                    match_value = node[end_marker]
+                if j == n:
+                    break
+                node = node.get(text[j])
+                if node is None:
+                    break
+                j += 1
+            if match_end == -1:
+                i += 1
+                continue
+            if start < i:
+                parts.append(text[start:i] if fallback is None else fallback(text[start:i]))
+            parts.append(match_value)
+            start = i = match_end
+        if fallback is not None:
+            if start < n:
+                parts.append(fallback(text[start:]))
+            return "".join(parts)
+        if not parts:
+            return text
+        parts.append(text[start:])
+        return "".join(parts)
+
+# Maximal runs of word and non-word characters, used to tokenise input for
+# reverse dictionary lookups.
+_TOKENS = regex.compile(r'\w+|\W+')
+_WORD_CHAR = regex.compile(r'\w')
+
+class TranslitTable:
+    """Transliteration table compiled for a single direction and normalisation form.
+
+    Entries are sorted, in reverse order, by collation sort key and keys and values
+    are normalised to `nf`, so input only needs normalising to the same form.
+    If the table is a memory-mapped table file whose entries are already in
+    `nf`, words are looked up in the file instead of a copy.
+    Instances are built by get_translit_table() and cached for the life of the
+    process.
+
+    Attributes:
+        table_id (str): Key of the table in TRANSLIT_DATA.
+        dir (str): Direction of the table, "forward" or "reverse".
+        nf (str): Normalisation form of keys and values.
+        word_dict (dict | MappedDict): Sorted and normalised transliteration dictionary, or the table file's dictionary.
+        matcher (LongestMatchReplacer): Matcher for the forward direction, otherwise None.
+        phrases (dict): For the reverse direction, entries spanning several tokens, e.g. "tāng tāng", indexed by their first token, longest first.
+        spaced_keys (list[str]): Keys containing whitespace, longest first, see spans().
+    """
+    def __init__(self, table_id, dir, nf = DEFAULT_NF):
+        self.table_id = table_id
+        self.dir = dir
+        self.nf = nf
+        _stats.count("table_builds")
+        source = TRANSLIT_DATA[table_id]['translit_dict'][dir]
+        if isinstance(source, MappedDict) and _is_normalised(nf, source):
+            # Keys are unique after normalisation, so order does not matter
+            self.word_dict = source
+        else:
+            lang = _table_lang(table_id)
+            with _stats.timer("collator_sort"):
+                if dir == "reverse" and lang in icu.Collator.getAvailableLocales().keys():
+                    collator = icu.Collator.createInstance(icu.Locale(lang))
+                else:
+                    collator = icu.Collator.createInstance(icu.Locale.getRoot())
+                entries = sorted(source.items(), reverse=True, key=lambda x: collator.getSortKey(x[0]))
+            with _stats.timer("table_normalise"):
+                self.word_dict = {eli.normalise(nf, k): eli.normalise(nf, v) for k, v in entries}
+        with _stats.timer("table_index"):
+            self.matcher = LongestMatchReplacer(self.word_dict) if dir == "forward" else None
+            self.phrases = {}
+            if dir == "reverse":
+                for key in self.word_dict:
+                    head = _TOKENS.match(key)
+                    if head is not None and head.end() < len(key):
+                        self.phrases.setdefault(head.group(), []).append((key, bool(_WORD_CHAR.match(key[-1]))))
+                for candidates in self.phrases.values():
+                    candidates.sort(key=lambda x: len(x[0]), reverse=True)
+            self.spaced_keys = sorted((key for key in self.word_dict if any(c.isspace() for c in key)), key=len, reverse=True)
+
+    def translate(self, source, fallback = None):
+        """Transliterate a prepared string using the table.
+
+        Matches and unmatched text are joined at word boundaries (reverse) or
+        between source and target script text (forward), so the result stays in the
+        table's normalisation form without normalising it again.
+
+        Args:
+            source (str): String, normalised to the table's normalisation form.
+            fallback (Callable[[str], str], optional): Applied to text not in the table: runs of unmatched text (forward) or unknown words (reverse). Its results should be in the table's normalisation form. Defaults to None, leaving such text unchanged.
+
+        Returns:
+            str: Transliterated string.
+        """
+        if _stats.enabled:
+            _stats.count("chars_processed", len(source))
+            with _stats.timer("tokenise_replace" if self.dir == "reverse" else "replace"):
+                return self._translate_tokens(source, fallback) if self.dir == "reverse" else self.matcher.sub(source, fallback)
+        if self.dir == "reverse":
+            return self._translate_tokens(source, fallback)
+        return self.matcher.sub(source, fallback)
+
+    def spans(self, before, after):
+        """Whether an entry containing whitespace may match across the end of before.
+
+        Used to split text into chunks that are transliterated separately, see
+        el_utilities.streaming. Entries are checked against the end of before
+        and the start of after, and an entry is assumed to match if after ends
+        part way through it, as more text may follow.
+
+        Args:
+            before (str): Text before the split point, ending with whitespace, not normalised.
+            after (str): Text after the split point, not normalised.
+
+        Returns:
+            bool: True if splitting could change the result.
+        """
+        if not self.spaced_keys:
+            return False
+        width = 2 * len(self.spaced_keys[0])
+        head = _normalise(self.nf, before[-width:])
+        text = head + _normalise(self.nf, after[:width])
+        pos = len(head)
+        for key in self.spaced_keys:
+            for i in range(max(pos - len(key) + 1, 0), pos):
+                segment = text[i:i + len(key)]
+                if segment == key or (i + len(key) > len(text) and key.startswith(segment)):
+                    return True
+        return False
+
+    def _match_phrase(self, source, start, candidates):
+        # Longest phrase at start, not ending part way through a word.
+        for key, ends_in_word in candidates:
+            if source.startswith(key, start):
+                end = start + len(key)
+                if not (ends_in_word and _WORD_CHAR.match(source, end)):
+                    return key
+        return None
+
+    def _translate_tokens(self, source, fallback = None):
+        word_dict = self.word_dict
+        if fallback is not None:
+            # Unknown words go to fallback, other tokens are kept
+            def lookup(token):
+                value = word_dict.get(token)
+                if value is None:
+                    return fallback(token) if _WORD_CHAR.match(token) else token
+                return value
+        else:
+            lookup = lambda token: word_dict.get(token, token)
+        if not self.phrases:
+            return "".join(lookup(m.group()) for m in _TOKENS.finditer(source))
+        phrases = self.phrases
+        parts = []
+        pos = 0
+        for token in _TOKENS.finditer(source):
+            start, end = token.span()
+            if end <= pos:
+                continue
+            if start < pos:
+                # Rest of a non-word run partly consumed by a phrase
+                parts.append(source[pos:end])
+                pos = end
+                continue
+            text = token.group()
+            candidates = phrases.get(text)
+            key = self._match_phrase(source, start, candidates) if candidates else None
+            if key is not None:
+                parts.append(word_dict[key])
+                pos = start + len(key)
+            else:
+                parts.append(lookup(text))
+                pos = end
+        return "".join(parts)
+
+    def __repr__(self):
+        return f"TranslitTable({self.table_id!r}, {self.dir!r}, {self.nf!r})"
+
+_TRANSLIT_TABLES = {}
+
+# Whether keys and values of a dictionary are all in normalisation form nf
+def _is_normalised(nf, dictionary):
+    with _stats.timer("table_normalise"):
+        return all(eli.normalise(nf, k) == k and eli.normalise(nf, v) == v for k, v in dictionary.items())
+
+def _table_lang(table_id):
+    for lang, translit_table in SUPPORTED_TRANSLITERATORS.items():
+        if translit_table[0] == table_id:
+            return lang
+    return ""
+
+def get_translit_table(table_id, dir = "forward", nf = DEFAULT_NF):
+    """Get compiled transliteration table, building it on first use.
+
+    Args:
+        table_id (str): Key of the table in TRANSLIT_DATA.
+        dir (str, optional): Direction, "forward" or "reverse". Defaults to "forward".
+        nf (str, optional): Normalisation form of table entries. Defaults to DEFAULT_NF.
+
+    Returns:
+        TranslitTable: Compiled table, shared by all callers.
+    """
+    key = (table_id, dir, nf)
+    table = _TRANSLIT_TABLES.get(key)
+    if _stats.enabled:
+        _stats.count("table_cache_misses" if table is None else "table_cache_hits")
+    if table is None:
+        with _stats.timer("table_build"):
+            table = _TRANSLIT_TABLES.setdefault(key, TranslitTable(table_id, dir, nf))
+    return table
+
+def prebuild_translit_tables(langs = None, nf = DEFAULT_NF):
+    """Eagerly build compiled tables, e.g. at application startup.
+
+    Args:
+        langs (list[str], optional): Language subtags to build tables for. Defaults to all entries in SUPPORTED_TRANSLITERATORS with a table.
+        nf (str | list[str], optional): Normalisation form, or forms, of table entries. Use SUPPORTED_NF to build every form. Defaults to DEFAULT_NF.
+
+    Returns:
+        list[TranslitTable]: Compiled tables.
+    """
+    if langs is None:
+        langs = SUPPORTED_TRANSLITERATORS.keys()
+    forms = [nf] if isinstance(nf, str) else list(nf)
+    tables = []
+    for lang in langs:
+        table_id = SUPPORTED_TRANSLITERATORS[lang][0]
+        if not table_id:
+            continue
+        for form in forms:
+            for dir in ("forward", "reverse"):
+                tables.append(get_translit_table(table_id, dir, select_nf(form)))
+    return tables
+
+def clear_translit_tables():
+    """Discard all compiled transliteration tables."""
+    _TRANSLIT_TABLES.clear()
+
+def register_table(table_id, table):
+    """Add, replace or remove a transliteration table.
+
+    Compiled tables and rule based fallbacks of translit_hybrid() built from a
+    table of the same id are discarded. Cached results are keyed by a hash of
+    the table, so results of the table it replaces are not used. Add the table
+    to SUPPORTED_TRANSLITERATORS to use it for a language.
+
+    Args:
+        table_id (str): Table id.
+        table (dict | None): Table with the same structure as the entries of TRANSLIT_DATA, e.g. {"translit_dict": {"forward": {...}, "reverse": {...}}, "translit_rules": "..."}. None removes a table added before, making any table module of that id available again.
+    """
+    if table is None:
+        del TRANSLIT_DATA[table_id]
+    else:
+        TRANSLIT_DATA[table_id] = table
+    for key in [key for key in list(_TRANSLIT_TABLES) if key[0] == table_id]:
+        _TRANSLIT_TABLES.pop(key, None)
+    for key in [key for key in list(_hybrid_fallbacks) if key[0] == table_id]:
+        _hybrid_fallbacks.pop(key, None)
+    _table_versions.clear()
+
 def el_transliterate(source, lang, dir = "forward", nf = DEFAULT_NF):
-    lang = lang.replace("-", "_").split('_')[0]
+    lang = get_lang_subtag(lang).language
     dir = dir.lower()
     if dir != "reverse":
         dir = "forward"
     if SUPPORTED_TRANSLITERATORS[lang]:
         translit_table = SUPPORTED_TRANSLITERATORS[lang]
-        nf = nf.upper() if nf.upper() in ["NFC", "NFKC", "NFKC_CF", "NFD", "NFKD", "NFM"] else DEFAULT_NF
-        source = prep_string(source, dir, lang, translit_table[1])
-        if dir == "forward":
-            collator = icu.Collator.createInstance(icu.Locale.getRoot())
-        else:
-            collator = icu.Collator.createInstance(icu.Locale(lang))
-        if dir == "reverse" and lang in list(icu.Collator.getAvailableLocales().keys()):
-            collator = icu.Collator.createInstance(icu.Locale(lang))
-        else:
-            collator = icu.Collator.createInstance(icu.Locale.getRoot())
-        word_dict = collections.OrderedDict(sorted(TRANSLIT_DATA[translit_table[0]]['translit_dict'][dir].items(), reverse=True, key=lambda x: collator.getSortKey(x[0])))
-        word_dict = {eli.normalise(DEFAULT_NF, k): eli.normalise(DEFAULT_NF, v) for k, v in word_dict.items()}
-        label = translit_table[2]
-        if dir == "reverse":
-            source_split = regex.split('(\W+?)', source)
-            res = "".join(word_dict.get(ele, ele) for ele in source_split)
-        else:
-            from functools import reduce
-            res = reduce(lambda x, y: x.replace(y, word_dict[y]), word_dict, source)
+        nf = select_nf(nf)
+        with _stats.timer("prep"):
+            source = prep_string(source, dir, lang, translit_table[1])
+        if nf != DEFAULT_NF:
+            source = _normalise(nf, source)
+        res = get_translit_table(translit_table[0], dir, nf).translate(source)
     else:
         res = source
-    if nf != DEFAULT_NF:
-        res = eli.normalise(nf, res)
+        if nf != DEFAULT_NF:
+            res = eli.normalise(nf, res)
     return res
 
 ###############################################
@@ -70,6 +505,17 @@ def el_transliterate(source, lang, dir = "forward", nf = DEFAULT_NF):
 #
 ###############################################
 
+# Maximum number of ICU transliterators kept by get_icu_transformer(), per thread
+ICU_CACHE_SIZE = 64
+
+# ICU transliterators must not be shared between threads while transliterating,
+# so each thread keeps its own instances.
+_icu_transformers = PerThreadCache(ICU_CACHE_SIZE)
+_available_ids = None
+
+# Functions registering transforms on demand, see add_transform_resolver()
+_transform_resolvers = []
+
 # Available transforms
 def available_transforms(term = None):
     available = list(icu.Transliterator.getAvailableIDs())
@@ -77,16 +523,109 @@ def available_transforms(term = None):
         return available
     return [x for x in available if term.lower() in x.lower()]
 
+def is_available_transform(transform):
+    """Check if transform ID is available, using a cached set of IDs.
+
+    Transforms that are not registered yet are offered to the resolvers added
+    with add_transform_resolver(), which may register them on demand.
+
+    Args:
+        transform (str): ICU transform ID.
+
+    Returns:
+        bool: True if transform is registered with ICU.
+    """
+    global _available_ids
+    if _available_ids is None:
+        _available_ids = frozenset(icu.Transliterator.getAvailableIDs())
+    if transform in _available_ids:
+        return True
+    return any(resolver(transform) for resolver in _transform_resolvers)
+
+def add_transform_resolver(resolver):
+    """Add function registering transforms on demand, e.g. LDMLRegistry.resolve().
+
+    Args:
+        resolver (Callable[[str], bool]): Called with a transform ID that is not registered. Returns True if it registered the transform.
+    """
+    if resolver not in _transform_resolvers:
+        _transform_resolvers.append(resolver)
+
+def remove_transform_resolver(resolver):
+    """Remove function added with add_transform_resolver().
+
+    Args:
+        resolver (Callable[[str], bool]): Resolver to remove.
+    """
+    _transform_resolvers.remove(resolver)
+
+def get_icu_transformer(transform):
+    """Get ICU transliterator for transform ID, creating it on first use.
+
+    Transliterators are cached per thread, so the result is safe to use in the
+    calling thread but should not be handed to other threads.
+
+    Args:
+        transform (str): ICU transform ID.
+
+    Returns:
+        icu.Transliterator: Cached transliterator.
+    """
+    cache = _icu_transformers.local()
+    transformer = cache.get(transform)
+    if _stats.enabled:
+        _stats.count("icu_cache_misses" if transformer is None else "icu_cache_hits")
+    if transformer is None:
+        with _stats.timer("icu_create"):
+            transformer = icu.Transliterator.createInstance(transform)
+        cache.put(transform, transformer)
+    return transformer
+
+def set_transform_cache_size(maxsize):
+    """Set maximum number of cached ICU transliterators, per thread.
+
+    Args:
+        maxsize (int): Maximum number of cached transliterators.
+    """
+    _icu_transformers.resize(maxsize)
+
+def clear_transform_cache():
+    """Discard cached ICU transliterators and available transform IDs."""
+    global _available_ids
+    _available_ids = None
+    _icu_transformers.clear()
+
 # transliterate from inbuilt ICU transform
 def translit_icu(source, transform):
-    if transform not in available_transforms():
+    if not is_available_transform(transform):
         print(f'Unsupported transformation. Not available in icu4c {icu.ICU_VERSION}')
         return
-    transformer = icu.Transliterator.createInstance(transform)
+    transformer = get_icu_transformer(transform)
+    cache = _result_cache
+    if cache is not None:
+        transliterate = transformer.transliterate
+        if isinstance(source, list):
+            key = _icu_key(transform)
+            return [cache.lookup(key + (item,), item, transliterate, item) for item in source]
+        return cache.lookup(_icu_key(transform) + (source,), source, transliterate, source)
     if isinstance(source, list):
         return [transformer.transliterate(item) for item in source]
     return transformer.transliterate(source)
 
+_LDML_SPACING = regex.compile(r'[ \t]{2,}|[ ]*#.+\n')
+_LDML_LINE_BREAKS = regex.compile('[\n#]')
+
+def clean_ldml_rules(text):
+    """Strip comments, line breaks and runs of spaces from LDML tRule text.
+
+    Args:
+        text (str): Content of a tRule element.
+
+    Returns:
+        str: Rules.
+    """
+    return _LDML_LINE_BREAKS.sub('', _LDML_SPACING.sub('', text))
+
 # READ transliteration rules from LDML file
 def read_ldml_rules(ldml_file):
     """Read transliteration rules from LDML file
@@ -106,9 +645,7 @@ def read_ldml_rules(ldml_file):
             r = doc.find('./transforms/transform')
         if r is None:
             sys.stderr(f"Can't find transform in {rules_file}")
-        pattern = regex.compile(r'[ \t]{2,}|[ ]*#.+\n')
-        rules = regex.sub(pattern, '', r.find('./tRule').text)
-        rules = regex.sub('[\n#]', '', rules)
+        rules = clean_ldml_rules(r.find('./tRule').text)
         rules_name = r.attrib['alias'].split()[0]
         reverse_name = ''
         # if r.attrib['backwardAlias']:
@@ -118,14 +655,120 @@ def read_ldml_rules(ldml_file):
     rules_tuple = get_ldml_rules(ldml_file)
     return rules_tuple
 
+# Register transformer compiled from rules
+def register_rules(name, rules, direction = icu.UTransDirection.FORWARD):
+    """Compile rules and register the transliterator with ICU.
+
+    Args:
+        name (str): Transform ID to register.
+        rules (str): Transformation rules.
+        direction (int, optional): Direction of transformation (forward or reverse). Defaults to icu.UTransDirection.FORWARD.
+    """
+    with _stats.timer("icu_compile"):
+        transformer = icu.Transliterator.createFromRules(name, rules, direction)
+    _register_transformer(name, rules, direction, transformer)
+
+def _register_transformer(name, rules, direction, transformer):
+    # Register a transliterator compiled from rules with ICU, and discard what
+    # was cached for the transform it replaces. Cached results are keyed by the
+    # rules of the transform itself, so they only need discarding, for
+    # transforms that reference it, when it replaces a transform with other rules.
+    previous = _registered_rules.get(name)
+    replaced = previous is not None or is_available_transform(name)
+    icu.Transliterator.registerInstance(transformer)
+    digest = f"{int(direction)}:{_rules_digest(rules)}"
+    _registered_rules[name] = digest
+    clear_transform_cache()
+    if replaced and digest != previous and _result_cache is not None:
+        _result_cache.clear()
+        if _result_cache.shared is not None:
+            _result_cache.shared.bump_generation()
+
 # Register transformer form LDML file
 def register_ldml(ldml_file):
     ldml_rules = read_ldml_rules(ldml_file)
-    ldml_transformer = icu.Transliterator.createFromRules(ldml_rules[1], ldml_rules[0], icu.UTransDirection.FORWARD)
-    icu.Transliterator.registerInstance(ldml_transformer)
+    register_rules(ldml_rules[1], ldml_rules[0], icu.UTransDirection.FORWARD)
     if ldml_rules[2]:
-        reverse_ldml_transformer = icu.Transliterator.createFromRules(ldml_rules[2], ldml_rules[0], icu.UTransDirection.REVERSE)
-        icu.Transliterator.registerInstance(reverse_ldml_transformer)
+        register_rules(ldml_rules[2], ldml_rules[0], icu.UTransDirection.REVERSE)
+
+# Maximum number of compiled rule based transliterators kept by get_rules_transformer(), per thread
+RULES_CACHE_SIZE = 32
+
+_rules_transformers = PerThreadCache(RULES_CACHE_SIZE)
+
+# SHA-1 of rules, memoised as the same rules are passed on every call
+@functools.lru_cache(maxsize=RULES_CACHE_SIZE)
+def _rules_digest(rules):
+    return hashlib.sha1(rules.encode("utf-8")).hexdigest()
+
+def _rules_key(rules, direction, name):
+    return (_rules_digest(rules), int(direction), name)
+
+def get_rules_transformer(rules, direction = icu.UTransDirection.FORWARD, name = "Custom"):
+    """Get transliterator compiled from custom rules, compiling it on first use.
+
+    Compiled transliterators are cached per thread, by a hash of the rules, the
+    direction and the label. The result should not be handed to other threads.
+
+    Args:
+        rules (str): Rules to use for transformation.
+        direction (int, optional): Direction of transformation (forward or reverse). Defaults to icu.UTransDirection.FORWARD.
+        name (str, optional): Label for transformation. Defaults to "Custom".
+
+    Returns:
+        icu.Transliterator: Cached transliterator.
+    """
+    key = _rules_key(rules, direction, name)
+    cache = _rules_transformers.local()
+    transformer = cache.get(key)
+    if _stats.enabled:
+        _stats.count("rules_cache_misses" if transformer is None else "rules_cache_hits")
+    if transformer is None:
+        transformer = _rules_transformers.take_spare(key)
+        if transformer is None:
+            with _stats.timer("icu_compile"):
+                transformer = icu.Transliterator.createFromRules(name, rules, direction)
+        cache.put(key, transformer)
+    return transformer
+
+def warm_rules_cache(rule_sets, threads = None):
+    """Compile transliterators for rule sets, e.g. at application startup.
+
+    One transliterator per rule set is cached for the calling thread, and
+    `threads` more are kept as spares, each handed to the first other thread
+    that asks for the rule set. Compilation is then done up front, for the
+    worker threads of a thread pool as well.
+
+    Args:
+        rule_sets (list[str | tuple]): Rules, or tuples of arguments for get_rules_transformer(), i.e. (rules, direction, name).
+        threads (int, optional): Number of other threads to compile transliterators for. Defaults to the default number of workers of concurrent.futures.ThreadPoolExecutor.
+    """
+    if threads is None:
+        threads = min(32, (os.cpu_count() or 1) + 4)
+    for rule_set in rule_sets:
+        if isinstance(rule_set, str):
+            rule_set = (rule_set,)
+        _warm_rules(threads, *rule_set)
+
+def _warm_rules(threads, rules, direction = icu.UTransDirection.FORWARD, name = "Custom"):
+    get_rules_transformer(rules, direction, name)
+    key = _rules_key(rules, direction, name)
+    for _ in range(threads - _rules_transformers.spares(key)):
+        with _stats.timer("icu_compile"):
+            _rules_transformers.add_spare(key, icu.Transliterator.createFromRules(name, rules, direction))
+
+def set_rules_cache_size(maxsize):
+    """Set maximum number of cached rule based transliterators, per thread.
+
+    Args:
+        maxsize (int): Maximum number of cached transliterators.
+    """
+    _rules_transformers.resize(maxsize)
+
+def clear_rules_cache():
+    """Discard cached rule based transliterators, spares added by warm_rules_cache() and the rule based fallbacks of translit_hybrid()."""
+    _rules_transformers.clear()
+    _hybrid_fallbacks.clear()
 
 # transform from custom rules
 def translit_rules(source, rules, direction = icu.UTransDirection.FORWARD, name = "Custom"):
@@ -140,7 +783,14 @@ def translit_rules(source, rules, direction = icu.UTransDirection.FORWARD, name
     Returns:
         str | list[str]: Transformed string or list.
     """
-    transformer = icu.Transliterator.createFromRules(name, rules, direction)
+    transformer = get_rules_transformer(rules, direction, name)
+    cache = _result_cache
+    if cache is not None:
+        transliterate = transformer.transliterate
+        key = ("rules",) + _rules_key(rules, direction, name)
+        if isinstance(source, list):
+            return [cache.lookup(key + ("", item), item, transliterate, item) for item in source]
+        return cache.lookup(key + ("", source), source, transliterate, source)
     if isinstance(source, list):
         return [transformer.transliterate(item) for item in source]
     return transformer.transliterate(source)
@@ -165,64 +815,250 @@ def set_ldml_file_path(raw_path):
     else:
         print("LDML does not exist.")
 
+# Components of a BCP-47 language tag or locale label, see get_lang_subtag()
+LanguageTag = collections.namedtuple("LanguageTag", ["language", "script", "region", "variants"])
+
+_SCRIPT_SUBTAG = regex.compile(r"^([A-Z][a-z]{3})$")
+_REGION_SUBTAG = regex.compile(r"^([A-Z]{2})$")
+
 # Get language subtag form a BCP-47 langauge tage or from a locale label
+@functools.lru_cache(maxsize=1024)
 def get_lang_subtag(lang):
+    """Split BCP-47 language tag or locale label into its components.
+
+    Results are memoised by input string.
+
+    Args:
+        lang (str): Language tag or locale label, e.g. "lo-Laoo-LA" or "lo_LA".
+
+    Returns:
+        LanguageTag: Named tuple of language, script, region and remaining subtags joined by "-".
+    """
     subtags = lang.replace("-", "_").split('_')
-    remainder = copy.deepcopy(subtags)
-    lang_subtag = subtags[0]
-    remainder.pop(0)
+    remainder = subtags[1:]
     script_subtag = ""
     country_subtag = ""
-    # if len(subtags) > 1:
     if 1 < len(subtags):
-        if bool(regex.match(r"^([A-Z][a-z]{3})$", subtags[1])):
+        if _SCRIPT_SUBTAG.match(subtags[1]):
             script_subtag = subtags[1]
             remainder.pop(0)
-        elif bool(regex.match(r"^([A-Z]{2})$", subtags[1])):
+        elif _REGION_SUBTAG.match(subtags[1]):
             country_subtag = subtags[1]
             remainder.pop(0)
     if 2 < len(subtags):
-        if bool(regex.match(r"^([A-Z]{2})$", subtags[2])):
+        if _REGION_SUBTAG.match(subtags[2]):
             country_subtag = subtags[2]
             remainder.pop(0)
-    remainder_str = "-".join(remainder) if len(remainder) > 0 else ""
-    return (lang_subtag, script_subtag, country_subtag, remainder_str)
+    return LanguageTag(subtags[0], script_subtag, country_subtag, "-".join(remainder))
+
+def get_lang_subtags(langs):
+    """Split a batch of language tags, see get_lang_subtag().
+
+    Args:
+        langs (Iterable[str]): Language tags or locale labels.
+
+    Returns:
+        list[LanguageTag]: Parsed tags, in input order.
+    """
+    return [get_lang_subtag(lang) for lang in langs]
 
 # transform using dictionary
 def translit_dict(source, lang, dir = "forward", nf = DEFAULT_NF):
+    if _result_cache is not None:
+        return _result_cache.lookup(_table_key("dict", lang, dir, nf) + (source,), source, _translit_dict, source, lang, dir, nf)
+    return _translit_dict(source, lang, dir, nf)
+
+def _translit_dict(source, lang, dir, nf):
     lang = get_lang_subtag(lang)[0]
     dir = "forward" if dir.lower() != "reverse" else "reverse"
     if SUPPORTED_TRANSLITERATORS[lang]:
         translit_table = SUPPORTED_TRANSLITERATORS[lang]
-        nf = nf.upper() if nf.upper() in ["NFC", "NFKC", "NFKC_CF", "NFD", "NFKD", "NFM21"] else DEFAULT_NF
-        # source = prep_string(source, dir, lang, translit_table[1])
-        # if dir == "forward":
-        #     collator = icu.Collator.createInstance(icu.Locale.getRoot())
-        # else:
-        #     collator = icu.Collator.createInstance(icu.Locale(lang))
-        # if dir == "reverse" and lang in list(icu.Collator.getAvailableLocales().keys()):
-        #     collator = icu.Collator.createInstance(icu.Locale(lang))
-        # else:
-        #     collator = icu.Collator.createInstance(icu.Locale.getRoot())
-        if dir == "reverse" and lang in list(icu.Collator.getAvailableLocales().keys()):
-            collator = icu.Collator.createInstance(icu.Locale(lang))
-        else:
-            collator = icu.Collator.createInstance(icu.Locale.getRoot())
-        word_dict = collections.OrderedDict(sorted(TRANSLIT_DATA[translit_table[0]]['translit_dict'][dir].items(), reverse=True, key=lambda x: collator.getSortKey(x[0])))
-        word_dict = {eli.normalise(DEFAULT_NF, k): eli.normalise(DEFAULT_NF, v) for k, v in word_dict.items()}
-        label = translit_table[2]
-        if dir == "reverse":
-            source_split = regex.split('(\W+?)', source)
-            res = "".join(word_dict.get(ele, ele) for ele in source_split)
-        else:
-            from functools import reduce
-            res = reduce(lambda x, y: x.replace(y, word_dict[y]), word_dict, source)
+        nf = select_nf(nf)
+        res = get_translit_table(translit_table[0], dir, nf).translate(_normalise(nf, source))
     else:
         res = source
-    if nf != DEFAULT_NF:
-        res = eli.normalise(nf, res)
+        if nf != DEFAULT_NF:
+            res = eli.normalise(nf, res)
     return res
 
+def _dict_translator(lang, dir = "forward", nf = DEFAULT_NF, prep = False):
+    # Resolve language, table and normalisation form once, returning a
+    # function equivalent to translit_dict(), or el_transliterate() if prep.
+    lang = get_lang_subtag(lang)[0]
+    dir = "forward" if dir.lower() != "reverse" else "reverse"
+    if not SUPPORTED_TRANSLITERATORS[lang]:
+        if nf != DEFAULT_NF:
+            return lambda s: eli.normalise(nf, s)
+        return lambda s: s
+    translit_table = SUPPORTED_TRANSLITERATORS[lang]
+    nf = select_nf(nf)
+    translate = get_translit_table(translit_table[0], dir, nf).translate
+    if prep:
+        bicameral = translit_table[1]
+        if nf != DEFAULT_NF:
+            return lambda s: translate(_normalise(nf, prep_string(s, dir, lang, bicameral)))
+        return lambda s: translate(prep_string(s, dir, lang, bicameral))
+    return lambda s: translate(_normalise(nf, s))
+
+# transform batch of strings using dictionary
+def translit_dict_batch(sources, lang, dir = "forward", nf = DEFAULT_NF, prep = False):
+    """Dictionary based transliteration of a batch of strings.
+
+    Language resolution, table lookup and normalisation form selection are done
+    once for the whole batch. Items that are not strings, e.g. missing values in
+    a pandas column, are returned unchanged.
+
+    Args:
+        sources (Iterable[str]): Strings to transliterate. Any iterable, NumPy array or pandas Series.
+        lang (str): BCP-47 language tag or locale label.
+        dir (str, optional): Direction of transliteration, "forward" or "reverse". Defaults to "forward".
+        nf (str, optional): Normalisation form of the results. Defaults to DEFAULT_NF.
+        prep (bool, optional): Prepare each string with prep_string() first, as el_transliterate() does. Defaults to False.
+
+    Returns:
+        list[str] | pandas.Series: Transliterated strings, in input order. A pandas Series is returned for a Series input, keeping its index and name.
+    """
+    translate = _cached_translator(_table_key("dict_prep" if prep else "dict", lang, dir, nf), _dict_translator(lang, dir, nf, prep))
+    items = sources.tolist() if hasattr(sources, "tolist") else sources
+    results = [translate(item) if isinstance(item, str) else item for item in items]
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(sources, pd.Series):
+        return pd.Series(results, index=sources.index, name=sources.name)
+    return results
+
+# Fallbacks of translit_hybrid(), by table id, direction and normalisation form
+_hybrid_fallbacks = {}
+
+def _hybrid_fallback(lang, dir, nf):
+    # Rule based transliteration of text missing from the table of lang, in the
+    # table's normalisation form, or None if the table has no rules or they
+    # cannot be compiled.
+    table_id = SUPPORTED_TRANSLITERATORS[lang][0]
+    key = (table_id, dir, nf)
+    if key in _hybrid_fallbacks:
+        return _hybrid_fallbacks[key]
+    fallback = None
+    rules = TRANSLIT_DATA[table_id].get("translit_rules")
+    if rules:
+        direction = icu.UTransDirection.REVERSE if dir == "reverse" else icu.UTransDirection.FORWARD
+        try:
+            transliterate = _thread_transliterator(functools.partial(get_rules_transformer, rules, direction, table_id))
+        except icu.ICUError as e:
+            print(f"Rules of {table_id} cannot be compiled, using the dictionary only: {e}")
+        else:
+            fallback = lambda s: _normalise(nf, transliterate(s))
+    return _hybrid_fallbacks.setdefault(key, fallback)
+
+# transform using dictionary, falling back to rules for text not in the dictionary
+def translit_hybrid(source, lang, dir = "forward", nf = DEFAULT_NF):
+    """Dictionary based transliteration, with rule based transliteration of text missing from the dictionary.
+
+    The compiled table and the compiled rules of the language's entry in
+    SUPPORTED_TRANSLITERATORS are both cached. Input is scanned once: text
+    matched by the table (forward) or words found in it (reverse) are replaced
+    by their table entries, and only the remaining text is passed to the rules.
+    If the table has no rules, or they cannot be compiled, this is the same as
+    translit_dict().
+
+    Args:
+        source (str): String to transliterate.
+        lang (str): BCP-47 language tag or locale label.
+        dir (str, optional): Direction of transliteration, "forward" or "reverse". Defaults to "forward".
+        nf (str, optional): Normalisation form of the result. Defaults to DEFAULT_NF.
+
+    Returns:
+        str: Transliterated string.
+    """
+    if _result_cache is not None:
+        return _result_cache.lookup(_table_key("hybrid", lang, dir, nf) + (source,), source, _translit_hybrid, source, lang, dir, nf)
+    return _translit_hybrid(source, lang, dir, nf)
+
+def _translit_hybrid(source, lang, dir, nf):
+    lang = get_lang_subtag(lang)[0]
+    dir = "forward" if dir.lower() != "reverse" else "reverse"
+    if not SUPPORTED_TRANSLITERATORS[lang]:
+        return _translit_dict(source, lang, dir, nf)
+    nf = select_nf(nf)
+    table = get_translit_table(SUPPORTED_TRANSLITERATORS[lang][0], dir, nf)
+    return table.translate(_normalise(nf, source), _hybrid_fallback(lang, dir, nf))
+
+def _hybrid_translator(lang, dir = "forward", nf = DEFAULT_NF):
+    # Resolve table and rules once, returning a function equivalent to translit_hybrid()
+    lang = get_lang_subtag(lang)[0]
+    dir = "forward" if dir.lower() != "reverse" else "reverse"
+    if not SUPPORTED_TRANSLITERATORS[lang]:
+        return _dict_translator(lang, dir, nf)
+    nf = select_nf(nf)
+    translate = get_translit_table(SUPPORTED_TRANSLITERATORS[lang][0], dir, nf).translate
+    fallback = _hybrid_fallback(lang, dir, nf)
+    return lambda s: translate(_normalise(nf, s), fallback)
+
+def _with_spans(translate, lang, dir, nf):
+    # Set translate.spans to TranslitTable.spans() of the table used, if any,
+    # so text can be split where no entry matches across the split.
+    lang = get_lang_subtag(lang)[0]
+    if SUPPORTED_TRANSLITERATORS.get(lang):
+        dir = "forward" if dir.lower() != "reverse" else "reverse"
+        translate.spans = get_translit_table(SUPPORTED_TRANSLITERATORS[lang][0], dir, select_nf(nf)).spans
+    return translate
+
+def _thread_transliterator(factory):
+    # transliterate() of the transliterator returned by factory, called once in
+    # each thread using the function, as transliterators must not be shared
+    # between threads.
+    local = threading.local()
+    local.transliterate = factory().transliterate
+    def transliterate(s):
+        try:
+            func = local.transliterate
+        except AttributeError:
+            func = local.transliterate = factory().transliterate
+        return func(s)
+    return transliterate
+
+# Engines supported by get_transliterator()
+TRANSLIT_ENGINES = ("dict", "hybrid", "icu", "ldml", "rules")
+
+def get_transliterator(engine, target, dir = "forward", nf = DEFAULT_NF):
+    """Get a reusable transliteration function for an engine.
+
+    All setup (table compilation, transliterator creation, rule compilation) is
+    done once, when the function is created. If the result cache is enabled at
+    that time, the function uses it, see enable_result_cache(). The function can
+    be called from any thread: ICU transliterators are created once per thread
+    calling it.
+
+    Args:
+        engine (str): One of TRANSLIT_ENGINES. "dict" uses translit_dict() tables, "hybrid" translit_hybrid() tables and rules, "icu" an ICU transform ID, "ldml" an LDML file and "rules" custom rules.
+        target (str): Language tag ("dict", "hybrid"), transform ID ("icu"), path to LDML file ("ldml") or rules ("rules").
+        dir (str, optional): Direction, "forward" or "reverse". Ignored by "icu", where the direction is part of the transform ID. Defaults to "forward".
+        nf (str, optional): Normalisation form, used by "dict" and "hybrid". Defaults to DEFAULT_NF.
+
+    Raises:
+        ValueError: Unknown engine or unavailable ICU transform.
+
+    Returns:
+        Callable[[str], str]: Transliteration function. For "dict" and "hybrid", its `spans` attribute is TranslitTable.spans() of the table used.
+    """
+    engine = engine.lower()
+    if engine == "dict":
+        return _with_spans(_cached_translator(_table_key("dict", target, dir, nf), _dict_translator(target, dir, nf)), target, dir, nf)
+    if engine == "hybrid":
+        return _with_spans(_cached_translator(_table_key("hybrid", target, dir, nf), _hybrid_translator(target, dir, nf)), target, dir, nf)
+    if engine == "icu":
+        if not is_available_transform(target):
+            raise ValueError(f'Unsupported transformation. Not available in icu4c {icu.ICU_VERSION}')
+        return _cached_translator(_icu_key(target), _thread_transliterator(functools.partial(get_icu_transformer, target)))
+    direction = icu.UTransDirection.REVERSE if dir.lower() == "reverse" else icu.UTransDirection.FORWARD
+    if engine == "ldml":
+        rules, name, reverse_name = read_ldml_rules(target)
+        if direction == icu.UTransDirection.REVERSE and reverse_name:
+            name = reverse_name
+        return _cached_translator(("rules",) + _rules_key(rules, direction, name) + ("",), _thread_transliterator(functools.partial(get_rules_transformer, rules, direction, name)))
+    if engine == "rules":
+        return _cached_translator(("rules",) + _rules_key(target, direction, "Custom") + ("",), _thread_transliterator(functools.partial(get_rules_transformer, target, direction)))
+    raise ValueError(f"Unknown transliteration engine {engine!r}, expected one of {', '.join(TRANSLIT_ENGINES)}")
+
 # el_transliterate = translit_dict
 
 #
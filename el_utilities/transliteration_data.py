@@ -1,3 +1,5 @@
+import collections.abc, importlib, importlib.util, os, pkgutil
+
 SUPPORTED_TRANSLITERATORS = {
     "bo": ("", "latin_only", ""),
     "kh": ("", "latin_only", ""),
@@ -6,1409 +8,109 @@ SUPPORTED_TRANSLITERATORS = {
     "th": ("", "latin_only", "")
 }
 
-TRANSLIT_DATA = {
-    "und_latn_t_lo_m0_ALALOC_2012": {
-        "translit_dict": {
-            "reverse": {
-                "ʻǭlabūn": "ອໍລະບູນ",
-                "ʻōkāt": "ໂອກາດ",
-                "ʻīngsai": "ອີງໃສ່",
-                "ʻēkasān": "ເອກະສານ",
-                "ʻārun": "ອາຣຸນ",
-                "ʻār": "ອາຣ",
-                "ʻānāchak": "ອານາຈັກ",
-                "ʻānanthō": "ອານັນໂທ",
-                "ʻān": "ອ່າ",
-                "ʻāchānnyai": "ອາຈານໃຫຍ່",
-                "ʻutsāhakam": "ອຸດສາຫະກຳ",
-                "ʻuthai": "ອຸໄທ",
-                "ʻudomkān": "ອຸດົມການ",
-                "ʻophom": "ອົບຮົມ",
-                "ʻongkān": "ອົງການ",
-                "ʻinthavong": "ອິນທະວົງສ໌",
-                "ʻinsīsīangmai": "ອິນສີຊຽງໃໝ່",
-                "ʻattā": "ອັດຕາ",
-                "ʻapphayasap": "ອັພຍຍສັພທ໌",
-                "ʻao": "ເອົາ",
-                "ʻanuvong": "ອະນຸວົງ",
-                "ʻanusāvalī": "ອະນຸສາວະລີ",
-                "ʻangkit": "ວົງກິດ",
-                "ʻan": "ອັນ",
-                "ʻamthilǭ": "ອຳທິລອ",
-                "ʻamnāt": "ອຳນາດ",
-                "ʻalun": "ອະລຸນ",
-                "ʻaksǭnsin": "ອັກສອນສິລປ໌",
-                "ʻakkharavithī": "ອັກຂຣະວິທີ",
-                "ʹāchān": "ອາຈານ",
-                "yǭt": "ຢອດ",
-                "yưt": "ຍຶດ",
-                "yū": "ຢູ່",
-                "yēsū": "ເຢຊູ",
-                "yuttitham": "ຍຸຕິທຳ",
-                "xaixana": "ໄຊຊະນະ",
-                "vǭrachit": "ວໍຣະຈິດ",
-                "vǭlachit": "ວໍລະຈິດ",
-                "vœ̄nvīlāvong": "ເວີ່ນວິລາວົງ",
-                "vīravong": "ວີຣະວົງສ໌",
-                "vīlason": "ວີລະຊົນ",
-                "vīatnām": "ວຽດນາມ",
-                "vīangsai": "ວຽງໄຊ",
-                "vīangchan": "ວຽງຈັນ",
-                "vīang": "ວຽງ",
-                "vīakngān": "ວຽກງານ",
-                "vētsandǭn": "ເວດສັນດອນ",
-                "vēthī": "ເວທີ",
-                "vārasān": "ວາຣະສານ",
-                "vālasān": "ວາລະສາມ",
-                "vākān": "ວ່າການ",
-                "vādūai": "ວ່າດ້ວຍ",
-                "vā": "ວ່າ",
-                "vongvichit": "ວົງວິຈິດ",
-                "vongsin": "ວົງສິນ",
-                "vong": "ວົງ",
-                "vivat": "ວິວັດ",
-                "vithītham": "ວິຖີທຳ",
-                "vithīkhon": "ວິຖີຄົນ",
-                "vithī": "ວິທີ",
-                "vithanyāsāt": "ວິທະຍາສາດ",
-                "visāhakit": "ວິສາຫະກິດ",
-                "visā": "ວິຊາ",
-                "vinai": "ວິໄນ",
-                "vichitsin": "ວິຈິດສິນ",
-                "vatthanatham": "ວັດທະນະທຳ",
-                "vatchanānukom": "ວັດຈະນານຸກົມ",
-                "vat": "ວັດ",
-                "vanthī": "ວັນທີ",
-                "vansāng": "ວັນສ້າງ",
-                "vansai": "ວັນໄຊ",
-                "vanniphā": "ວັນນິພາ",
-                "vannasin": "ວັນນະສິນ",
-                "vannakhadī": "ວັນນະຄະດີ",
-                "vannakam": "ວັນນະຄຳ",
-                "vajirañāṇavisuddhi": "ວະຊິຣະຍານະວິສຸທທິ",
-                "vainyākǭn": "ໄວຍາກອນ",
-                "vachīviphāk": "ວະຈີວິພາກ",
-                "u̕n": "ອຶນ",
-                "tǭtān": "ຕ່ອຕ້ານ",
-                "tǭp": "ຕອບ",
-                "tǣm": "ແຕ້ມ",
-                "tūa": "ຕົວ",
-                "tēmiya": "ເຕມິຍະ",
-                "tāsǣng": "ຕາແສງ",
-                "tāng tāng": "ຕ່າງໆ",
-                "tān": "ຕ້ານ",
-                "tām": "ຕາມ",
-                "tā": "ຕາ",
-                "tæng": "ແຕ່ງ",
-                "tittām": "ຕິດຕາມ",
-                "thǭ lǭ nyǭ": "ທລຍ",
-                "thư̄ktǭng": "ຖືກຕ້ອງ",
-                "thư̄a": "ເທື່ອ",
-                "thūa": "ທົ່ວ",
-                "thœ̄ng": "ເຖິງ",
-                "thīhan": "ທີ່ຫັ້ນ",
-                "thīapsai": "ທຽບໃສ່",
-                "thī": "ທີ",
-                "thētsanā": "ເທສນາ",
-                "thēpsitthā": "ເທບສິດທາ",
-                "thēp": "ເທບ",
-                "thāvǭn": "ຖາວອນ",
-                "thāo": "ທ້າວ",
-                "thāo": "ທ້າວ",
-                "thānthīman": "ຖານທີ່ໝັ້ນ",
-                "thānnāng": "ທ່ານນາງ",
-                "thāng": "ທາງ",
-                "thān": "ທ່ານ",
-                "thān": "ຖານ",
-                "thuknyāk": "ທຸກຍາກ",
-                "thuk": "ທຸກ",
-                "thongsavāt": "ທົງສະຫວາດ",
-                "thitsadī": "ທິດສະດີ",
-                "thidāchan": "ທິດາຈັນ",
-                "thavīsuk": "ທະວີສຸກ",
-                "thavāvā": "ທະວາວາ",
-                "thatsanavichān": "ທັດສະນະວິຈານ",
-                "thasasātaka": "ທະສະຊາຕະກະ",
-                "thanvā": "ທັນວາ",
-                "thammathēvā": "ທຳມະເທວາ",
-                "thammathān": "ທັມມະທານ",
-                "thammasāt": "ທຳມະຊາດ",
-                "thammakān": "ທຳມະການ",
-                "thamdi": "ທຳດີ",
-                "tham": "ທັມ",
-                "teknik": "ເຕັກນິກ",
-                "tamnān-phongsāvadān": "ຕຳນານ-ພົງສາວະດານ",
-                "sǭpǭpǭ": "ສປປ",
-                "sǭnsai": "ສອນໄຊ",
-                "sǭng": "ສອງ",
-                "sǭn": "ສອນ",
-                "sǭ": "ສ",
-                "sǣngsuvan": "ແສງສຸວັນ",
-                "sư̄thœ̄t": "ຊື້ເທີດ",
-                "sư̄amnyōng": "ເຊື່ອມໂຍງ",
-                "sư̄a": "ເສື້ອ",
-                "sưksāthikān": "ສຶກສາທິການ",
-                "sưksā": "ສຶກສາ",
-                "sūnkāng": "ສູນກາງ",
-                "sūn": "ສູນ",
-                "sūaingām": "ສວຍງາມ",
-                "sū": "ສູ່",
-                "sœ̄ng": "ເຊິ່ງ",
-                "sǭn": "ສອນ",
-                "sīvongsak": "ສີວົງສັກ",
-                "sīvit": "ຊີວິດ",
-                "sīsuvanna": "ສີສຸວັນນະ",
-                "sīsan": "ສີສັນ",
-                "sīrrai": "ຊີໄຣທ໌",
-                "sīphomsai": "ສີຜົມໄຊຍ໌",
-                "sīlāped": "ສີລາເພັດ",
-                "sīkhīeo": "ສີຂຽວ",
-                "sīkham": "ສິຄຳ",
-                "sībunhư̄ang": "ສີບຸນເຮືອງ",
-                "sīang": "ສຽງ",
-                "sī": "ສີ",
-                "sēnthāng": "ເສັ້ນທາງ",
-                "sāthālanalat": "ສາທາລະນະລັດ",
-                "sātaka": "ຊາຕະກະ",
-                "sāt": "ຊາດ",
-                "sāpanakit": "ຊາປະນະກິດ",
-                "sāo": "ຊາວ",
-                "sānpasœt": "ສານປະເສິດ",
-                "sāngsīan": "ຊ່າງຊ່ຽນ",
-                "sāngsan": "ສ້າງສັນ",
-                "sāng": "ສ້າງ",
-                "sāman": "ສາມັນ",
-                "sāmakkhī": "ສາມັກຄີ",
-                "sālī": "ຊາລີ",
-                "sālabān": "ສາລະບານ",
-                "sākon": "ສາກົນ",
-                "sākhā": "ສາຂາ",
-                "sādok": "ຊາດົກ",
-                "suvannaphan": "ສຸວັນນະພັນ",
-                "sut": "ຊຸດ",
-                "suli": "ສຸລິ",
-                "sukʻānansak": "ສຸກອານັນສັກ",
-                "suksavan": "ສຸກສະຫວັນ",
-                "sukhī": "ສຸຂີ",
-                "suban": "ສຸບັນ",
-                "sop": "ສົບ",
-                "sonthi": "ສົນທິ",
-                "sonnabot": "ຊົນນະບົດ",
-                "somthop": "ສົມທົບ",
-                "somthaphœ̄i": "ສົມທະເຜີຍ",
-                "somsǣng": "ສົມແສງ",
-                "somsaiphon": "ຊົມໄຊຜົນ",
-                "somphǭn": "ສົມພອນ",
-                "somphavan": "ສົມພະວັນ",
-                "somchai": "ສົມໃຈ",
-                "sombūnkhan": "ສົມບູນຂັນ",
-                "sombūn": "ສມບູນ",
-                "sok": "ສົກ",
-                "sitthimanut": "ສິດທິມະນຸດ",
-                "sitthidēt": "ສິດທິເດດ",
-                "sinlapin": "ສິນລະປິນ",
-                "singvǣtlǭm": "ສິ່ງແວດລ້ອມ",
-                "singhā": "ສິງຫາ",
-                "silā": "ສິລາ",
-                "siliphǭn": "ສິລິພອນ",
-                "savannakhet": "ສະຫວັນນະເກດ",
-                "sathāban": "ສະຖາບັນ",
-                "satchangvē": "ສັດຈັງເວ",
-                "sasom": "ສະສົມ",
-                "sapā": "ສະພາ",
-                "sapphanyākǭn": "ຊັບພະຍາກອນ",
-                "saphā": "ສະພາ",
-                "sap": "ສັບ",
-                "santiphāp": "ສັນຕິພາບ",
-                "sanok": "ຊະນົກ",
-                "sannyā": "ສັນຍາ",
-                "sangūan": "ສະຫງວນ",
-                "sangsinsai": "ສັງຂ໌ສິລປ໌ຊັຍ",
-                "sanglūam": "ສັງລວມ",
-                "sangkhēp": "ສັງເຂບ",
-                "sangkhomninyom": "ສັງຄົມນິຍົມ",
-                "sangkhom": "ສັງຄົມ",
-                "sanapsanūn": "ສະໜັບສະໜູນ",
-                "san": "ຊັ້ນ",
-                "samāsik": "ສະມາຊິກ",
-                "samākhom": "ສະນາຄົມ",
-                "samāi": "ສະໄໝ",
-                "samut": "ສະມຸດ",
-                "samunphai": "ສະໝຸນໄພ",
-                "samra": "ຊຳຣະ",
-                "samphāt": "ສຳພາດ",
-                "samnūan": "ສຳນວນ",
-                "samnakphim": "ສຳນັກພິມ",
-                "sammanā": "ສຳມະນາ",
-                "sammakhom": "ສະມາຄົມ",
-                "samlap": "ສຳລັບ",
-                "salǭng": "ສະຫຼອງ",
-                "salœ̄msalǭng": "ສະເຫລິມສະຫລອງ",
-                "saiyavong": "ໄຊຍະວົງ",
-                "saisana": "ໄຊຊະນະ",
-                "sainyabulī": "ໄຊຍະບູລີ",
-                "sai": "ໄສ",
-                "sahāphan": "ສະຫະພັນ",
-                "sabap": "ສະບັບ",
-                "rātsaʻānāchak": "ຣາຊອານາຈັກ",
-                "rātsabanditsaphā": "ຣາຊບັນດິຕສະພາລາວ",
-                "rātsabandit": "ຣາຊບັນດິດ",
-                "rātbandit": "ຣາຊບັນດິຕ",
-                "rānnāisai": "ຮ້ານນາຍໄຊຍ໌",
-                "rattanakavī": "ຣັດຕະນະກະວີ",
-                "pǭngkan": "ປ້ອງກັນ",
-                "pǭngdǭng": "ປອງດອງ",
-                "pǣtsip": "ແປດສິບ",
-                "pǣng": "ແປງ",
-                "pǣ": "ແປ",
-                "pư̄m": "ປຶ້ມ",
-                "pū": "ປູ່",
-                "pī": "ປີ",
-                "pāsamǭ": "ປາສມໍ",
-                "pānkham": "ປານຄຳ",
-                "pāngkham": "ປາງຄຳ",
-                "pān": "ປານ",
-                "pākpāsak": "ປາກປາສັກ",
-                "pādǣk": "ປາແດກ",
-                "pā": "ປ້າ",
-                "pu̕m": "ປຶ້ມ",
-                "pukchai": "ປຸກໃຈ",
-                "prasœ̄t": "ປຮະເສີດ",
-                "pradit": "ປຣະດິດ",
-                "pokpak": "ປົກປັກ",
-                "pokkhǭng": "ປົກຄອງ",
-                "phǭnkǣo": "ພອນແກ້ວ",
-                "phǭmdūai": "ພ້ອມດ້ວຍ",
-                "phǭ.sǭ.": "ພ.ສ.",
-                "phǭ": "ພ",
-                "phǣnthī": "ແຜນທີ່",
-                "phǣnmǣbot": "ແຜນແມ່ບົດ",
-                "phǣnkān": "ແຜນການ",
-                "phǣng": "ແພງ",
-                "phǣndin": "ແຜ່ນດິນ",
-                "phǣn": "ແຜນ",
-                "phư̄nmư̄ang": "ພື້ນເມືອງ",
-                "phư̄a": "ເພື່ອ",
-                "phūthǣn": "ຜູ້ແທນ",
-                "phūthǭn": "ພູທອນ",
-                "phūmī": "ພູມີ",
-                "phūhiphōm": "ຜູ້ຮິບໂຮມ",
-                "phūangdǭksǭn": "ພວງດອກຊ້ອນ",
-                "phū": "ຜູ້",
-                "phǭnkasœ̄msuk": "ພອນກະເສີມສຸກ",
-                "phōn": "ໂພນ",
-                "phāsī": "ພາສີ",
-                "phāsāsāt": "ພາສາສາດ",
-                "phāsā": "ພາສາ",
-                "phāphǣ": "ຜ້າແພ",
-                "phāp": "ພາບ",
-                "phāp": "ພາບ",
-                "phān": "ຜ່ານ",
-                "phāk": "ພາກ",
-                "phāitai": "ພາຍໃຕ້",
-                "phābakkham": "ຜາບັກກຳ",
-                "phutthasātsanā": "ພຸດທະສາສະນາ",
-                "phutthakhōsakō": "ພຸທທະໂຄສະໂກ",
-                "phua": "ເພື່ອ",
-                "phrarātsa": "ພຣະຣາຊອ",
-                "phraparinyattitham": "ພຣະປຣິຍັດຕິທັມ",
-                "phranao": "ພຣະເມົາ",
-                "phra": "ພຣະ",
-                "phop": "ພົບ",
-                "phonngān": "ຜົນງານ",
-                "phonkathop": "ຜົນກະທົບ",
-                "phongsāvadān": "ພົງສາວະດານ",
-                "phondaihap": "ຜົນໄດ້ຮັບ",
-                "phon": "ຜົນ",
-                "phivan": "ໄພວັນ",
-                "phiulāvan": "ຜິວລາວັນ",
-                "phithīkam": "ພິທີກຳ",
-                "phimphanthavong": "ພິມພັນທະວົງ",
-                "phim": "ພິມ",
-                "philāvong": "ພິລາວົງສ໌",
-                "philaʻāthān": "ພິລະອາດຫານ",
-                "phet": "ເພັຊ",
-                "phengsǣngkham": "ເພັງແສງຄຳ",
-                "phatthanā": "ພັດທະນາ",
-                "phaphutthasāsanā": "ພະພຸດທະສາສະນາ",
-                "phao": "ເຜົ່າ",
-                "phanǣk": "ພະແນກ",
-                "phanyākǭn": "ຜະຫຍາກອນ",
-                "phalānsai": "ພະລານໄຊ",
-                "phakhitthasātsanā": "ພະຄຼິທະສາສນາ",
-                "phakhamphi": "ພະຄຳພີ",
-                "phak": "ພັກ",
-                "phaivan": "ໄພວັນ",
-                "phachik": "ພະຈິກ",
-                "phabāng": "ພະບາງ",
-                "pha": "ພະ",
-                "pen": "ເປັນ",
-                "payōk": "ປະໂຫຍກ",
-                "pavatsāt": "ປະຫວັດສາດ",
-                "pavat": "ປະຫວັດ",
-                "pativat": "ປະຕິວັດ",
-                "patithin": "ປະຕິທິນ",
-                "patibat": "ປະຕິບັດ",
-                "pathēt": "ປະເທດ",
-                "pasœ̄t": "ປະເສິດ",
-                "pasāthipatai": "ປະຊາທິປະໄຕ",
-                "pasāson": "ປະຊາຊົນ",
-                "pasom": "ປະສົມ",
-                "pasitthiphāp": "ປະສິດທິພາບ",
-                "pasitthiphon": "ປະສິດທິຜົນ",
-                "parīan": "ປຣຽນ",
-                "pappung": "ປັນປຸງ",
-                "paphēnī": "ປະເພນີ",
-                "paphan": "ປະພັນ",
-                "paomāi": "ເປ້າໝາຍ",
-                "pannyāsili": "ປັນຍາສິລິ",
-                "pamūan": "ປະມວນ",
-                "pamœ̄nphon": "ປະເມີນຜົນ",
-                "palindā": "ປະລິນດາ",
-                "pakǭp": "ປະກອບ",
-                "pacham": "ປະຈຳ",
-                "nǭrasin": "ນໍຣະສິລປ໌",
-                "nư̄ang": "ເນື່ອງ",
-                "nư̄anai": "ເນື້ອໃນ",
-                "nưng": "ໜຶ່ງ",
-                "nūangnai": "ເນື່ອງໃນ",
-                "nēttavong": "ເນດຕະວົງ",
-                "nāpāktǣn": "ນາປາກແຕນ",
-                "nāng": "ນາງ",
-                "nām": "ນາມ",
-                "nyǭt": "ຍອດ",
-                "nyǭ": "ຫຍໍ້",
-                "nyungyāk": "ຫຍຸ້ງຍາກ",
-                "nyin": "ຍິນ",
-                "nyai": "ໃຫຍ່",
-                "num": "ໜຸຸ່ມ",
-                "niyomthai": "ນິຍົມໄທ",
-                "nivat": "ນິວັດ",
-                "nitikam": "ນິຕິກຳ",
-                "nithān": "ນິທານ",
-                "ngư̄a": "ເຫງື່ອ",
-                "ngānsalœ̄msalǭng": "ສະເຫຼີມສະຫຼອງ",
-                "ngān": "ງານ",
-                "ngām": "ງາມ",
-                "nangsư̄": "ນໜັງສື",
-                "nam": "ນຳ",
-                "nakpaphan": "ນັກປະພັນ",
-                "nakkhīan": "ນັກຂຽນ",
-                "nakkavī": "ນັກກະວີ",
-                "nakhǭn": "ນະຄອນ",
-                "nakhīan": "ນັກຮຽນ",
-                "nak": "ນັກ",
-                "nai": "ໃນ",
-                "mǭladok": "ມໍລະດົກ",
-                "mǭ.": "ມ.",
-                "mǣnying": "ແມ່ຍິງ",
-                "mǣngmai": "ແມງໄມ້",
-                "mǣng": "ແມງ",
-                "mǣbot": "ແມ່ບົດ",
-                "mǣ": "ແມ່",
-                "mư̄n": "ມືນ",
-                "mư̄angphūan": "ເມືອງພວນ",
-                "mư̄ang": "ເມືອງ",
-                "mūnthǣntæng": "ມູນແຖນແຕ່ງ",
-                "mūnsư̄a": "ມູນເຊື້ອ",
-                "mūnnithi": "ມູນນິທິ",
-                "mūnkǣo": "ໝູນແກ້ວ",
-                "mūbān": "ໝູ່ບ້ານ",
-                "mī": "ມີ",
-                "mēthīvǭrakhun": "ເມທີວໍຣະຄຸນ",
-                "mēsā": "ເມສາ",
-                "mālāvong": "ມາລາວົງ",
-                "mā": "ມາ",
-                "mungkhun": "ມຸງຄຸລເ",
-                "mung": "ມຸ່ງ",
-                "mithunā": "ມິຖຸນາ",
-                "matthāi": "ມັດທາວ",
-                "matthayomsưksā": "ມັດທະຍົມສຶກສາ",
-                "matthayom": "ມັດທະຍົມ",
-                "maising": "ໄມ່ສິງ",
-                "mai": "ໃໝ່",
-                "mahōsot": "ມະໂຫສົດ",
-                "mahāsālī": "ມະຫາຊາລີ",
-                "mahā": "ມະຫາ",
-                "lǭbrīayāo": "ລໍເບຼຍຢາວ",
-                "lư̄ang": "ເລື່ອງ",
-                "lư̄ak": "ເລືອກ",
-                "lưplāng": "ລຶບລ້າງ",
-                "lūksit": "ລູກສິດ",
-                "lūkdǭnkaden": "ລູກດອນກະເດັນ",
-                "lūangvannā": "ຫລວງວັນນາ",
-                "lūangphrabāng": "ຫຼວງພຣະບາງ",
-                "lūanglāt": "ຫລວງລາດ",
-                "lūang": "ຫລວງ",
-                "līeo": "ຫຼຽວ",
-                "līaplīang": "ຮຽບຮຽງ",
-                "lātsavong": "ລາດຊະວົງ",
-                "lātsadǭn": "ລາດສະດອນ",
-                "lāodūangdư̄an": "ລາວດວງເດືອນ",
-                "lāo": "ລາວ",
-                "lānkham": "ລານຄຳ",
-                "lān": "ຫລານ",
-                "lān": "ລ້ານ",
-                "lāitam": "ລາຍຕ່ຳ",
-                "lāingān": "ລາຍງານ",
-                "læ": "ແລະ",
-                "lom": "ລົມ",
-                "lem": "ເຫຼັ້ມ",
-                "lavāng": "ສະຫວ່າງ",
-                "latthayot": "ລັດທະຍົດ",
-                "latthabān": "ລັດຖະບານ",
-                "lat": "ລັດ",
-                "lainya": "ໄລຍະ",
-                "ladap": "ລະດັບ",
-                "labīap": "ລະບຽບ",
-                "kǭntīa": "ກອນເຕີຍ",
-                "kǭnlam": "ກອນລຳ",
-                "kǭngthưnlutphǭn": "ກອງທຶນຫລຸດຜ່ອນ",
-                "kǭngpasum": "ກອງປະຊຸມ",
-                "kǭng": "ກອງ",
-                "kǭn": "ກ່ອນ",
-                "kǭmmūnit": "ກອມມູນິດ",
-                "kǭ": "ກໍ່",
-                "kūatsǭp": "ກວດສອບ",
-                "kūatkǣ": "ກວດແກ້",
-                "kūathān": "ກວດທານ",
-                "kīeokap": "ກ່ຽວກັບ",
-                "kēʻǭk": "ເກອກ",
-                "kāpkǭn": "ກາບກອບ",
-                "kāp": "ກາບ",
-                "kāntāngpathēt": "ການຕ່າງປະເທດ",
-                "kāntāi": "ການຕາຍ",
-                "kāntængdǭng": "ການແຕ່ງດອງ",
-                "kānthǭngthīeo": "ການທ່ອງທ່ຽວ",
-                "kānthahān": "ການທະຫານ",
-                "kāntangton": "ການຕັ້ງຕົ້ນ",
-                "kānsưksā": "ການສຶກສາ",
-                "kānsūkhwan": "ການສູ່ຂວັນ",
-                "kānsāng": "ການສ້າງ",
-                "kānsamlūat": "ການສຳຫລວດ",
-                "kānpokkhǭng": "ການປົກຄອງ",
-                "kānphim": "ການພິມ",
-                "kānphatthanā": "ການພັດທະນາ",
-                "kānpativat": "ການປະຕິວັດ",
-                "kānpasum": "ການປະຊຸມ",
-                "kānpaditsathān": "ການປະດິດສະຖານ",
-                "kānngœn": "ການເງິນ",
-                "kānmư̄ang": "ການເມືອງ",
-                "kānlưplāng": "ການລຶບລ້າງ",
-                "kānlukhư̄": "ການລຸກຮື້",
-                "kānlongthưn": "ການລົງທຶນ",
-                "kānkǭsāng": "ການກໍສ້າງ",
-                "kānkœ̄t": "ການເກີດ",
-                "kānkhư̄anvai": "ການເຄືອນໄຫວ",
-                "kānkhā": "ການຄ້າ",
-                "kānkhonkhwā": "ການຄ້ນຄວ້າ",
-                "kāng": "ກາງ",
-                "kānchattang": "ການຈັດຕັ້ງ",
-                "kānbūat": "ການບວດ",
-                "kānbansī": "ການບັນຊີ",
-                "kā": "ກາ",
-                "kung": "ກຸງ",
-                "kummān": "ກຸມມານ",
-                "kum": "ກຸ່ມ",
-                "krēkǭrī": "ເກຣກໍຣີ",
-                "kotmāi": "ກົດໝາຍ",
-                "kongpat": "ກົງພັດ",
-                "kongdư̄an": "ກົງເດືອນ",
-                "kom": "ກົມ",
-                "kitimasak": "ກິຕິມະສັກ",
-                "kingvongsak": "ກິ່ງວົງສັກ",
-                "kin": "ກິ່ນ",
-                "kim": "ກິມ",
-                "kidǣng": "ກິແດງ",
-                "khǭpchai": "ຂອບໃຈ",
-                "khǭng": "ຂອງ",
-                "khǭmmūnit": "ຄອມມູນິດ",
-                "khǭ.phǭ.phǭ.": "ຄ.ພ.ພ",
-                "khưn": "ຂຶ້ນ",
-                "khūnmanī": "ຄູນມະນີ",
-                "khūmư̄": "ຄູ່ມື",
-                "khōtsanā": "ໂຄສະນາ",
-                "khōsanā": "ໂຄສະນາ",
-                "khōngkān": "ໂຄງການ",
-                "khīan": "ຂຽນ",
-                "khī": "ຂີ້",
-                "khāosān": "ຂ່າວສານ",
-                "khwǣng": "ແຂວງ",
-                "khwāmthuknyāk": "ຄວາມທຸກຍາກ",
-                "khwāmthuk": "ຄວາມທຸກ",
-                "khwāmsǭtkhǭng": "ຄວາມສອດຄ່ອງ",
-                "khwāmsongcham": "ຄວາມຊົງຈຳ",
-                "khwāmsanēhā": "ຄວາມສະເໜຫາ",
-                "khwāmpenmā": "ຄວາມເປັນມາ",
-                "khwāmpenkāng": "ຄວາມເປັນກາງ",
-                "khwāmnyư̄nnyong": "ຄວາມຍືນຍງ",
-                "khwāmmāi": "ຄວາມໝາຍ",
-                "khwāmhak": "ຄວາມຮັກ",
-                "khwamcheppūat": "ຄວາມເຈັບປວດ",
-                "khunphithak": "ຂຸນພິທັກ",
-                "khophǭp": "ຄົບຮອບ",
-                "khop": "ຄົບ",
-                "khonkhwā": "ຄົ້ນຄວ້າ",
-                "khongkhēt": "ຂົງເຂດ",
-                "khon": "ຄົນ",
-                "khaomā": "ເຂົ້າມາ",
-                "khaochai": "ເຂົ້າໃຈ",
-                "khao": "ເຂົ້າ",
-                "khanitsāt": "ຄນິຕສາດ",
-                "khang": "ຄັ້ງ",
-                "khana": "ຄະນະ",
-                "khamvǭn": "ຄຳວອນ",
-                "khamtǭp": "ຄຳຕອບ",
-                "khamthām": "ຄຳຖາມ",
-                "khamthawāi": "ຄຳທວາຍ",
-                "khamsap": "ຄຳສັບ",
-                "khamphǭng": "ຄຳພ້ອງ",
-                "khamphī": "ຄຳພີ",
-                "khamphun": "ຄຳຜຸນ",
-                "khamphao": "ຄຳເພົາ",
-                "khammœ̄ng": "ຄຳເມິງ",
-                "khamlā": "ຄຳຫຼ້າ",
-                "khamkǭng": "ຄຳກອງ",
-                "khamkǭn": "ຄຳກອນ",
-                "khamhung": "ຄຳຮຸ່ງ",
-                "kham": "ຄຳ",
-                "kham": "ຄຳ",
-                "khabūan": "ຂະບວນ",
-                "kavīniphǭn": "ກະວີນິພົນ",
-                "kavī": "ກະວີ",
-                "kasūang": "ກະຊວງ",
-                "kap": "ກັບ",
-                "kanyā": "ກັນຍາ",
-                "kantasilō": "ກັນຕະສິໂລ",
-                "kanlayā": "ກັນລະຍາ",
-                "kang": "ກາ",
-                "kan": "ກັນ",
-                "kamphā": "ກຳພ້າ",
-                "kammakān": "ກຳມະການ",
-                "kakīan": "ກະກຽນ",
-                "kai": "ໃກ້",
-                "hǭp": "ຮອບ",
-                "hǭng": "ຫ້ອງ",
-                "hǭm": "ຫອມ",
-                "hǭi": "ຮ້ອຍ",
-                "hǭ": "ຫໍ",
-                "hǣnngān": "ແຮງງານ",
-                "hǣng": "ແຫ່ງ",
-                "hǣk": "ແຮກ",
-                "hūʼan": "ຮືອນ",
-                "hūppāp": "ຮູບພາບ",
-                "hūppan": "ຮູບປັ້ນ",
-                "hūp": "ຮູບ",
-                "hūaphūam": "ຮວບຮວມໂດຍ",
-                "hūamsamai": "ຮ່ວມສະໄໜ",
-                "hūakhǭ": "ຫົວຂໍ້",
-                "hūachai": "ຫົວໃຈ",
-                "hǭtbun": "ຮອດບຸນ",
-                "hǭngsamut": "ຫ້ອງສມຸດ",
-                "hōrāsāt": "ໂຫຣາສາດ",
-                "hōngphim": "ໂຮງພິມ",
-                "hōnghīan": "ໂຮງຮຽນ",
-                "hōm": "ໂຮມ",
-                "hīaphīang": "ຮຽບຮຽງ",
-                "hētkān": "ເຫດການ",
-                "hānōi": "ຮ່າໂນ້ຍ",
-                "hāi": "ຫາຍ",
-                "hā": "ຫ້າ",
-                "hung": "ຮຸ່ງ",
-                "hongsākhǭn": "ຫົງສາຄອນ",
-                "hongsā": "ຫົງສາ",
-                "honghœ̄n": "ຫົງເຫີນ",
-                "hiphōm": "ຮິບໂຮມ",
-                "hatthachan": "ຫັດທະຈັນ",
-                "hap": "ຮັບ",
-                "hao": "ເຮົາ",
-                "han": "ຮັນສ໌",
-                "hamhīan": "ຮ່ຳຮຽນ",
-                "haksā": "ຮັກສາ",
-                "hak": "ຮັກ",
-                "hai": "ໄຫ້",
-                "georg": "ເກອກ",
-                "fāngum": "ຟ້າງຸ່ມ",
-                "farangsēt": "ຝຣັ່ງເສດ",
-                "farang": "ຝຣັ່ງ",
-                "fan": "ຝັນ",
-                "faifā": "ໄຟຟ້າ",
-                "faidāng": "ໄຟດ່າງ",
-                "fai": "ໄຟ",
-                "dǭkkēt": "ດອກເກດ",
-                "dǭk": "ດອກ",
-                "dǭ rǭ": "ດຣ.",
-                "dư̄an": "ເດືອນ",
-                "dūangphasuk": "ດວງພະສຸກ",
-                "dūangdư̄an": "ດວງເດືອນ",
-                "dūangchampā": "ດວງຈຳປາ",
-                "dœ̄nthāng": "ເດີນທາງ",
-                "dōi": "ໂດຍ",
-                "dīden": "ດີເດັ່ນ",
-                "dētvongphan": "ເດດວົງພັນ",
-                "dārā": "ດາຣາ",
-                "dān": "ດ້ານ",
-                "dontrī": "ດົນຕຣື",
-                "dai": "ໃດ",
-                "chǭn": "ຈອນ",
-                "chǭ.sǭ.": "ຈ.ສ.",
-                "chư̄ang": "ເຈືອງ",
-                "chưng": "ຈຶ່ງ",
-                "chīn": "ຈີນ",
-                "chē": "ເຈ",
-                "chāk": "ຈາກ",
-                "chattham": "ຈັດທຳ",
-                "chattang": "ຈັດຕັ້ງ",
-                "chatphim": "ຈັດພິມ",
-                "chat": "ຈັດ",
-                "chaophāp": "ເຈົ້າພາບ",
-                "chao": "ເຈົ້າ",
-                "chanthavong": "ຈັນທະວົງ",
-                "chanthasusāt": "ຈັນທະສຸຊາດ",
-                "chanthaphaibūn": "ຈັນທະໄພນູນ",
-                "chanthachak": "ຈັນທະຈັກ",
-                "chandī": "ຈັນດີ",
-                "chanbudī": "ຈັນບຸດີ",
-                "champānakhǭn": "ຈຳປານະຄອນ",
-                "champā": "ຈຳປາ",
-                "chamnāi": "ຈຳໜ່າຍ",
-                "chai": "ໃຈ",
-                "cha": "ຈະ",
-                "bǭnmœ̄": "ບອລເມີ",
-                "bǭn": "ບ່ອນ",
-                "bǭk": "ບອກ",
-                "bǭ": "ບໍ່",
-                "bǣp": "ແບບ",
-                "būhān": "ບູຮານ",
-                "būalai": "ບົວໄລ",
-                "būabāngbưng": "ບົວບາງບຶງ",
-                "bœ̄tan": "ເບີຕັນ",
-                "bœ̄ng": "ເບິ່ງ",
-                "bœ̄kœ̄": "ເບີເກີ",
-                "bānnā": "ບ້ານນາ",
-                "bāng": "ບາງ",
-                "bālī": "ບາລີໄ",
-                "bunthanǭng": "ບຸນທະນອງ",
-                "buntham": "ບຸນທັມ",
-                "bunnyāvong": "ບຸນຍາວົງ",
-                "bunnyaphǭn": "ບຸນຍະພອນ",
-                "bunlư̄a": "ບຸນເລືອ",
-                "bunlœ̄ng": "ບຸນເລີງ",
-                "bunkwāng": "ບຸນກວ້າງ",
-                "bun": "ບຸນ",
-                "botkǭn": "ບົດກອນ",
-                "botkhwām": "ບົດຄວາມ",
-                "botkavī": "ບົດກະວີ",
-                "bothīan": "ບົດຮຽນ",
-                "bot": "ບົດ",
-                "banthưk": "ບັນທຶກ",
-                "bansī": "ບັນຊີ",
-                "bannāthikān": "ບັນນາທິການ",
-                "banhā": "ບັນຫາ",
-                "baiphō": "ໃບໂພ"
-            },
-            "forward": {
-                "ປ້ອງກັນ": "Pǭngkan",
-                "ເວດສັນດອນ": "Vētsandǭn",
-                "ແມງໄມ້": "Mǣngmai",
-                "ກ່ອນ": "Kǭn",
-                "ກ່ຽວກັບ": "kīeokap",
-                "ກວດສອບ": "kūatsǭp",
-                "ກວດທານ": "kūathān",
-                "ກວດແກ້": "kūatkǣ",
-                "ກອງ": "kǭng",
-                "ກອງທຶນຫລຸດຜ່ອນ": "Kǭngthưnlutphǭn",
-                "ກອງປະຊຸມ": "Kǭngpasum",
-                "ກອນລຳ": "Kǭnlam",
-                "ກອນເຕີຍ": "Kǭntīa",
-                "ກອມມູນິດ": "Kǭmmūnit",
-                "ກະກຽນ": "kakīan",
-                "ກະຊວງ": "Kasūang",
-                "ກະວີ": "kavī",
-                "ກະວີນິພົນ": "kavīniphǭn",
-                "ກາ": "Kā",
-                "ກາ": "kang",
-                "ກາງ": "Kāng",
-                "ການກໍສ້າງ": "kānkǭsāng",
-                "ການຄ້ນຄວ້າ": "Kānkhonkhwā",
-                "ການຄ້າ": "Kānkhā",
-                "ການຈັດຕັ້ງ": "Kānchattang",
-                "ການສ້າງ": "Kānsāng",
-                "ການສຶກສາ": "Kānsưksā",
-                "ການສູ່ຂວັນ": "Kānsūkhwan",
-                "ການສຳຫລວດ": "kānsamlūat",
-                "ການຕ່າງປະເທດ": "Kāntāngpathēt",
-                "ການຕາຍ": "kāntāi",
-                "ການຕັ້ງຕົ້ນ": "kāntangton",
-                "ການທ່ອງທ່ຽວ": "kānthǭngthīeo",
-                "ການທະຫານ": "Kānthahān",
-                "ການບວດ": "kānbūat",
-                "ການບັນຊີ": "kānbansī",
-                "ການປະຊຸມ": "kānpasum",
-                "ການປະດິດສະຖານ": "kānpaditsathān",
-                "ການປະຕິວັດ": "kānpativat",
-                "ການປົກຄອງ": "Kānpokkhǭng",
-                "ການພິມ": "Kānphim",
-                "ການພັດທະນາ": "kānphatthanā",
-                "ການລຶບລ້າງ": "kānlưplāng",
-                "ການລຸກຮື້": "kānlukhư̄",
-                "ການລົງທຶນ": "Kānlongthưn",
-                "ການເກີດ": "kānkœ̄t",
-                "ການເຄືອນໄຫວ": "kānkhư̄anvai",
-                "ການເງິນ": "Kānngœn",
-                "ການເມືອງ": "Kānmư̄ang",
-                "ການແຕ່ງດອງ": "kāntængdǭng",
-                "ກາບ": "Kāp",
-                "ກາບກອບ": "kāpkǭn",
-                "ກິ່ງວົງສັກ": "Kingvongsak",
-                "ກິ່ນ": "Kin",
-                "ກິຕິມະສັກ": "kitimasak",
-                "ກິມ": "Kim",
-                "ກິແດງ": "Kidǣng",
-                "ກຸ່ມ": "Kum",
-                "ກຸງ": "Kung",
-                "ກຸມມານ": "kummān",
-                "ກົງພັດ": "Kongpat",
-                "ກົງເດືອນ": "Kongdư̄an",
-                "ກົດໝາຍ": "kotmāi",
-                "ກົມ": "Kom",
-                "ກຳພ້າ": "Kamphā",
-                "ກຳມະການ": "Kammakān",
-                "ກັນ": "kan",
-                "ກັນຍາ": "kanyā",
-                "ກັນຕະສິໂລ": "Kantasilō",
-                "ກັນລະຍາ": "Kanlayā",
-                "ກັບ": "kap",
-                "ກໍ່": "kǭ",
-                "ຂ່າວສານ": "Khāosān",
-                "ຂອງ": "khǭng",
-                "ຂອງ": "khǭng",
-                "ຂອບໃຈ": "Khǭpchai",
-                "ຂະບວນ": "khabūan",
-                "ຂີ້": "Khī",
-                "ຂຶ້ນ": "khưn",
-                "ຂຸນພິທັກ": "Khunphithak",
-                "ຂົງເຂດ": "khongkhēt",
-                "ຂຽນ": "khīan",
-                "ຄ.ພ.ພ": "Khǭ.Phǭ.Phǭ.",
-                "ຄນິຕສາດ": "khanitsāt",
-                "ຄວາມສອດຄ່ອງ": "khwāmsǭtkhǭng",
-                "ຄວາມສະເໜຫາ": "khwāmsanēhā",
-                "ຄວາມຊົງຈຳ": "khwāmsongcham",
-                "ຄວາມຍືນຍງ": "khwāmnyư̄nnyong",
-                "ຄວາມທຸກ": "khwāmthuk",
-                "ຄວາມທຸກຍາກ": "khwāmthuknyāk",
-                "ຄວາມໝາຍ": "khwāmmāi",
-                "ຄວາມຮັກ": "khwāmhak",
-                "ຄວາມເຈັບປວດ": "Khwamcheppūat",
-                "ຄວາມເປັນກາງ": "khwāmpenkāng",
-                "ຄວາມເປັນມາ": "khwāmpenmā",
-                "ຄອມມູນິດ": "Khǭmmūnit",
-                "ຄະນະ": "Khana",
-                "ຄູ່ມື": "khūmư̄",
-                "ຄູນມະນີ": "Khūnmanī",
-                "ຄົ້ນຄວ້າ": "Khonkhwā",
-                "ຄົນ": "khon",
-                "ຄົບ": "khop",
-                "ຄົບຮອບ": "khophǭp",
-                "ຄຳ": "Kham",
-                "ຄຳ": "kham",
-                "ຄຳກອງ": "Khamkǭng",
-                "ຄຳກອນ": "khamkǭn",
-                "ຄຳສັບ": "khamsap",
-                "ຄຳຕອບ": "khamtǭp",
-                "ຄຳຖາມ": "khamthām",
-                "ຄຳທວາຍ": "Khamthawāi",
-                "ຄຳຜຸນ": "Khamphun",
-                "ຄຳພ້ອງ": "Khamphǭng",
-                "ຄຳພີ": "khamphī",
-                "ຄຳວອນ": "Khamvǭn",
-                "ຄຳຫຼ້າ": "Khamlā",
-                "ຄຳຮຸ່ງ": "Khamhung",
-                "ຄຳເພົາ": "Khamphao",
-                "ຄຳເມິງ": "Khammœ̄ng",
-                "ຄັ້ງ": "khang",
-                "ງານ": "ngān",
-                "ງາມ": "ngām",
-                "ຈ.ສ.": "Chǭ.Sǭ.",
-                "ຈອນ": "Chǭn",
-                "ຈະ": "cha",
-                "ຈາກ": "chāk",
-                "ຈີນ": "Chīn",
-                "ຈຶ່ງ": "chưng",
-                "ຈຳປາ": "Champā",
-                "ຈຳປານະຄອນ": "Champānakhǭn",
-                "ຈຳໜ່າຍ": "Chamnāi",
-                "ຈັດ": "chat",
-                "ຈັດຕັ້ງ": "Chattang",
-                "ຈັດທຳ": "chattham",
-                "ຈັດພິມ": "Chatphim",
-                "ຈັນດີ": "Chandī",
-                "ຈັນທະຈັກ": "Chanthachak",
-                "ຈັນທະສຸຊາດ": "Chanthasusāt",
-                "ຈັນທະວົງ": "Chanthavong",
-                "ຈັນທະໄພນູນ": "Chanthaphaibūn",
-                "ຈັນບຸດີ": "Chanbudī",
-                "ສ": "Sǭ",
-                "ສ້າງ": "Sāng",
-                "ສ້າງສັນ": "Sāngsan",
-                "ສປປ": "SǭPǭPǭ",
-                "ສມບູນ": "Sombūn",
-                "ສວຍງາມ": "sūaingām",
-                "ສອງ": "sǭng",
-                "ສອນ": "sǭn",
-                "ສອນ": "sǭn",
-                "ສອນໄຊ": "Sǭnsai",
-                "ສະສົມ": "sasom",
-                "ສະຖາບັນ": "Sathāban",
-                "ສະນາຄົມ": "Samākhom",
-                "ສະບັບ": "sabap",
-                "ສະພາ": "Saphā",
-                "ສະພາ": "Sapā",
-                "ສະມາຄົມ": "Sammakhom",
-                "ສະມາຊິກ": "samāsik",
-                "ສະມຸດ": "Samut",
-                "ສະຫງວນ": "Sangūan",
-                "ສະຫວ່າງ": "lavāng",
-                "ສະຫວັນນະເກດ": "Savannakhet",
-                "ສະຫະພັນ": "Sahāphan",
-                "ສະຫຼອງ": "salǭng",
-                "ສະໜັບສະໜູນ": "sanapsanūn",
-                "ສະໝຸນໄພ": "Samunphai",
-                "ສະເຫລິມສະຫລອງ": "salœ̄msalǭng",
-                "ສະເຫຼີມສະຫຼອງ": "ngānsalœ̄msalǭng",
-                "ສະໄໝ": "samāi",
-                "ສາກົນ": "sākon",
-                "ສາຂາ": "sākhā",
-                "ສາທາລະນະລັດ": "Sāthālanalat",
-                "ສານປະເສິດ": "Sānpasœt",
-                "ສາມັກຄີ": "Sāmakkhī",
-                "ສາມັນ": "sāman",
-                "ສາລະບານ": "Sālabān",
-                "ສິ່ງແວດລ້ອມ": "singvǣtlǭm",
-                "ສິຄຳ": "Sīkham",
-                "ສິງຫາ": "singhā",
-                "ສິດທິມະນຸດ": "sitthimanut",
-                "ສິດທິເດດ": "Sitthidēt",
-                "ສິນລະປິນ": "sinlapin",
-                "ສິລາ": "Silā",
-                "ສິລິພອນ": "Siliphǭn",
-                "ສີ": "sī",
-                "ສີຂຽວ": "Sīkhīeo",
-                "ສີສຸວັນນະ": "Sīsuvanna",
-                "ສີສັນ": "Sīsan",
-                "ສີບຸນເຮືອງ": "Sībunhư̄ang",
-                "ສີຜົມໄຊຍ໌": "Sīphomsai",
-                "ສີລາເພັດ": "Sīlāped",
-                "ສີວົງສັກ": "Sīvongsak",
-                "ສຶກສາ": "sưksā",
-                "ສຶກສາທິການ": "Sưksāthikān",
-                "ສຸກສະຫວັນ": "Suksavan",
-                "ສຸກອານັນສັກ": "Sukʻānansak",
-                "ສຸຂີ": "Sukhī",
-                "ສຸບັນ": "Suban",
-                "ສຸລິ": "Suli",
-                "ສຸວັນນະພັນ": "Suvannaphan",
-                "ສູ່": "sū",
-                "ສູນ": "Sūn",
-                "ສູນກາງ": "Sūnkāng",
-                "ສົກ": "sok",
-                "ສົນທິ": "sonthi",
-                "ສົບ": "sop",
-                "ສົມທະເຜີຍ": "Somthaphœ̄i",
-                "ສົມທົບ": "somthop",
-                "ສົມບູນຂັນ": "Sombūnkhan",
-                "ສົມພອນ": "Somphǭn",
-                "ສົມພະວັນ": "Somphavan",
-                "ສົມແສງ": "Somsǣng",
-                "ສົມໃຈ": "Somchai",
-                "ສຽງ": "sīang",
-                "ສຳນວນ": "samnūan",
-                "ສຳນັກພິມ": "Samnakphim",
-                "ສຳພາດ": "samphāt",
-                "ສຳມະນາ": "sammanā",
-                "ສຳລັບ": "samlap",
-                "ສັງຂ໌ສິລປ໌ຊັຍ": "Sangsinsai",
-                "ສັງຄົມ": "Sangkhom",
-                "ສັງຄົມນິຍົມ": "Sangkhomninyom",
-                "ສັງລວມ": "Sanglūam",
-                "ສັງເຂບ": "sangkhēp",
-                "ສັດຈັງເວ": "Satchangvē",
-                "ສັນຍາ": "sannyā",
-                "ສັນຕິພາບ": "santiphāp",
-                "ສັບ": "sap",
-                "ຊ່າງຊ່ຽນ": "sāngsīan",
-                "ຊະນົກ": "Sanok",
-                "ຊາດ": "Sāt",
-                "ຊາດົກ": "sādok",
-                "ຊາຕະກະ": "sātaka",
-                "ຊາປະນະກິດ": "sāpanakit",
-                "ຊາລີ": "Sālī",
-                "ຊາວ": "sāo",
-                "ຊີວິດ": "sīvit",
-                "ຊີໄຣທ໌": "Sīrrai",
-                "ຊື້ເທີດ": "Sư̄thœ̄t",
-                "ຊຸດ": "sut",
-                "ຊົນນະບົດ": "sonnabot",
-                "ຊົມໄຊຜົນ": "Somsaiphon",
-                "ຊຳຣະ": "samra",
-                "ຊັ້ນ": "San",
-                "ຊັບພະຍາກອນ": "sapphanyākǭn",
-                "ຍອດ": "nyǭt",
-                "ຍິນ": "nyin",
-                "ຍຶດ": "yưt",
-                "ຍຸຕິທຳ": "Yuttitham",
-                "ດ້ານ": "dān",
-                "ດຣ.": "Dǭ Rǭ",
-                "ດວງຈຳປາ": "Dūangchampā",
-                "ດວງພະສຸກ": "Dūangphasuk",
-                "ດວງເດືອນ": "Dūangdư̄an",
-                "ດອກ": "dǭk",
-                "ດອກເກດ": "Dǭkkēt",
-                "ດາຣາ": "Dārā",
-                "ດີເດັ່ນ": "dīden",
-                "ດົນຕຣື": "dontrī",
-                "ຕ່ອຕ້ານ": "tǭtān",
-                "ຕ່າງໆ": "tāng tāng",
-                "ຕ້ານ": "Tān",
-                "ຕອບ": "tǭp",
-                "ຕາ": "tā",
-                "ຕາມ": "tām",
-                "ຕາແສງ": "tāsǣng",
-                "ຕິດຕາມ": "Tittām",
-                "ຕົວ": "tūa",
-                "ຕຳນານ-ພົງສາວະດານ": "Tamnān-phongsāvadān",
-                "ຖານ": "thān",
-                "ຖານທີ່ໝັ້ນ": "thānthīman",
-                "ຖາວອນ": "thāvǭn",
-                "ຖືກຕ້ອງ": "thư̄ktǭng",
-                "ທ່ານ": "Thān",
-                "ທ່ານນາງ": "Thānnāng",
-                "ທ້າວ": "Thāo",
-                "ທ້າວ": "Thāo",
-                "ທລຍ": "Thǭ Lǭ Nyǭ",
-                "ທະສະຊາຕະກະ": "Thasasātaka",
-                "ທະວາວາ": "Thavāvā",
-                "ທະວີສຸກ": "Thavīsuk",
-                "ທາງ": "Thāng",
-                "ທິດສະດີ": "Thitsadī",
-                "ທິດາຈັນ": "Thidāchan",
-                "ທີ": "thī",
-                "ທີ່ຫັ້ນ": "thīhan",
-                "ທຸກ": "thuk",
-                "ທຸກຍາກ": "thuknyāk",
-                "ທົ່ວ": "thūa",
-                "ທົງສະຫວາດ": "Thongsavāt",
-                "ທຽບໃສ່": "thīapsai",
-                "ທຳດີ": "Thamdi",
-                "ທຳມະການ": "Thammakān",
-                "ທຳມະຊາດ": "thammasāt",
-                "ທຳມະເທວາ": "Thammathēvā",
-                "ທັດສະນະວິຈານ": "thatsanavichān",
-                "ທັນວາ": "Thanvā",
-                "ທັມ": "tham",
-                "ທັມມະທານ": "thammathān",
-                "ນໜັງສື": "nangsư̄",
-                "ນະຄອນ": "Nakhǭn",
-                "ນາງ": "Nāng",
-                "ນາປາກແຕນ": "Nāpāktǣn",
-                "ນາມ": "nām",
-                "ນິຍົມໄທ": "Niyomthai",
-                "ນິຕິກຳ": "nitikam",
-                "ນິທານ": "Nithān",
-                "ນິວັດ": "Nivat",
-                "ນຳ": "nam",
-                "ນັກ": "Nak",
-                "ນັກກະວີ": "nakkavī",
-                "ນັກຂຽນ": "Nakkhīan",
-                "ນັກປະພັນ": "Nakpaphan",
-                "ນັກຮຽນ": "nakhīan",
-                "ນໍຣະສິລປ໌": "Nǭrasin",
-                "ບ່ອນ": "bǭn",
-                "ບ້ານນາ": "bānnā",
-                "ບອກ": "bǭk",
-                "ບອລເມີ": "Bǭnmœ̄",
-                "ບາງ": "bāng",
-                "ບາລີໄ": "Bālī",
-                "ບຸນ": "bun",
-                "ບຸນກວ້າງ": "Bunkwāng",
-                "ບຸນຍະພອນ": "Bunnyaphǭn",
-                "ບຸນຍາວົງ": "Bunnyāvong",
-                "ບຸນທະນອງ": "Bunthanǭng",
-                "ບຸນທັມ": "Buntham",
-                "ບຸນເລີງ": "Bunlœ̄ng",
-                "ບຸນເລືອ": "Bunlư̄a",
-                "ບູຮານ": "būhān",
-                "ບົດ": "Bot",
-                "ບົດກອນ": "botkǭn",
-                "ບົດກະວີ": "botkavī",
-                "ບົດຄວາມ": "Botkhwām",
-                "ບົດຮຽນ": "Bothīan",
-                "ບົວບາງບຶງ": "Būabāngbưng",
-                "ບົວໄລ": "Būalai",
-                "ບັນຊີ": "Bansī",
-                "ບັນທຶກ": "banthưk",
-                "ບັນນາທິການ": "bannāthikān",
-                "ບັນຫາ": "banhā",
-                "ບໍ່": "bǭ",
-                "ປ້າ": "pā",
-                "ປຣະດິດ": "Pradit",
-                "ປຣຽນ": "parīan",
-                "ປອງດອງ": "Pǭngdǭng",
-                "ປຮະເສີດ": "Prasœ̄t",
-                "ປະກອບ": "pakǭp",
-                "ປະຈຳ": "pacham",
-                "ປະສິດທິຜົນ": "pasitthiphon",
-                "ປະສິດທິພາບ": "pasitthiphāp",
-                "ປະສົມ": "Pasom",
-                "ປະຊາຊົນ": "Pasāson",
-                "ປະຊາທິປະໄຕ": "Pasāthipatai",
-                "ປະຕິທິນ": "patithin",
-                "ປະຕິບັດ": "patibat",
-                "ປະຕິວັດ": "Pativat",
-                "ປະພັນ": "paphan",
-                "ປະມວນ": "Pamūan",
-                "ປະລິນດາ": "Palindā",
-                "ປະຫວັດ": "Pavat",
-                "ປະຫວັດສາດ": "Pavatsāt",
-                "ປະເສິດ": "Pasœ̄t",
-                "ປະເທດ": "Pathēt",
-                "ປະເພນີ": "paphēnī",
-                "ປະເມີນຜົນ": "Pamœ̄nphon",
-                "ປະໂຫຍກ": "payōk",
-                "ປາກປາສັກ": "Pākpāsak",
-                "ປາງຄຳ": "Pāngkham",
-                "ປາສມໍ": "Pāsamǭ",
-                "ປານ": "Pān",
-                "ປານຄຳ": "Pānkham",
-                "ປາແດກ": "Pādǣk",
-                "ປີ": "pī",
-                "ປຶ້ມ": "Pu̕m",
-                "ປຶ້ມ": "pư̄m",
-                "ປຸກໃຈ": "pukchai",
-                "ປູ່": "pū",
-                "ປົກຄອງ": "pokkhǭng",
-                "ປົກປັກ": "Pokpak",
-                "ປັນຍາສິລິ": "Pannyāsili",
-                "ປັນປຸງ": "pappung",
-                "ຜ່ານ": "phān",
-                "ຜ້າແພ": "phāphǣ",
-                "ຜະຫຍາກອນ": "Phanyākǭn",
-                "ຜາບັກກຳ": "Phābakkham",
-                "ຜິວລາວັນ": "Phiulāvan",
-                "ຜູ້": "Phū",
-                "ຜູ້ຮິບໂຮມ": "phūhiphōm",
-                "ຜູ້ແທນ": "Phūthǣn",
-                "ຜົນ": "phon",
-                "ຜົນກະທົບ": "phonkathop",
-                "ຜົນງານ": "phonngān",
-                "ຜົນໄດ້ຮັບ": "phondaihap",
-                "ຝຣັ່ງ": "farang",
-                "ຝຣັ່ງເສດ": "Farangsēt",
-                "ຝັນ": "fan",
-                "ພ": "Phǭ",
-                "ພ.ສ.": "Phǭ.Sǭ.",
-                "ພ້ອມດ້ວຍ": "phǭmdūai",
-                "ພຣະ": "Phra",
-                "ພຣະປຣິຍັດຕິທັມ": "phraparinyattitham",
-                "ພຣະຣາຊອ": "Phrarātsa",
-                "ພຣະເມົາ": "phranao",
-                "ພວງດອກຊ້ອນ": "Phūangdǭksǭn",
-                "ພອນກະເສີມສຸກ": "Phǭnkasœ̄msuk",
-                "ພອນແກ້ວ": "Phǭnkǣo",
-                "ພະ": "Pha",
-                "ພະຄຼິທະສາສນາ": "Phakhitthasātsanā",
-                "ພະຄຳພີ": "Phakhamphi",
-                "ພະຈິກ": "Phachik",
-                "ພະບາງ": "Phabāng",
-                "ພະພຸດທະສາສະນາ": "Phaphutthasāsanā",
-                "ພະລານໄຊ": "Phalānsai",
-                "ພະແນກ": "Phanǣk",
-                "ພາກ": "Phāk",
-                "ພາສາ": "phāsā",
-                "ພາສາສາດ": "phāsāsāt",
-                "ພາສີ": "phāsī",
-                "ພາຍໃຕ້": "phāitai",
-                "ພາບ": "phāp",
-                "ພາບ": "phāp",
-                "ພິທີກຳ": "phithīkam",
-                "ພິມ": "phim",
-                "ພິມພັນທະວົງ": "Phimphanthavong",
-                "ພິລະອາດຫານ": "philaʻāthān",
-                "ພິລາວົງສ໌": "Philāvong",
-                "ພື້ນເມືອງ": "phư̄nmư̄ang",
-                "ພຸດທະສາສະນາ": "Phutthasātsanā",
-                "ພຸທທະໂຄສະໂກ": "Phutthakhōsakō",
-                "ພູທອນ": "phūthǭn",
-                "ພູມີ": "Phūmī",
-                "ພົງສາວະດານ": "phongsāvadān",
-                "ພົບ": "phop",
-                "ພັກ": "Phak",
-                "ພັດທະນາ": "Phatthanā",
-                "ຟ້າງຸ່ມ": "Fāngum",
-                "ມ.": "Mǭ.",
-                "ມະຫາ": "Mahā",
-                "ມະຫາຊາລີ": "Mahāsālī",
-                "ມະໂຫສົດ": "Mahōsot",
-                "ມາ": "mā",
-                "ມາລາວົງ": "Mālāvong",
-                "ມິຖຸນາ": "Mithunā",
-                "ມີ": "mī",
-                "ມືນ": "Mư̄n",
-                "ມຸ່ງ": "mung",
-                "ມຸງຄຸລເ": "mungkhun",
-                "ມູນແຖນແຕ່ງ": "Mūnthǣntæng",
-                "ມູນນິທິ": "Mūnnithi",
-                "ມູນເຊື້ອ": "mūnsư̄a",
-                "ມັດທະຍົມ": "matthayom",
-                "ມັດທະຍົມສຶກສາ": "Matthayomsưksā",
-                "ມັດທາວ": "Matthāi",
-                "ມໍລະດົກ": "mǭladok",
-                "ຢອດ": "yǭt",
-                "ຢູ່": "yū",
-                "ຣາຊບັນດິດ": "Rātsabandit",
-                "ຣາຊບັນດິຕ": "Rātbandit",
-                "ຣາຊບັນດິຕສະພາລາວ": "Rātsabanditsaphā",
-                "ຣາຊອານາຈັກ": "Rātsaʻānāchak",
-                "ຣັດຕະນະກະວີ": "Rattanakavī",
-                "ລ້ານ": "Lān",
-                "ລະດັບ": "ladap",
-                "ລະບຽບ": "labīap",
-                "ລາຍງານ": "Lāingān",
-                "ລາຍຕ່ຳ": "Lāitam",
-                "ລາດສະດອນ": "lātsadǭn",
-                "ລາດຊະວົງ": "lātsavong",
-                "ລານຄຳ": "Lānkham",
-                "ລາວ": "Lāo",
-                "ລາວດວງເດືອນ": "Lāodūangdư̄an",
-                "ລຶບລ້າງ": "Lưplāng",
-                "ລູກສິດ": "lūksit",
-                "ລູກດອນກະເດັນ": "Lūkdǭnkaden",
-                "ລົມ": "Lom",
-                "ລັດ": "Lat",
-                "ລັດຖະບານ": "Latthabān",
-                "ລັດທະຍົດ": "Latthayot",
-                "ລໍເບຼຍຢາວ": "Lǭbrīayāo",
-                "ວ່າ": "vā",
-                "ວ່າການ": "Vākān",
-                "ວ່າດ້ວຍ": "Vādūai",
-                "ວະຈີວິພາກ": "Vachīviphāk",
-                "ວະຊິຣະຍານະວິສຸທທິ": "Vajirañāṇavisuddhi",
-                "ວາຣະສານ": "Vārasān",
-                "ວາລະສາມ": "Vālasān",
-                "ວິຈິດສິນ": "Vichitsin",
-                "ວິສາຫະກິດ": "Visāhakit",
-                "ວິຊາ": "Visā",
-                "ວິຖີຄົນ": "vithīkhon",
-                "ວິຖີທຳ": "Vithītham",
-                "ວິທະຍາສາດ": "Vithanyāsāt",
-                "ວິທີ": "vithī",
-                "ວິວັດ": "vivat",
-                "ວິໄນ": "vinai",
-                "ວີຣະວົງສ໌": "Vīravong",
-                "ວີລະຊົນ": "vīlason",
-                "ວົງ": "Vong",
-                "ວົງກິດ": "ʻAngkit",
-                "ວົງສິນ": "Vongsin",
-                "ວົງວິຈິດ": "Vongvichit",
-                "ວຽກງານ": "vīakngān",
-                "ວຽງ": "Vīang",
-                "ວຽງຈັນ": "Vīangchan",
-                "ວຽງໄຊ": "Vīangsai",
-                "ວຽດນາມ": "Vīatnām",
-                "ວັດ": "Vat",
-                "ວັດຈະນານຸກົມ": "Vatchanānukom",
-                "ວັດທະນະທຳ": "vatthanatham",
-                "ວັນສ້າງ": "vansāng",
-                "ວັນທີ": "vanthī",
-                "ວັນນະຄະດີ": "vannakhadī",
-                "ວັນນະຄຳ": "vannakam",
-                "ວັນນະສິນ": "Vannasin",
-                "ວັນນິພາ": "Vanniphā",
-                "ວັນໄຊ": "Vansai",
-                "ວໍຣະຈິດ": "Vǭrachit",
-                "ວໍລະຈິດ": "Vǭlachit",
-                "ຫ້ອງ": "Hǭng",
-                "ຫ້ອງສມຸດ": "Hǭngsamut",
-                "ຫ້າ": "hā",
-                "ຫຍຸ້ງຍາກ": "nyungyāk",
-                "ຫຍໍ້": "nyǭ",
-                "ຫລວງ": "Lūang",
-                "ຫລວງລາດ": "Lūanglāt",
-                "ຫລວງວັນນາ": "Lūangvannā",
-                "ຫລານ": "lān",
-                "ຫອມ": "Hǭm",
-                "ຫາຍ": "hāi",
-                "ຫົງສາ": "Hongsā",
-                "ຫົງສາຄອນ": "Hongsākhǭn",
-                "ຫົງເຫີນ": "Honghœ̄n",
-                "ຫົວຂໍ້": "hūakhǭ",
-                "ຫົວໃຈ": "hūachai",
-                "ຫຼວງພຣະບາງ": "Lūangphrabāng",
-                "ຫຼຽວ": "līeo",
-                "ຫັດທະຈັນ": "Hatthachan",
-                "ຫໍ": "Hǭ",
-                "ໜຶ່ງ": "nưng",
-                "ໜຸຸ່ມ": "Num",
-                "ໝູ່ບ້ານ": "mūbān",
-                "ໝູນແກ້ວ": "Mūnkǣo",
-                "ອ່າ": "ʻān",
-                "ອະນຸສາວະລີ": "ʻanusāvalī",
-                "ອະນຸວົງ": "ʻAnuvong",
-                "ອະລຸນ": "ʻAlun",
-                "ອາຈານ": "ʹĀchān",
-                "ອາຈານໃຫຍ່": "ʻĀchānnyai",
-                "ອານາຈັກ": "ʻānāchak",
-                "ອານັນໂທ": "ʻĀnanthō",
-                "ອາຣ": "ʻĀr",
-                "ອາຣຸນ": "ʻĀrun",
-                "ອິນສີຊຽງໃໝ່": "ʻInsīsīangmai",
-                "ອິນທະວົງສ໌": "ʻInthavong",
-                "ອີງໃສ່": "ʻīngsai",
-                "ອຶນ": "U̕n",
-                "ອຸດສາຫະກຳ": "ʻUtsāhakam",
-                "ອຸດົມການ": "ʻudomkān",
-                "ອຸໄທ": "ʻUthai",
-                "ອົງການ": "ʻOngkān",
-                "ອົບຮົມ": "ʻophom",
-                "ອຳທິລອ": "ʻAmthilǭ",
-                "ອຳນາດ": "ʻamnāt",
-                "ອັກຂຣະວິທີ": "ʻAkkharavithī",
-                "ອັກສອນສິລປ໌": "ʻaksǭnsin",
-                "ອັດຕາ": "ʻattā",
-                "ອັນ": "ʻAn",
-                "ອັພຍຍສັພທ໌": "ʻapphayasap",
-                "ອໍລະບູນ": "ʻǬlabūn",
-                "ຮ່ວມສະໄໜ": "hūamsamai",
-                "ຮ່າໂນ້ຍ": "Hānōi",
-                "ຮ່ຳຮຽນ": "hamhīan",
-                "ຮ້ອຍ": "Hǭi",
-                "ຮ້ານນາຍໄຊຍ໌": "Rānnāisai",
-                "ຮວບຮວມໂດຍ": "Hūaphūam",
-                "ຮອດບຸນ": "Hǭtbun",
-                "ຮອບ": "hǭp",
-                "ຮິບໂຮມ": "hiphōm",
-                "ຮືອນ": "hūʼan",
-                "ຮຸ່ງ": "Hung",
-                "ຮູບ": "hūp",
-                "ຮູບປັ້ນ": "hūppan",
-                "ຮູບພາບ": "Hūppāp",
-                "ຮຽບຮຽງ": "hīaphīang",
-                "ຮຽບຮຽງ": "līaplīang",
-                "ຮັກ": "hak",
-                "ຮັກສາ": "Haksā",
-                "ຮັນສ໌": "Han",
-                "ຮັບ": "hap",
-                "ເກຣກໍຣີ": "Krēkǭrī",
-                "ເກອກ": "Georg",
-                "ເກອກ": "Kēʻǭk",
-                "ເຂົ້າ": "khao",
-                "ເຂົ້າມາ": "khaomā",
-                "ເຂົ້າໃຈ": "Khaochai",
-                "ເຈ": "Chē",
-                "ເຈືອງ": "Chư̄ang",
-                "ເຈົ້າ": "Chao",
-                "ເຈົ້າພາບ": "chaophāp",
-                "ເສື້ອ": "sư̄a",
-                "ເສັ້ນທາງ": "sēnthāng",
-                "ເຊິ່ງ": "sœ̄ng",
-                "ເຊື່ອມໂຍງ": "Sư̄amnyōng",
-                "ເດດວົງພັນ": "Dētvongphan",
-                "ເດີນທາງ": "Dœ̄nthāng",
-                "ເດືອນ": "Dư̄an",
-                "ເຕມິຍະ": "Tēmiya",
-                "ເຕັກນິກ": "teknik",
-                "ເຖິງ": "thœ̄ng",
-                "ເທສນາ": "Thētsanā",
-                "ເທບ": "Thēp",
-                "ເທບສິດທາ": "Thēpsitthā",
-                "ເທື່ອ": "thư̄a",
-                "ເນດຕະວົງ": "Nēttavong",
-                "ເນື່ອງ": "nư̄ang",
-                "ເນື່ອງໃນ": "Nūangnai",
-                "ເນື້ອໃນ": "nư̄anai",
-                "ເບິ່ງ": "bœ̄ng",
-                "ເບີຕັນ": "Bœ̄tan",
-                "ເບີເກີ": "Bœ̄kœ̄",
-                "ເປ້າໝາຍ": "paomāi",
-                "ເປັນ": "pen",
-                "ເຜົ່າ": "phao",
-                "ເພື່ອ": "phư̄a",
-                "ເພື່ອ": "Phua",
-                "ເພັງແສງຄຳ": "Phengsǣngkham",
-                "ເພັຊ": "phet",
-                "ເມສາ": "Mēsā",
-                "ເມທີວໍຣະຄຸນ": "Mēthīvǭrakhun",
-                "ເມືອງ": "Mư̄ang",
-                "ເມືອງພວນ": "Mư̄angphūan",
-                "ເຢຊູ": "Yēsū",
-                "ເລື່ອງ": "lư̄ang",
-                "ເລືອກ": "lư̄ak",
-                "ເວທີ": "vēthī",
-                "ເວີ່ນວິລາວົງ": "Vœ̄nvīlāvong",
-                "ເຫງື່ອ": "ngư̄a",
-                "ເຫດການ": "hētkān",
-                "ເຫຼັ້ມ": "Lem",
-                "ເອກະສານ": "ʻēkasān",
-                "ເອົາ": "ʻao",
-                "ເຮົາ": "hao",
-                "ແຂວງ": "Khwǣng",
-                "ແສງສຸວັນ": "Sǣngsuvan",
-                "ແຕ່ງ": "tæng",
-                "ແຕ້ມ": "tǣm",
-                "ແບບ": "Bǣp",
-                "ແປ": "pǣ",
-                "ແປງ": "pǣng",
-                "ແປດສິບ": "Pǣtsip",
-                "ແຜ່ນດິນ": "phǣndin",
-                "ແຜນ": "Phǣn",
-                "ແຜນການ": "Phǣnkān",
-                "ແຜນທີ່": "phǣnthī",
-                "ແຜນແມ່ບົດ": "Phǣnmǣbot",
-                "ແພງ": "Phǣng",
-                "ແມ່": "mǣ",
-                "ແມ່ຍິງ": "Mǣnying",
-                "ແມ່ບົດ": "mǣbot",
-                "ແມງ": "mǣng",
-                "ແລະ": "læ",
-                "ແຫ່ງ": "hǣng",
-                "ແຮກ": "hǣk",
-                "ແຮງງານ": "hǣnngān",
-                "ໂຄງການ": "Khōngkān",
-                "ໂຄສະນາ": "Khōtsanā",
-                "ໂຄສະນາ": "Khōsanā",
-                "ໂດຍ": "dōi",
-                "ໂພນ": "Phōn",
-                "ໂຫຣາສາດ": "hōrāsāt",
-                "ໂອກາດ": "ʻōkāt",
-                "ໂຮງພິມ": "Hōngphim",
-                "ໂຮງຮຽນ": "Hōnghīan",
-                "ໂຮມ": "hōm",
-                "ໄສ": "Sai",
-                "ໄຊຊະນະ": "Saisana",
-                "ໄຊຊະນະ": "Xaixana",
-                "ໄຊຍະບູລີ": "Sainyabulī",
-                "ໄຊຍະວົງ": "Saiyavong",
-                "ໄພວັນ": "Phaivan",
-                "ໄພວັນ": "Phivan",
-                "ໄຟ": "Fai",
-                "ໄຟດ່າງ": "Faidāng",
-                "ໄຟຟ້າ": "faifā",
-                "ໄມ່ສິງ": "Maising",
-                "ໄລຍະ": "lainya",
-                "ໄວຍາກອນ": "Vainyākǭn",
-                "ໄຫ້": "hai",
-                "ໃກ້": "kai",
-                "ໃຈ": "chai",
-                "ໃດ": "dai",
-                "ໃນ": "nai",
-                "ໃບໂພ": "Baiphō",
-                "ໃຫຍ່": "Nyai",
-                "ໃໝ່": "Mai"
-            }
-        },
+class LazyTranslitData(collections.abc.MutableMapping):
+    """Mapping of table ids to transliteration tables.
 
-        "translit_rules": "\u0EC1\u0EB0 <> æ; \u0EC1 <> ǣ; \u0EC4 <> ai; \u0EB2 <> ā; \u0EB2\u0E8D <> āi; \u0ECD\u0EB2 <> am; \u0EC0\u0EBB\u0EB2 <> ao; \u0EB0 <> a; \u0E9A <> b; \u0E88 <> ch; \u0E94 <> d; \u0EC0\u0EB0 <> e; \u0EC0 <> ē; \u0E9D <> f; \u0EAB <> h; \u0EC0\u0EBD\u0EB0 <> ia; \u0EBD <> īa; \u0EB4 <> i; \u0EB5 <> ī; \u0E82 <> kh; \u0E81 <> k; \u0EAF\u0EA5\u0EAF <> la; \u0E85 <> l; \u0EA1 <> m; \u0E87 <> ng; \u0E8D <> ny; \u0E99 <> n; \u0EBB <> o; \u0EC2 <> ō; \u0EAD <> ǫ; \u0ECD <> ǭ; \u0EC0\u0EB4 <> œ; \u0EC0\u0EB5 <> œ̄; \u0E9C <> ph; \u0E9B <> p; \u0EA3 <> r; \u0EAA <> s; \u0E96 <> th; \u0E95 <> t; \u0EA7 <> ua; \u0EA7\u0EBB <> ūa; \u0EB8 <> u; \u0EB9 <> ū; \u0EB6 <> ư; \u0EB7 <> ư̄; \u0EC0\u0EAD\u0EB0\u0EB6\u0EB6 <> ưa; \u0EA7\u0EBB <> ư̄a; \u0EA7 <> v; \u0EA2 <> y; \u0EAD <> ʻ;"
-    }
-}
+    Each table is imported from el_utilities.tables the first time its table
+    id is requested, so only the tables in use are held in memory. If a table
+    file built by el_utilities.tablefile exists and is not older than the table
+    module, it is memory-mapped instead of importing the module.
+
+    Other tables can be added by assigning them to a table id, which replaces
+    any table module of that id. Deleting an added table makes the table
+    module available again; table modules themselves cannot be deleted. To
+    replace a table already in use, call register_table(), which also discards
+    compiled tables.
+
+    Args:
+        package (str, optional): Package containing table modules. Defaults to "el_utilities.tables".
+    """
+    def __init__(self, package = "el_utilities.tables"):
+        self._package = package
+        self._tables = {}
+        self._table_ids = None
+        self._added = set()
+
+    def __getitem__(self, table_id):
+        table = self._tables.get(table_id)
+        if table is None:
+            if table_id not in self.table_ids():
+                raise KeyError(table_id)
+            table = self._load(table_id)
+            self._tables[table_id] = table
+        return table
+
+    def __setitem__(self, table_id, table):
+        self._tables[table_id] = table
+        self._added.add(table_id)
+
+    def __delitem__(self, table_id):
+        if table_id not in self._added:
+            raise KeyError(table_id)
+        self._added.discard(table_id)
+        del self._tables[table_id]
+
+    def _load(self, table_id):
+        from . import tablefile
+        path = tablefile.table_file_path(table_id)
+        if path.is_file():
+            if os.path.getmtime(path) >= os.path.getmtime(self.source_path(table_id)):
+                return tablefile.load_table_file(path)
+        return self.load_source(table_id)
+
+    def load_source(self, table_id):
+        """Import table from its module, ignoring any table file.
+
+        Args:
+            table_id (str): Table id.
+
+        Returns:
+            dict: Transliteration table.
+        """
+        return importlib.import_module(f"{self._package}.{table_id}").TABLE
+
+    def source_path(self, table_id):
+        """Path of the module defining a table, without importing it.
+
+        Args:
+            table_id (str): Table id.
+
+        Returns:
+            str | None: Path of the table module, or None for an added table.
+        """
+        if table_id in self._added:
+            return None
+        return importlib.util.find_spec(f"{self._package}.{table_id}").origin
+
+    def table_ids(self):
+        """Table ids available, without loading any tables.
+
+        Returns:
+            frozenset[str]: Available table ids, of table modules and added tables.
+        """
+        if self._table_ids is None:
+            package = importlib.import_module(self._package)
+            self._table_ids = frozenset(m.name for m in pkgutil.iter_modules(package.__path__))
+        return self._table_ids | self._added if self._added else self._table_ids
+
+    def loaded(self):
+        """Table ids already loaded.
+
+        Returns:
+            list[str]: Loaded table ids.
+        """
+        return list(self._tables)
+
+    def __contains__(self, table_id):
+        return table_id in self.table_ids()
+
+    def __iter__(self):
+        return iter(sorted(self.table_ids()))
+
+    def __len__(self):
+        return len(self.table_ids())
+
+    def __repr__(self):
+        return f"LazyTranslitData({sorted(self.table_ids())!r}, loaded={self.loaded()!r})"
 
+TRANSLIT_DATA = LazyTranslitData()
@@ -8,7 +8,13 @@ setup(
     author='Andrew Cunningham',
     author_email='',
     license='MIT',
-    packages=['el_utilities'],
+    packages=['el_utilities', 'el_utilities.tables'],
+    package_data={'el_utilities.tables': ['*.eltt']},
+    entry_points={
+        'console_scripts': [
+            'el-translit = el_utilities.streaming:main',
+        ],
+    },
     install_requires=[
         'el_internationalisation',
         'regex',
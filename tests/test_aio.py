@@ -0,0 +1,85 @@
+import asyncio, concurrent.futures, threading, time
+import pytest
+
+pytest.importorskip("el_internationalisation")
+
+from el_utilities import translit_dict, translit_icu, translit_rules
+from el_utilities.aio import translit_dict_async, translit_icu_async, translit_rules_async, translit_aiter
+
+@pytest.fixture
+def executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+def collect(agen):
+    async def run():
+        return [item async for item in agen]
+    return asyncio.run(run())
+
+def test_async_functions_match_sync_functions(executor):
+    async def run():
+        return await asyncio.gather(
+            translit_dict_async("ພາສາລາວ", "lo"),
+            translit_dict_async("tāng tāng", "lo", "reverse", executor=executor),
+            translit_icu_async(["Ελλάδα", "αβγ"], "Greek-Latin", executor=executor),
+            translit_rules_async("abc", "a > x ; c > z ;", executor=executor))
+    assert asyncio.run(run()) == [
+        translit_dict("ພາສາລາວ", "lo"),
+        translit_dict("tāng tāng", "lo", "reverse"),
+        translit_icu(["Ελλάδα", "αβγ"], "Greek-Latin"),
+        translit_rules("abc", "a > x ; c > z ;")]
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_aiter_keeps_input_order(executor, asynchronous):
+    sources = [str(i) for i in range(20)]
+    def slow(s):
+        # Later items finish first
+        time.sleep(0.001 * (20 - int(s)))
+        return s + "!"
+    async def agen():
+        for s in sources:
+            yield s
+    results = collect(translit_aiter(agen() if asynchronous else sources, slow, concurrency=4, executor=executor))
+    assert results == [s + "!" for s in sources]
+
+def test_aiter_bounds_items_in_flight(executor):
+    lock = threading.Lock()
+    in_flight = [0, 0]
+    def translit(s):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return s
+    read = []
+    async def agen():
+        for i in range(12):
+            read.append(i)
+            yield str(i)
+    async def run():
+        results = []
+        async for item in translit_aiter(agen(), translit, concurrency=2, executor=executor):
+            # Sources are read at most one slot ahead of the consumer
+            assert len(read) <= len(results) + 2
+            results.append(item)
+        return results
+    assert asyncio.run(run()) == [str(i) for i in range(12)]
+    assert in_flight[1] <= 2
+
+def test_aiter_cancels_pending_items_on_early_exit():
+    started = []
+    def translit(s):
+        started.append(s)
+        time.sleep(0.05)
+        return s
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        async def run():
+            agen = translit_aiter([str(i) for i in range(10)], translit, concurrency=4, executor=executor)
+            first = await agen.__anext__()
+            await agen.aclose()
+            return first
+        assert asyncio.run(run()) == "0"
+    # Items submitted but not started when the consumer stopped are cancelled
+    assert started[:1] == ["0"] and len(started) < 4
@@ -0,0 +1,44 @@
+import threading
+
+from el_utilities.caching import LRUCache, PerThreadCache, ResultCache
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+def test_per_thread_cache_is_per_thread():
+    cache = PerThreadCache()
+    cache.local().put("k", "main")
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(cache.local().get("k")))
+    thread.start()
+    thread.join()
+    assert seen == [None]
+    assert cache.local().get("k") == "main"
+
+def test_per_thread_cache_spares_are_taken_once():
+    cache = PerThreadCache()
+    cache.add_spare("k", "spare")
+    assert cache.spares("k") == 1
+    assert cache.take_spare("k") == "spare"
+    assert cache.take_spare("k") is None
+    cache.add_spare("k", "spare")
+    cache.clear()
+    assert cache.spares("k") == 0
+
+def test_result_cache_lookup():
+    calls = []
+    def compute(s):
+        calls.append(s)
+        return s.upper()
+    cache = ResultCache(maxsize=10, max_length=5)
+    assert cache.lookup(("k", "ab"), "ab", compute, "ab") == "AB"
+    assert cache.lookup(("k", "ab"), "ab", compute, "ab") == "AB"
+    assert cache.lookup(("k", "abcdef"), "abcdef", compute, "abcdef") == "ABCDEF"
+    assert calls == ["ab", "abcdef"]
+    assert cache.stats()["hits"] == 1
+    assert len(cache) == 1
@@ -0,0 +1,52 @@
+import pytest
+
+from el_utilities import instrumentation
+from el_utilities.instrumentation import collect_stats, get_stats, reset_stats
+
+def test_counters_and_timers_are_recorded_while_enabled():
+    with collect_stats() as stats:
+        instrumentation.count("things")
+        instrumentation.count("things", 2)
+        instrumentation.add_time("phase", 0.5)
+        with instrumentation.timer("phase"):
+            pass
+    assert stats["counters"] == {"things": 3}
+    assert stats["timers"]["phase"]["calls"] == 2
+    assert stats["timers"]["phase"]["total_s"] >= 0.5
+
+def test_nothing_is_recorded_while_disabled(monkeypatch):
+    monkeypatch.setattr(instrumentation, "enabled", False)
+    reset_stats()
+    instrumentation.count("things")
+    instrumentation.add_time("phase", 1.0)
+    with instrumentation.timer("phase"):
+        pass
+    assert get_stats() == {"counters": {}, "timers": {}}
+
+def test_collect_stats_restores_state(monkeypatch):
+    monkeypatch.setattr(instrumentation, "enabled", False)
+    with collect_stats():
+        instrumentation.count("before")
+    with collect_stats(reset=False) as stats:
+        assert instrumentation.enabled
+        instrumentation.count("after")
+    assert not instrumentation.enabled
+    assert stats["counters"] == {"before": 1, "after": 1}
+    with collect_stats() as stats:
+        pass
+    assert stats["counters"] == {}
+
+def test_translit_dict_stats():
+    pytest.importorskip("el_internationalisation")
+    from el_utilities import translit_dict, clear_translit_tables
+    clear_translit_tables()
+    with collect_stats() as stats:
+        translit_dict("ພາສາ", "lo")
+        translit_dict("ລາວ", "lo")
+    counters = stats["counters"]
+    assert counters["table_builds"] == 1
+    assert counters["table_cache_misses"] == 1
+    assert counters["table_cache_hits"] == 1
+    assert counters["chars_processed"] == len("ພາສາ") + len("ລາວ")
+    for name in ("table_build", "collator_sort", "table_normalise", "table_index", "replace", "normalise"):
+        assert stats["timers"][name]["calls"] >= 1, name
@@ -0,0 +1,73 @@
+import pytest
+
+pytest.importorskip("el_internationalisation")
+
+from el_utilities import LDMLRegistry, translit_icu, transform_references
+from el_utilities.transliteration import icu
+
+def write_ldml(path, *transforms):
+    path.write_text("<supplementalData><transforms>" + "".join(
+        f'<transform source="{source}" target="{target}" direction="forward" alias="{source}-{target}"><tRule>{rules}</tRule></transform>'
+        for source, target, rules in transforms) + "</transforms></supplementalData>", encoding="utf-8")
+    return path
+
+def test_transform_references():
+    assert transform_references(":: Foo-Bar ; ::NFD (NFC); ::(Lower); ::[:Latin:]; a > b ;") == {"Foo-Bar", "Bar-Foo", "NFD", "NFC", "Lower"}
+    assert transform_references(":: [:Lao:] Lao-Latin ;") == {"Lao-Latin", "Latin-Lao"}
+    assert transform_references("::[:Lao:]Lao-Latin;") == {"Lao-Latin", "Latin-Lao"}
+    assert transform_references(":: [[:Lao:][\\]]] NFD ([:Latin:] NFC) ;") == {"NFD", "NFC"}
+
+def test_registry_resolves_referenced_transforms_first(tmp_path):
+    write_ldml(tmp_path / "a.xml", ("RegBaz", "Qux", ":: RegFoo-Bar ; b > c ;"), ("RegFoo", "Bar", "a > b ;"))
+    registry = LDMLRegistry(tmp_path, cache_file=False)
+    registry.install()
+    try:
+        assert translit_icu("a", "RegBaz-Qux") == "c"
+    finally:
+        registry.uninstall()
+
+def test_registry_tolerates_circular_references(tmp_path):
+    write_ldml(tmp_path / "a.xml", ("CycA", "B", ":: CycB-A ; a > b ;"), ("CycB", "A", ":: CycA-B ; b > a ;"))
+    registry = LDMLRegistry(tmp_path, cache_file=False)
+    # Stops instead of recursing forever; ICU then reports the unknown transform
+    with pytest.raises(icu.ICUError):
+        registry.resolve("CycA-B")
+
+def test_register_ldml_files_in_dependency_order(tmp_path):
+    from el_utilities import register_ldml_files
+    write_ldml(tmp_path / "a.xml", ("BulkBaz", "Qux", ":: BulkFoo-Bar ; b > c ;"))
+    write_ldml(tmp_path / "b.xml", ("BulkFoo", "Bar", "a > b ;"))
+    (tmp_path / "c.xml").write_text("<broken", encoding="utf-8")
+    reports = register_ldml_files(tmp_path, workers=2)
+    assert [report.ids for report in reports] == [["BulkBaz-Qux"], ["BulkFoo-Bar"], []]
+    assert reports[2].errors[0][0] is None
+    assert translit_icu("a", "BulkBaz-Qux") == "c"
+
+def test_register_ldml_files_reports_failures_and_dependents(tmp_path):
+    from el_utilities import register_ldml_files
+    write_ldml(tmp_path / "a.xml", ("FailBaz", "Qux", ":: FailFoo-Bar ; b > c ;"), ("FailOk", "Qux", "a > b ;"))
+    write_ldml(tmp_path / "b.xml", ("FailFoo", "Bar", "a > b ; a > c ;"))
+    a, b = register_ldml_files(tmp_path)
+    assert a.ids == ["FailOk-Qux"]
+    assert [name for name, error in a.errors] == ["FailBaz-Qux"]
+    assert [name for name, error in b.errors] == ["FailFoo-Bar"]
+
+def test_register_ldml_files_reports_duplicates_in_each_file(tmp_path):
+    from el_utilities import register_ldml_files
+    write_ldml(tmp_path / "a.xml", ("DupFoo", "Bar", "a > b ;"))
+    write_ldml(tmp_path / "b.xml", ("DupFoo", "Bar", "a > c ;"), ("DupOther", "Bar", ":: DupFoo-Bar ;"))
+    a, b = register_ldml_files(tmp_path)
+    assert a.ids == [] and b.ids == []
+    assert [name for name, error in a.errors] == ["DupFoo-Bar"]
+    assert sorted(name for name, error in b.errors) == ["DupFoo-Bar", "DupOther-Bar"]
+
+def test_register_ldml_files_invalidates_cached_results(tmp_path):
+    from el_utilities import register_ldml_files, enable_result_cache, disable_result_cache
+    enable_result_cache()
+    try:
+        register_ldml_files([write_ldml(tmp_path / "a.xml", ("Zz", "Yy", "a > b ;"))])
+        assert translit_icu("a", "Zz-Yy") == "b"
+        register_ldml_files([write_ldml(tmp_path / "a.xml", ("Zz", "Yy", "a > c ;"))])
+        assert translit_icu("a", "Zz-Yy") == "c"
+    finally:
+        disable_result_cache()
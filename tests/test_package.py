@@ -0,0 +1,32 @@
+import pytest, subprocess, sys
+
+def run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+def test_import_is_lazy():
+    assert run("import sys, el_utilities; print(sorted(m for m in ('icu', 'regex', 'el_internationalisation', 'el_utilities.transliteration') if m in sys.modules))") == "[]"
+
+def test_unknown_names_raise_attribute_error_without_imports():
+    code = "import sys, el_utilities; print(hasattr(el_utilities, 'unknown'), 'el_utilities.transliteration' in sys.modules)"
+    assert run(code) == "False False"
+
+def test_submodules_are_attributes():
+    assert run("import el_utilities; print(el_utilities.tablefile.__name__)") == "el_utilities.tablefile"
+
+def test_star_import_without_fcntl():
+    pytest.importorskip("el_internationalisation")
+    assert run("import sys; sys.modules['fcntl'] = None; from el_utilities import *; print('SharedResultCache' in dir())") == "False"
+
+def test_all_names_are_exported():
+    pytest.importorskip("el_internationalisation")
+    import importlib, el_utilities
+    for module, names in el_utilities._EXPORTS.items():
+        submodule = importlib.import_module(f"el_utilities.{module}")
+        for name in names:
+            assert name in el_utilities.__all__, (module, name)
+            assert hasattr(el_utilities, name), (module, name)
+            value = getattr(el_utilities, name)
+            assert value is getattr(submodule, name), (module, name)
+            # Functions and classes are defined by the submodule, not imported into it
+            if callable(value):
+                assert value.__module__ == submodule.__name__, (module, name, value.__module__)
@@ -0,0 +1,18 @@
+import multiprocessing
+import pytest
+
+pytest.importorskip("el_internationalisation")
+
+from el_utilities import translit_dict
+from el_utilities.parallel import iter_translit_parallel, translit_parallel
+
+SOURCES = ["ພາສາລາວ", None, "ກາ ຂ", 3, "xyz", "ສະບາຍດີ", "ກາ"] * 3
+
+def test_translit_parallel_keeps_order_and_non_strings():
+    expected = [translit_dict(s, "lo") if isinstance(s, str) else s for s in SOURCES]
+    assert translit_parallel(SOURCES, "dict", "lo", processes=2, chunk_size=2) == expected
+
+def test_iter_translit_parallel_with_spawn_context():
+    sources = ["tāng tāng", "khk", "phāsā lāo"]
+    results = iter_translit_parallel(sources, "dict", "lo", "reverse", processes=2, chunk_size=1, mp_context=multiprocessing.get_context("spawn"))
+    assert list(results) == [translit_dict(s, "lo", "reverse") for s in sources]
@@ -0,0 +1,85 @@
+import os
+import pytest
+
+pytest.importorskip("fcntl")
+
+from el_utilities.sharedcache import SharedResultCache, BUCKET_SIZE
+
+def test_put_and_get(tmp_path):
+    cache = SharedResultCache(tmp_path / "cache", slots=64)
+    assert cache.get(("dict", "lo", "x")) is None
+    assert cache.put(("dict", "lo", "x"), "ຂ")
+    assert cache.get(("dict", "lo", "x")) == "ຂ"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_overwrite(tmp_path):
+    cache = SharedResultCache(tmp_path / "cache", slots=64)
+    cache.put(("k",), "a")
+    cache.put(("k",), "b")
+    assert cache.get(("k",)) == "b"
+
+def test_entries_too_large_are_not_cached(tmp_path):
+    cache = SharedResultCache(tmp_path / "cache", slots=64, slot_size=64)
+    assert not cache.put(("k",), "x" * 100)
+    assert cache.get(("k",)) is None
+
+def test_size_is_bounded(tmp_path):
+    path = tmp_path / "cache"
+    cache = SharedResultCache(path, slots=16, slot_size=64)
+    size = os.path.getsize(path)
+    for i in range(1000):
+        cache.put(("k", i), str(i))
+    assert os.path.getsize(path) == size
+    assert sum(cache.get(("k", i)) is not None for i in range(1000)) <= 16
+    assert cache.get(("k", 999)) == "999"
+
+def test_existing_file_geometry_is_kept(tmp_path):
+    path = tmp_path / "cache"
+    SharedResultCache(path, slots=32, slot_size=128).put(("k",), "v")
+    cache = SharedResultCache(path, slots=1024, slot_size=512)
+    assert (cache.slots, cache.slot_size) == (32, 128)
+    assert cache.get(("k",)) == "v"
+
+def test_slots_are_rounded_to_buckets(tmp_path):
+    cache = SharedResultCache(tmp_path / "cache", slots=BUCKET_SIZE + 1)
+    assert cache.slots % BUCKET_SIZE == 0
+
+def test_clear(tmp_path):
+    cache = SharedResultCache(tmp_path / "cache", slots=64)
+    cache.put(("k",), "v")
+    cache.clear()
+    assert cache.get(("k",)) is None
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "cache"
+    path.write_bytes(b"XXXX" + bytes(64))
+    with pytest.raises(ValueError):
+        SharedResultCache(path)
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_values_are_shared_with_forked_process(tmp_path):
+    cache = SharedResultCache(tmp_path / "cache", slots=64)
+    cache.put(("parent",), "p")
+    pid = os.fork()
+    if pid == 0:
+        ok = cache.get(("parent",)) == "p" and cache.put(("child",), "c")
+        os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert cache.get(("child",)) == "c"
+
+def test_values_are_shared_between_instances(tmp_path):
+    path = tmp_path / "cache"
+    first = SharedResultCache(path, slots=64)
+    second = SharedResultCache(path)
+    first.put(("k",), "v")
+    assert second.get(("k",)) == "v"
+
+def test_bump_generation_makes_entries_stale_for_all_instances(tmp_path):
+    path = tmp_path / "cache"
+    cache, other = SharedResultCache(path, slots=64), SharedResultCache(path, slots=64)
+    cache.put(("k",), "v")
+    assert other.bump_generation() == cache.generation == 1
+    assert cache.get(("k",)) is None
+    cache.put(("k",), "w")
+    assert other.get(("k",)) == "w"
@@ -0,0 +1,67 @@
+import io
+import pytest
+
+from el_utilities.snippets import (search_dict_values, SubstringIndex, list_to_string, string_to_list,
+    iter_list_to_string, list_to_stream, iter_string_to_list)
+
+DICTIONARY = {
+    "lo": ["ພາສາລາວ", "Lao", "Laotian"],
+    "th": ["ภาษาไทย", "Thai"],
+    "km": ["ភាសាខ្មែរ", "Khmer", "Cambodian"],
+    "my": ["မြန်မာဘာသာ", "Burmese", "Myanmar"],
+    "none": [],
+    "aa": ["a", "aa", "aaa aaaa"],
+}
+
+QUERIES = ["", "a", "ao", "Lao", "Laotian", "ai", "mer", "Cambo", "an", "ian", "ພາສາ", "aaaa", "aaaaa", "x", "Thai Lao"]
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4])
+@pytest.mark.parametrize("query", QUERIES)
+def test_substring_index_matches_search_dict_values(n, query):
+    assert SubstringIndex(DICTIONARY, n).search(query) == search_dict_values(DICTIONARY, query)
+
+def test_substring_index_updates():
+    index = SubstringIndex(DICTIONARY)
+    dictionary = dict(DICTIONARY, lo=["Lao PDR"], bo=["Tibetan", "bod"])
+    index.add("lo", ["Lao PDR"])
+    index.add("bo", ["Tibetan", "bod"])
+    del dictionary["th"]
+    index.remove("th")
+    # Keys are returned in the order they were last added
+    dictionary = dict(sorted(dictionary.items(), key=lambda item: ["km", "my", "none", "aa", "lo", "bo"].index(item[0])))
+    assert index.search_many(QUERIES + ["PDR", "bo"]) == [search_dict_values(dictionary, q) for q in QUERIES + ["PDR", "bo"]]
+    assert "th" not in index and len(index) == 6
+
+# Streaming counterparts of list_to_string() and string_to_list()
+
+STRINGS = ["", "one", "one, two, three", ", one, , two,", " one,  two ,three ", "a, , , b, ", "ພາສາ, ລາວ"]
+
+@pytest.mark.parametrize("sep", [", ", ",", " :: "])
+@pytest.mark.parametrize("text", STRINGS)
+def test_iter_string_to_list_matches_string_to_list(text, sep):
+    text = text.replace(", ", sep)
+    assert list(iter_string_to_list(text, sep)) == string_to_list(text, sep)
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 65536])
+@pytest.mark.parametrize("sep", [", ", ",", " :: "])
+@pytest.mark.parametrize("text", STRINGS)
+def test_iter_string_to_list_of_stream(text, sep, chunk_size):
+    # Small reads split separators between reads
+    text = text.replace(", ", sep)
+    assert list(iter_string_to_list(io.StringIO(text), sep, chunk_size)) == string_to_list(text, sep)
+
+def test_iter_string_to_list_rejects_empty_separator():
+    with pytest.raises(ValueError):
+        list(iter_string_to_list("a", ""))
+
+LISTS = [[], ["one"], ["one", "two", "three"], ["", "one", None, 0, False, "two", 3, True], [None, ""]]
+
+@pytest.mark.parametrize("drop_bool", [True, False])
+@pytest.mark.parametrize("sep", [", ", "\n"])
+@pytest.mark.parametrize("items", LISTS)
+def test_list_to_string_counterparts(items, sep, drop_bool):
+    expected = list_to_string(items, sep, drop_bool)
+    assert "".join(iter_list_to_string(iter(items), sep, drop_bool)) == expected
+    stream = io.StringIO()
+    assert list_to_stream(iter(items), stream, sep, drop_bool) == len(expected)
+    assert stream.getvalue() == expected
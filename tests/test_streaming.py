@@ -0,0 +1,82 @@
+import io, random, unicodedata
+import pytest
+
+pytest.importorskip("el_internationalisation")
+
+from el_utilities import get_transliterator, TRANSLIT_DATA, SUPPORTED_TRANSLITERATORS, translit_dict, translit_icu, translit_rules
+from el_utilities.streaming import iter_chunks, translit_stream, translit_file, main
+
+def corpus(dir, size, seed = 0):
+    rng = random.Random(seed)
+    words = [unicodedata.normalize("NFC", w) for w in TRANSLIT_DATA[SUPPORTED_TRANSLITERATORS["lo"][0]]["translit_dict"][dir]]
+    phrases = [w for w in words if " " in w]
+    text = []
+    while sum(len(w) + 1 for w in text) < size:
+        text.append(rng.choice(phrases) if phrases and rng.random() < 0.3 else rng.choice(words))
+    return " ".join(text)
+
+def test_chunks_join_to_input():
+    text = "line one\nline two with words\r\nlast"
+    for chunk_size in (1, 3, 7, 100):
+        assert "".join(iter_chunks(io.StringIO(text), chunk_size)) == text
+
+def test_chunks_end_at_whitespace():
+    chunks = list(iter_chunks(io.StringIO("aaa bbb ccc ddd"), 5))
+    assert all(chunk[-1].isspace() for chunk in chunks[:-1])
+
+def test_chunks_avoid_spans():
+    spans = lambda before, after: before.endswith("b ")
+    chunks = list(iter_chunks(io.StringIO("a b c d e f"), 4, spans=spans))
+    assert "".join(chunks) == "a b c d e f"
+    assert not any(chunk.endswith("b ") for chunk in chunks[:-1])
+
+@pytest.mark.parametrize("dir", ["forward", "reverse"])
+@pytest.mark.parametrize("engine", ["dict", "hybrid"])
+def test_streamed_output_equals_whole_output(engine, dir):
+    text = corpus(dir, 6000)
+    translit = get_transliterator(engine, "lo", dir)
+    for chunk_size in (17, 100, 1000):
+        output = io.StringIO()
+        translit_stream(io.StringIO(text), output, translit, chunk_size)
+        assert output.getvalue() == translit(text)
+
+# Command line
+
+def test_translit_file(tmp_path):
+    text = corpus("forward", 2000)
+    (tmp_path / "in.txt").write_text(text, encoding="utf-8")
+    assert translit_file(tmp_path / "in.txt", tmp_path / "out.txt", "dict", "lo", chunk_size=100) == len(text)
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8") == translit_dict(text, "lo")
+
+def test_translit_file_standard_streams(monkeypatch, capsysbinary):
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO("tāng tāng\r\nkhk".encode("utf-8"))))
+    translit_file("-", "-", "dict", "lo", "reverse")
+    assert capsysbinary.readouterr().out.decode("utf-8") == translit_dict("tāng tāng\r\nkhk", "lo", "reverse")
+
+@pytest.mark.parametrize("args, expected", [
+    (["--lang", "lo"], lambda text: translit_dict(text, "lo")),
+    (["--transform", "Any-Upper"], lambda text: translit_icu(text, "Any-Upper")),
+    (["--rules", "{rules}", "--reverse"], lambda text: translit_rules(text, "a <> x ;", 1)),
+])
+def test_main(tmp_path, args, expected):
+    text = "ພາສາລາວ xyz\nabc\n"
+    (tmp_path / "in.txt").write_text(text, encoding="utf-8")
+    (tmp_path / "rules.txt").write_text("a <> x ;", encoding="utf-8")
+    args = [arg.format(rules=tmp_path / "rules.txt") for arg in args]
+    main([str(tmp_path / "in.txt"), "-o", str(tmp_path / "out.txt")] + args)
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8") == expected(text)
+
+@pytest.mark.parametrize("args, message", [
+    (["{missing}", "--lang", "lo"], "No such file"),
+    (["--rules", "{missing}"], "No such file"),
+    (["{input}", "--lang", "xx"], "unsupported language 'xx'"),
+    (["{input}", "--transform", "Xx-Yy"], "Unsupported transformation"),
+])
+def test_main_reports_errors(tmp_path, capsys, args, message):
+    (tmp_path / "in.txt").write_text("abc", encoding="utf-8")
+    args = [arg.format(missing=tmp_path / "missing.txt", input=tmp_path / "in.txt") for arg in args]
+    with pytest.raises(SystemExit) as exit:
+        main(args + ["-o", str(tmp_path / "out.txt")])
+    assert exit.value.code == 1
+    err = capsys.readouterr().err
+    assert err.startswith("el-translit: ") and message in err
@@ -0,0 +1,71 @@
+import pytest
+
+from el_utilities import tablefile
+
+TABLE = {
+    "translit_dict": {
+        "forward": {"ກ": "k", "ກາ": "kā", "ຂ": "kh"},
+        "reverse": {"k": "ກ", "kā": "ກາ", "kh": "ຂ"},
+    },
+    "translit_rules": "ກ <> k ;",
+}
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / f"test{tablefile.SUFFIX}"
+    path.write_bytes(tablefile.pack_table(TABLE))
+    return tablefile.load_table_file(path)
+
+def test_round_trip(table):
+    assert table["translit_rules"] == TABLE["translit_rules"]
+    for dir, dictionary in TABLE["translit_dict"].items():
+        assert dict(table["translit_dict"][dir].items()) == dictionary
+
+def test_mapped_dict_lookup(table):
+    forward = table["translit_dict"]["forward"]
+    assert forward["ກາ"] == "kā"
+    assert forward.get("ກາ") == "kā"
+    assert "ຂ" in forward
+    assert len(forward) == 3
+
+def test_mapped_dict_missing_keys(table):
+    forward = table["translit_dict"]["forward"]
+    assert forward.get("x") is None
+    assert forward.get("x", "default") == "default"
+    assert "x" not in forward
+    assert 1 not in forward
+    with pytest.raises(KeyError):
+        forward["x"]
+
+def test_mapped_dict_keys_are_sorted_by_utf8(table):
+    keys = list(table["translit_dict"]["reverse"])
+    assert keys == sorted(keys, key=lambda k: k.encode("utf-8"))
+
+def test_empty_table(tmp_path):
+    path = tmp_path / "empty.eltt"
+    path.write_bytes(tablefile.pack_table({"translit_dict": {"forward": {}}}))
+    table = tablefile.load_table_file(path)
+    assert len(table["translit_dict"]["forward"]) == 0
+    assert "translit_rules" not in table
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bad.eltt"
+    path.write_bytes(b"XXXX" + bytes(16))
+    with pytest.raises(ValueError):
+        tablefile.load_table_file(path)
+
+def test_table_file_path_uses_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("EL_UTILITIES_TABLES", str(tmp_path))
+    assert tablefile.table_file_path("abc") == tmp_path / f"abc{tablefile.SUFFIX}"
+
+# Entries of TABLE are in NFC
+@pytest.mark.parametrize("nf, mapped", [("NFC", True), ("NFD", False)])
+def test_translit_table_looks_up_words_in_table_file(monkeypatch, table, nf, mapped):
+    eli = pytest.importorskip("el_internationalisation")
+    from el_utilities import TRANSLIT_DATA
+    from el_utilities.transliteration import TranslitTable
+    monkeypatch.setitem(TRANSLIT_DATA, "test", table)
+    compiled = TranslitTable("test", "reverse", nf)
+    assert (compiled.word_dict is table["translit_dict"]["reverse"]) == mapped
+    assert compiled.translate(eli.normalise(nf, "kā k x")) == "ກາ ກ x"
+    assert compiled.translate(eli.normalise(nf, "kā x"), fallback=str.upper) == "ກາ X"
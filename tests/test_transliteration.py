@@ -0,0 +1,360 @@
+import unicodedata
+import pytest
+
+pytest.importorskip("el_internationalisation")
+
+from el_utilities.transliteration import LongestMatchReplacer, translit_dict, get_translit_table
+
+TABLE_ID = "und_latn_t_lo_m0_ALALOC_2012"
+
+def nfd(s):
+    return unicodedata.normalize("NFD", s)
+
+# LongestMatchReplacer
+
+def test_longest_match_prefers_longest_key():
+    replacer = LongestMatchReplacer({"a": "1", "ab": "2", "abc": "3"})
+    assert replacer.sub("abcab a") == "32 1"
+
+def test_longest_match_is_leftmost():
+    replacer = LongestMatchReplacer({"bc": "X", "ab": "Y"})
+    assert replacer.sub("abc") == "Yc"
+
+def test_longest_match_does_not_rescan_replacements():
+    replacer = LongestMatchReplacer({"a": "b", "b": "c"})
+    assert replacer.sub("ab") == "bc"
+
+def test_longest_match_does_not_depend_on_mapping_order():
+    mapping = {"a": "1", "aa": "2", "aaa": "3"}
+    reversed_mapping = dict(reversed(list(mapping.items())))
+    assert LongestMatchReplacer(mapping).sub("aaaaa") == LongestMatchReplacer(reversed_mapping).sub("aaaaa") == "32"
+
+def test_longest_match_backtracks_to_shorter_key():
+    replacer = LongestMatchReplacer({"ab": "1", "abcd": "2"})
+    assert replacer.sub("abcx") == "1cx"
+
+def test_longest_match_without_matches_returns_input():
+    text = "xyz"
+    assert LongestMatchReplacer({"a": "b", "": "c"}).sub(text) is text
+
+# Reverse dictionary transliteration of entries spanning several words
+
+def test_reverse_phrase_is_matched_as_a_whole():
+    table = get_translit_table(TABLE_ID, "reverse")
+    assert nfd("tāng tāng") in table.word_dict
+    assert translit_dict("tāng tāng", "lo", "reverse") == table.word_dict[nfd("tāng tāng")]
+
+def test_reverse_phrase_does_not_end_inside_a_word():
+    assert translit_dict("tāng tāngx", "lo", "reverse") == nfd("tāng tāngx")
+
+def test_reverse_phrase_in_context():
+    table = get_translit_table(TABLE_ID, "reverse")
+    phrase = table.word_dict[nfd("tāng tāng")]
+    assert translit_dict("xx tāng tāng, yy", "lo", "reverse") == f"xx {phrase}, yy"
+
+def test_reverse_phrase_index_is_longest_first():
+    table = get_translit_table(TABLE_ID, "reverse")
+    for candidates in table.phrases.values():
+        lengths = [len(key) for key, _ in candidates]
+        assert lengths == sorted(lengths, reverse=True)
+
+# Rule based transliterators warmed for other threads
+
+def test_warm_rules_cache_compiles_for_other_threads():
+    import concurrent.futures, threading
+    from el_utilities import transliteration
+    rules = "a > b ;"
+    transliteration.clear_rules_cache()
+    transliteration.warm_rules_cache([rules], threads=2)
+    key = transliteration._rules_key(rules, transliteration.icu.UTransDirection.FORWARD, "Custom")
+    assert transliteration._rules_transformers.spares(key) == 2
+    barrier = threading.Barrier(2)
+    def worker(_):
+        barrier.wait()
+        return transliteration.get_rules_transformer(rules)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        transformers = list(executor.map(worker, range(2)))
+    assert transformers[0] is not transformers[1]
+    assert transliteration._rules_transformers.spares(key) == 0
+    transliteration.clear_rules_cache()
+
+def test_rules_are_hashed_once():
+    from el_utilities import transliteration
+    rules = "x > y ; # hashed once"
+    transliteration.translit_rules("x", rules)
+    hits = transliteration._rules_digest.cache_info().hits
+    assert transliteration.translit_rules("x", rules) == "y"
+    assert transliteration._rules_digest.cache_info().hits == hits + 1
+
+# Functions from get_transliterator() called from several threads
+
+@pytest.mark.parametrize("engine, target", [("icu", "Any-Upper"), ("rules", "a > b ;")])
+def test_get_transliterator_uses_transliterators_of_calling_thread(engine, target):
+    import threading
+    from el_utilities import get_transliterator, transliteration
+    cache = transliteration._icu_transformers if engine == "icu" else transliteration._rules_transformers
+    translit = get_transliterator(engine, target)
+    expected = translit("a")
+    barrier = threading.Barrier(4)
+    results = []
+    def worker():
+        barrier.wait()
+        result = translit("a")
+        local = cache.local()
+        results.append((result, local.hits + local.misses))
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [result for result, _ in results] == [expected] * 4
+    assert all(lookups == 1 for _, lookups in results)
+
+# Rules of the Lao table
+
+def test_table_rules_compile_in_both_directions():
+    from el_utilities import TRANSLIT_DATA, get_rules_transformer
+    from el_utilities.transliteration import icu
+    rules = TRANSLIT_DATA[TABLE_ID]["translit_rules"]
+    for direction in (icu.UTransDirection.FORWARD, icu.UTransDirection.REVERSE):
+        get_rules_transformer(rules, direction)
+
+@pytest.mark.parametrize("lao, latin", [("ວ", "v"), ("ກວ", "kua"), ("ອ", "ʻ"), ("ກອ", "kǫ"), ("ວົ", "ūa")])
+def test_table_rules_forward(lao, latin):
+    from el_utilities import TRANSLIT_DATA, translit_rules
+    assert nfd(translit_rules(lao, TRANSLIT_DATA[TABLE_ID]["translit_rules"])) == nfd(latin)
+
+@pytest.mark.parametrize("latin, lao", [("v", "ວ"), ("ua", "ວ"), ("ʻ", "ອ"), ("ǫ", "ອ"), ("ūa", "ວົ"), ("ư̄a", "ວົ")])
+def test_table_rules_reverse(latin, lao):
+    from el_utilities import TRANSLIT_DATA, translit_rules
+    from el_utilities.transliteration import icu
+    assert translit_rules(nfd(latin), TRANSLIT_DATA[TABLE_ID]["translit_rules"], icu.UTransDirection.REVERSE) == lao
+
+# Hybrid dictionary and rules transliteration
+
+@pytest.mark.parametrize("dir", ["forward", "reverse"])
+def test_hybrid_uses_dictionary_for_known_words(dir):
+    from el_utilities import translit_hybrid
+    word, expected = next(iter(get_translit_table(TABLE_ID, dir).word_dict.items()))
+    assert translit_hybrid(word, "lo", dir) == expected
+    assert translit_hybrid(f"{word} {word}", "lo", dir) == f"{expected} {expected}"
+
+@pytest.mark.parametrize("dir, unknown", [("forward", "ກຂ"), ("reverse", "khk")])
+def test_hybrid_uses_rules_for_unknown_text(dir, unknown):
+    from el_utilities import translit_hybrid, translit_rules, TRANSLIT_DATA
+    from el_utilities.transliteration import icu
+    assert nfd(unknown) not in get_translit_table(TABLE_ID, dir).word_dict
+    direction = icu.UTransDirection.REVERSE if dir == "reverse" else icu.UTransDirection.FORWARD
+    expected = nfd(translit_rules(nfd(unknown), TRANSLIT_DATA[TABLE_ID]["translit_rules"], direction))
+    assert expected != nfd(unknown)
+    assert translit_hybrid(unknown, "lo", dir) == expected
+
+def test_hybrid_engine():
+    from el_utilities import get_transliterator, translit_hybrid
+    assert get_transliterator("hybrid", "lo", "reverse")("khk tāng tāng") == translit_hybrid("khk tāng tāng", "lo", "reverse")
+
+def test_hybrid_falls_back_to_dictionary_if_rules_do_not_compile(capsys):
+    from el_utilities import translit_hybrid, translit_dict, register_table, TRANSLIT_DATA
+    register_table(TABLE_ID, dict(TRANSLIT_DATA[TABLE_ID], translit_rules="a > b ; a > c ;"))
+    try:
+        for _ in range(2):
+            assert translit_hybrid("ກຂ", "lo") == translit_dict("ກຂ", "lo")
+    finally:
+        register_table(TABLE_ID, None)
+    assert capsys.readouterr().out.count("cannot be compiled") == 1
+    assert translit_hybrid("ກຂ", "lo") != translit_dict("ກຂ", "lo")
+
+def test_register_table():
+    from el_utilities import register_table, translit_dict, translit_hybrid, enable_result_cache, disable_result_cache, SUPPORTED_TRANSLITERATORS, TRANSLIT_DATA
+    table = {"translit_dict": {"forward": {"ab": "x"}, "reverse": {"x": "ab"}}, "translit_rules": "c > z ;"}
+    SUPPORTED_TRANSLITERATORS["zz"] = ("test_register", "latin_only", "")
+    enable_result_cache()
+    try:
+        register_table("test_register", table)
+        assert "test_register" in TRANSLIT_DATA and TRANSLIT_DATA.source_path("test_register") is None
+        assert translit_dict("abc", "zz") == "xc"
+        assert translit_hybrid("abc", "zz") == "xz"
+        register_table("test_register", {"translit_dict": {"forward": {"ab": "y"}, "reverse": {}}})
+        assert translit_dict("abc", "zz") == "yc"
+        assert translit_hybrid("abc", "zz") == "yc"
+        register_table("test_register", None)
+        assert "test_register" not in TRANSLIT_DATA
+        with pytest.raises(KeyError):
+            register_table("test_register", None)
+        with pytest.raises(KeyError):
+            del TRANSLIT_DATA[TABLE_ID]
+    finally:
+        disable_result_cache()
+        del SUPPORTED_TRANSLITERATORS["zz"]
+
+def test_clear_rules_cache_discards_hybrid_fallbacks():
+    from el_utilities import translit_hybrid, clear_rules_cache
+    from el_utilities import transliteration
+    translit_hybrid("ກຂ", "lo")
+    assert transliteration._hybrid_fallbacks
+    clear_rules_cache()
+    assert not transliteration._hybrid_fallbacks
+
+# Result cache
+
+@pytest.fixture
+def result_cache():
+    from el_utilities.transliteration import enable_result_cache, disable_result_cache
+    disable_result_cache()
+    yield enable_result_cache()
+    disable_result_cache()
+
+CACHED_CALLS = {
+    "translit_dict": lambda t: t.translit_dict("ພາສາລາວ", "lo"),
+    "translit_dict_reverse": lambda t: t.translit_dict("tāng tāng", "lo", "reverse"),
+    "translit_hybrid": lambda t: t.translit_hybrid("ກຂ ພາສາ", "lo"),
+    "translit_icu": lambda t: t.translit_icu("Ελλάδα", "Greek-Latin"),
+    "translit_icu_list": lambda t: t.translit_icu(["Ελλάδα", "αβγ"], "Greek-Latin"),
+    "translit_rules": lambda t: t.translit_rules("abc", "a > x ; c > z ;"),
+    "translit_rules_list": lambda t: t.translit_rules(["abc", "cab"], "a > x ; c > z ;"),
+    "get_transliterator_dict": lambda t: t.get_transliterator("dict", "lo")("ພາສາລາວ"),
+    "get_transliterator_hybrid": lambda t: t.get_transliterator("hybrid", "lo", "reverse")("khk tāng tāng"),
+    "get_transliterator_icu": lambda t: t.get_transliterator("icu", "Greek-Latin")("Ελλάδα"),
+    "get_transliterator_rules": lambda t: t.get_transliterator("rules", "a > x ; c > z ;")("abc"),
+}
+
+@pytest.mark.parametrize("call", CACHED_CALLS.values(), ids=CACHED_CALLS.keys())
+def test_results_are_cached(result_cache, call):
+    from el_utilities import transliteration
+    transliteration.disable_result_cache()
+    expected = call(transliteration)
+    cache = transliteration.enable_result_cache()
+    assert call(transliteration) == expected
+    misses = cache.misses
+    assert misses > 0 and cache.hits == 0
+    assert call(transliteration) == expected
+    assert cache.misses == misses and cache.hits == misses
+
+def test_get_transliterator_uses_cache_enabled_when_created(result_cache):
+    from el_utilities import transliteration
+    translit = transliteration.get_transliterator("dict", "lo")
+    transliteration.disable_result_cache()
+    uncached = transliteration.get_transliterator("dict", "lo")
+    assert translit("ພາສາ") == uncached("ພາສາ")
+    assert translit("ພາສາ") == uncached("ພາສາ")
+    assert (result_cache.hits, result_cache.misses) == (1, 1)
+
+def test_long_inputs_are_not_cached(result_cache):
+    from el_utilities import translit_dict
+    source = "ພາສາລາວ " * 100
+    assert translit_dict(source, "lo") == translit_dict(source, "lo")
+    assert len(result_cache) == 0
+
+@pytest.fixture
+def shared_result_cache(tmp_path):
+    pytest.importorskip("fcntl")
+    from el_utilities.transliteration import enable_result_cache, disable_result_cache
+    cache = enable_result_cache(shared_cache=tmp_path / "results")
+    yield cache
+    disable_result_cache()
+    cache.shared.close()
+
+def test_registering_rules_invalidates_shared_results(shared_result_cache):
+    from el_utilities.transliteration import register_rules, translit_icu
+    register_rules("ElTest-Register", "a > b ;")
+    assert translit_icu("a", "ElTest-Register") == "b"
+    generation = shared_result_cache.shared.generation
+    register_rules("ElTest-Register", "a > c ;")
+    assert shared_result_cache.shared.generation == generation + 1
+    assert translit_icu("a", "ElTest-Register") == "c"
+
+def test_registering_same_rules_keeps_results(shared_result_cache):
+    from el_utilities.transliteration import register_rules, translit_icu
+    register_rules("ElTest-Same", "a > b ;")
+    assert translit_icu("a", "ElTest-Same") == "b"
+    generation = shared_result_cache.shared.generation
+    register_rules("ElTest-Same", "a > b ;")
+    assert shared_result_cache.shared.generation == generation
+    assert len(shared_result_cache) > 0
+    register_rules("ElTest-New", "a > d ;")
+    assert shared_result_cache.shared.generation == generation
+
+def test_shared_results_of_other_rules_are_not_used(shared_result_cache, tmp_path):
+    from el_utilities.transliteration import register_rules, translit_icu, _icu_key
+    from el_utilities.sharedcache import SharedResultCache
+    register_rules("ElTest-Other", "a > c ;")
+    # Result stored by a process that registered other rules under that ID
+    other = SharedResultCache(tmp_path / "results")
+    other.put(("icu", "ElTest-Other", "other rules hash", "", "a"), "b")
+    assert _icu_key("ElTest-Other")[2] != "other rules hash"
+    assert translit_icu("a", "ElTest-Other") == "c"
+
+def test_result_cache_keys_include_table_version(shared_result_cache):
+    from el_utilities import __version__
+    from el_utilities.transliteration import _table_key
+    key = _table_key("dict", "lo", "forward", "NFD")
+    assert key[:4] == ("dict", "lo", "forward", "NFD")
+    assert key[4].startswith(__version__ + ":")
+    assert _table_key("dict", "xx", "forward", "NFD")[4] == __version__
+
+# Batches
+
+BATCH = ["ພາສາລາວ", "ກາ ຂ", "xyz", "  ສະບາຍດີ! ", "ພາສາລາວ"]
+
+@pytest.mark.parametrize("dir, sources", [("forward", BATCH), ("reverse", ["tāng tāng", "khk", "phāsā lāo"])])
+def test_batch_is_in_input_order(dir, sources):
+    from el_utilities import translit_dict_batch
+    assert translit_dict_batch(sources, "lo", dir) == [translit_dict(s, "lo", dir) for s in sources]
+    assert translit_dict_batch(reversed(sources), "lo", dir) == [translit_dict(s, "lo", dir) for s in reversed(sources)]
+
+def test_batch_passes_non_strings_through():
+    from el_utilities import translit_dict_batch
+    missing = float("nan")
+    results = translit_dict_batch(["ກາ", None, missing, 3, "ຂ"], "lo")
+    assert results[0] == translit_dict("ກາ", "lo") and results[4] == translit_dict("ຂ", "lo")
+    assert results[1] is None and results[2] is missing and results[3] == 3
+
+@pytest.mark.parametrize("dir", ["forward", "reverse"])
+def test_batch_prep_matches_el_transliterate(dir):
+    from el_utilities import translit_dict_batch, el_transliterate
+    sources = BATCH + ["Phāsā Lāo", " tāng tāng "]
+    assert translit_dict_batch(sources, "lo", dir, prep=True) == [el_transliterate(s, "lo", dir) for s in sources]
+
+def test_batch_of_numpy_array():
+    np = pytest.importorskip("numpy")
+    from el_utilities import translit_dict_batch
+    expected = [translit_dict(s, "lo") for s in BATCH]
+    assert translit_dict_batch(np.array(BATCH), "lo") == expected
+    assert translit_dict_batch(np.array(BATCH + [None], dtype=object), "lo") == expected + [None]
+
+def test_batch_of_pandas_series_keeps_index_and_name():
+    pd = pytest.importorskip("pandas")
+    from el_utilities import translit_dict_batch
+    series = pd.Series(BATCH + [None], index=[10, 8, 6, 4, 2, 0], name="title")
+    results = translit_dict_batch(series, "lo")
+    assert isinstance(results, pd.Series)
+    assert results.name == "title"
+    assert list(results.index) == [10, 8, 6, 4, 2, 0]
+    assert list(results)[:-1] == [translit_dict(s, "lo") for s in BATCH]
+    assert pd.isna(results[0])
+
+# Language tags
+
+@pytest.mark.parametrize("lang, expected", [
+    ("lo", ("lo", "", "", "")),
+    ("lo-Laoo-LA", ("lo", "Laoo", "LA", "")),
+    ("lo_LA", ("lo", "", "LA", "")),
+    ("sr-Cyrl", ("sr", "Cyrl", "", "")),
+    ("ca-ES-valencia", ("ca", "", "ES", "valencia")),
+    ("en-Latn-US-x-private", ("en", "Latn", "US", "x-private")),
+])
+def test_get_lang_subtag(lang, expected):
+    from el_utilities import get_lang_subtag, LanguageTag
+    tag = get_lang_subtag(lang)
+    assert isinstance(tag, LanguageTag)
+    assert tag == expected
+    assert (tag.language, tag.script, tag.region, tag.variants) == expected
+
+def test_get_lang_subtag_is_memoised():
+    from el_utilities import get_lang_subtag, get_lang_subtags
+    get_lang_subtag.cache_clear()
+    tag = get_lang_subtag("lo-Laoo-LA")
+    assert get_lang_subtag("lo-Laoo-LA") is tag
+    assert get_lang_subtags(["lo-Laoo-LA", "th", "lo-Laoo-LA"]) == [tag, ("th", "", "", ""), tag]
+    info = get_lang_subtag.cache_info()
+    assert (info.hits, info.misses) == (3, 2)